@@ -5,9 +5,10 @@ from typing import Iterator
 
 from fastapi import Header, HTTPException, status
 
-from docwriter.config import get_settings, Settings
-from docwriter.storage import BlobStore
-from .auth import require_user_id, handle_auth_error
+from docwriter.config import Settings, get_settings
+from docwriter.storage import BlobStore, get_blob_store
+
+from .auth import handle_auth_error, require_user_id
 
 
 @lru_cache()
@@ -16,7 +17,7 @@ def get_cached_settings() -> Settings:
 
 
 def blob_store_dependency() -> Iterator[BlobStore]:
-    store = BlobStore()
+    store = get_blob_store()
     try:
         yield store
     finally:
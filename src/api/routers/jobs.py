@@ -6,27 +6,29 @@ import re
 import time
 import zipfile
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
+from docwriter import json_utils
+from docwriter.document_index import get_document_index_store
 from docwriter.queue import Job, send_job, send_resume
-from docwriter.storage import BlobStore, JobStoragePaths
 from docwriter.status_store import get_status_table_store
-from docwriter.document_index import get_document_index_store
+from docwriter.storage import BlobStore, JobStoragePaths, decompress_bytes
 
 from ..deps import blob_store_dependency, current_user_dependency
 from ..models import (
+    BlobDownloadResponse,
+    DocumentListEntry,
+    DocumentListResponse,
     JobCreateRequest,
     JobCreateResponse,
     ResumeRequest,
     ResumeResponse,
+    StatusEventEntry,
     StatusResponse,
-    BlobDownloadResponse,
     StatusTimelineResponse,
-    StatusEventEntry,
-    DocumentListEntry,
-    DocumentListResponse,
 )
+
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 SUMMARY_STAGE_ORDER = [
@@ -41,6 +43,8 @@ SUMMARY_STAGE_ORDER = [
     "DIAGRAM",
     "FINALIZE",
 ]
+# Status-table properties the timeline endpoint reads; everything else stays on the server.
+TIMELINE_COLUMNS = ("stage", "message", "artifact", "updated", "cycle", "details")
 
 
 def _parse_stage_message(message: str) -> dict[str, object]:
@@ -126,7 +130,7 @@ def resume_job(
     job_paths = JobStoragePaths(user_id=user_id, job_id=job_id)
     blob_path = job_paths.intake("answers.json")
     if payload.answers is not None:
-        store.put_text(blob=blob_path, text=json.dumps(payload.answers, indent=2))
+        store.put_text(blob=blob_path, text=json_utils.dumps(payload.answers, indent=True))
     else:
         try:
             store.get_text(blob_path)
@@ -186,7 +190,7 @@ def job_timeline(job_id: str, user_id: str = Depends(current_user_dependency)) -
     existing = index_store.get(user_id, job_id)
     if existing is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found for user")
-    events_raw = status_store.timeline(job_id)
+    events_raw = status_store.timeline(job_id, columns=TIMELINE_COLUMNS)
     events: list[StatusEventEntry] = []
     expected_cycles = 1
     for item in events_raw:
@@ -278,7 +282,9 @@ def download_artifact(
     try:
         blob = store.container.get_blob_client(blob_path)
         props = blob.get_blob_properties()
-        data = blob.download_blob().readall()
+        data = decompress_bytes(
+            blob.download_blob(decompress=False).readall(), props.content_settings.content_encoding
+        )
     except ResourceNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not found") from exc
     except HttpResponseError as exc:
@@ -5,8 +5,9 @@ from ..llm import LLMClient, LLMMessage
 
 
 class CohesionReviewerAgent:
-    def __init__(self, llm: LLMClient | None = None):
+    def __init__(self, llm: LLMClient | None = None, model: str | None = None):
         self.settings = get_settings()
+        self.model = model or self.settings.reviewer_cohesion_model
         self.llm = llm or LLMClient(
             api_key=self.settings.openai_api_key,
             base_url=self.settings.openai_base_url,
@@ -20,7 +21,7 @@ class CohesionReviewerAgent:
             " Provide JSON with keys: issues (list), suggestions (list)."
         )
         content = self.llm.chat(
-            model=self.settings.reviewer_model,
+            model=self.model,
             messages=[
                 LLMMessage("system", sys),
                 LLMMessage("user", f"Outline: {plan.get('outline', [])}"),
@@ -29,22 +30,26 @@ class CohesionReviewerAgent:
         )
         return content if isinstance(content, str) else "{}"
 
-    def review_cohesion_batch(self, plan: dict, markdown: str, sections: list[dict]) -> str:
+    def review_cohesion_batch_messages(self, plan: dict, markdown: str, sections: list[dict]) -> list[LLMMessage]:
         sys = (
             "You are a cohesion editor. Assess flow, transitions, cross-references, and alignment for each section independently."
             " Return per-section findings."
         )
         guide = (
             "Return JSON with key 'sections' (array). Each item: {section_id, issues: [], suggestions: []}."
+            " Add escalate: true to an item when the section needs a deeper review than a cohesion pass can give."
         )
+        return [
+            LLMMessage("system", sys),
+            LLMMessage("user", f"Outline: {plan.get('outline', [])}"),
+            LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
+            LLMMessage("user", markdown),
+            LLMMessage("user", guide),
+        ]
+
+    def review_cohesion_batch(self, plan: dict, markdown: str, sections: list[dict], model: str | None = None) -> str:
         content = self.llm.chat(
-            model=self.settings.reviewer_model,
-            messages=[
-                LLMMessage("system", sys),
-                LLMMessage("user", f"Outline: {plan.get('outline', [])}"),
-                LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
-                LLMMessage("user", markdown),
-                LLMMessage("user", guide),
-            ],
+            model=model or self.model,
+            messages=self.review_cohesion_batch_messages(plan, markdown, sections),
         )
         return content if isinstance(content, str) else "{}"
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from .. import json_utils
 from ..config import get_settings
 from ..llm import LLMClient, LLMMessage
 
+# JSON mode keeps the model from wrapping the payload in prose or fences that callers must repair.
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
 
 class ReviewerAgent:
     def __init__(self, llm: LLMClient | None = None):
@@ -36,32 +40,41 @@ class ReviewerAgent:
                 LLMMessage("user", f"Draft Markdown begins:\n{draft_markdown}"),
                 LLMMessage("user", guide),
             ],
+            response_format=_JSON_RESPONSE_FORMAT,
         )
         if isinstance(content, str):
             return content
+        if isinstance(content, dict):
+            return json_utils.dumps(content)
         return "{}"
 
-    def review_batch(self, plan: Dict[str, Any], markdown: str, sections: list[Dict[str, Any]]) -> str:
+    def review_batch_messages(
+        self, plan: Dict[str, Any], markdown: str, sections: list[Dict[str, Any]]
+    ) -> list[LLMMessage]:
         sys = (
             "You are a critical reviewer. Check for contradictions, inconsistencies, missing definitions,"
             " and propose revisions for each section independently."
         )
         guide = (
             "Return JSON with keys: sections (array of objects) and overall_notes (optional)."
-            " Each sections item: {section_id, findings: [], suggested_changes: [], revised_markdown: string}."
-            " revised_markdown should include only the sections you adjusted, preserving any markers"
-            " like '<!-- SECTION:ID:START -->' and '<!-- SECTION:ID:END -->'."
+            " Each sections item: {section_id, findings: [], suggested_changes: [], patch_ops: [{anchor, replace}]}."
+            " Return only the edits, never whole sections: each anchor is a short passage copied exactly from"
+            " that section and replace is its new text. Omit patch_ops when the section needs no change."
+            " Never include or alter markers like '<!-- SECTION:ID:START -->' and '<!-- SECTION:ID:END -->'."
         )
         sections_summary = ", ".join([str(s.get("section_id")) for s in sections]) if sections else ""
         plan_summary = str({k: plan.get(k) for k in ["title", "audience", "glossary", "global_style"]})
+        return [
+            LLMMessage("system", sys),
+            LLMMessage("user", f"Plan: {plan_summary}"),
+            LLMMessage("user", f"Target sections: {sections_summary}"),
+            LLMMessage("user", f"Draft Markdown begins:\\n{markdown}"),
+            LLMMessage("user", guide),
+        ]
+
+    def review_batch(self, plan: Dict[str, Any], markdown: str, sections: list[Dict[str, Any]]) -> str:
         content = self.llm.chat(
             model=self.settings.reviewer_model,
-            messages=[
-                LLMMessage("system", sys),
-                LLMMessage("user", f"Plan: {plan_summary}"),
-                LLMMessage("user", f"Target sections: {sections_summary}"),
-                LLMMessage("user", f"Draft Markdown begins:\\n{markdown}"),
-                LLMMessage("user", guide),
-            ],
+            messages=self.review_batch_messages(plan, markdown, sections),
         )
         return content if isinstance(content, str) else "{}"
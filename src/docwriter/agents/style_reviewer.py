@@ -5,8 +5,9 @@ from ..llm import LLMClient, LLMMessage
 
 
 class StyleReviewerAgent:
-    def __init__(self, llm: LLMClient | None = None):
+    def __init__(self, llm: LLMClient | None = None, model: str | None = None):
         self.settings = get_settings()
+        self.model = model or self.settings.reviewer_style_model
         self.llm = llm or LLMClient(
             api_key=self.settings.openai_api_key,
             base_url=self.settings.openai_base_url,
@@ -20,7 +21,7 @@ class StyleReviewerAgent:
             " Provide JSON with keys: issues (list), suggestions (list), revised_snippets (optional)."
         )
         content = self.llm.chat(
-            model=self.settings.reviewer_model,
+            model=self.model,
             messages=[
                 LLMMessage("system", sys),
                 LLMMessage("user", f"Plan style: {plan.get('global_style', {})}"),
@@ -29,7 +30,7 @@ class StyleReviewerAgent:
         )
         return content if isinstance(content, str) else "{}"
 
-    def review_style_batch(self, plan: dict, markdown: str, sections: list[dict]) -> str:
+    def review_style_batch_messages(self, plan: dict, markdown: str, sections: list[dict]) -> list[LLMMessage]:
         sys = (
             "You are a style editor. Assess clarity, tone, readability, and consistency for each section independently."
             " Return per-section feedback."
@@ -37,15 +38,19 @@ class StyleReviewerAgent:
         guide = (
             "Return JSON with key 'sections' (array). Each item: {section_id, issues: [], suggestions: [], revised_snippets (optional)}."
             " revised_snippets may include markdown fragments; if you include section markers, preserve them exactly."
+            " Add escalate: true to an item when the section needs a deeper review than a style pass can give."
         )
+        return [
+            LLMMessage("system", sys),
+            LLMMessage("user", f"Plan style: {plan.get('global_style', {})}"),
+            LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
+            LLMMessage("user", markdown),
+            LLMMessage("user", guide),
+        ]
+
+    def review_style_batch(self, plan: dict, markdown: str, sections: list[dict], model: str | None = None) -> str:
         content = self.llm.chat(
-            model=self.settings.reviewer_model,
-            messages=[
-                LLMMessage("system", sys),
-                LLMMessage("user", f"Plan style: {plan.get('global_style', {})}"),
-                LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
-                LLMMessage("user", markdown),
-                LLMMessage("user", guide),
-            ],
+            model=model or self.model,
+            messages=self.review_style_batch_messages(plan, markdown, sections),
         )
         return content if isinstance(content, str) else "{}"
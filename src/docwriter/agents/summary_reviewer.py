@@ -29,21 +29,26 @@ class SummaryReviewerAgent:
         )
         return content if isinstance(content, str) else "{}"
 
-    def review_executive_summary_batch(self, plan: dict, markdown: str, sections: list[dict]) -> str:
+    def review_executive_summary_batch_messages(
+        self, plan: dict, markdown: str, sections: list[dict]
+    ) -> list[LLMMessage]:
         sys = (
             "You are an executive editor. Produce or assess an executive summary for each section and capture per-section issues."
         )
         guide = (
             "Return JSON with key 'sections' (array). Each item: {section_id, summary: string, issues: [], suggestions: []}."
         )
+        return [
+            LLMMessage("system", sys),
+            LLMMessage("user", f"Title: {plan.get('title')} Audience: {plan.get('audience')}"),
+            LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
+            LLMMessage("user", markdown),
+            LLMMessage("user", guide),
+        ]
+
+    def review_executive_summary_batch(self, plan: dict, markdown: str, sections: list[dict]) -> str:
         content = self.llm.chat(
             model=self.settings.reviewer_model,
-            messages=[
-                LLMMessage("system", sys),
-                LLMMessage("user", f"Title: {plan.get('title')} Audience: {plan.get('audience')}"),
-                LLMMessage("user", f"Target sections: {', '.join([str(s.get('section_id')) for s in sections])}"),
-                LLMMessage("user", markdown),
-                LLMMessage("user", guide),
-            ],
+            messages=self.review_executive_summary_batch_messages(plan, markdown, sections),
         )
         return content if isinstance(content, str) else "{}"
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from typing import Dict
 
+from .. import json_utils
 from ..config import get_settings
 from ..llm import LLMClient, LLMMessage
 
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
 
 class VerifierAgent:
     """Quick verifier focusing on contradictions between dependency summaries and final text.
@@ -41,7 +43,7 @@ class VerifierAgent:
             "  ]\n"
             "}"
         )
-        dep_json = json.dumps(dependency_summaries)
+        dep_json = json_utils.dumps(dependency_summaries)
         content = self.llm.chat(
             model=self.settings.reviewer_model,
             messages=[
@@ -50,5 +52,9 @@ class VerifierAgent:
                 LLMMessage("user", f"Final document Markdown begins:\n{final_markdown}"),
                 LLMMessage("user", guide),
             ],
+            response_format=_JSON_RESPONSE_FORMAT,
         )
+        if isinstance(content, dict):
+            # JSON mode hands back the parsed object; callers expect the JSON text.
+            return json_utils.dumps(content)
         return content if isinstance(content, str) else "{\"contradictions\": []}"
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Any, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from ..config import get_settings
 from ..llm import LLMClient, LLMMessage
 from ..plantuml_reference import PLANTUML_REFERENCE_TEXT
 
+# The system prompt and rules never change between calls, so they lead the request where the
+# provider's prompt cache can reuse them; only the section-specific context follows.
+_WRITER_SYSTEM_PROMPT = (
+    "You are a disciplined technical writer. Write Markdown that strictly adheres to the provided"
+    " plan, maintains global consistency, and embeds PlantUML diagrams where requested."
+    " Avoid filler, fluff, hedging, and throat-clearing."
+    " Be concise but not telegraphic. Use short-to-medium sentences; lead with the point."
+    " Use bullets and tables when they improve clarity; allow brief narrative paragraphs."
+)
+_WRITER_RULES = (
+    "Rules:\n- Use consistent terminology from the glossary.\n"
+    "- Be concise but thorough; prefer clear subsections and lists.\n"
+    "- Start the section with a 1-2 sentence summary.\n"
+    "- Paragraphs: max 6 sentences. Prefer <= 26 words per sentence.\n"
+    "- Use bullets for lists; no nested bullets.\n"
+    "- Avoid overusing phrases: \"in order to\", \"it is important to note\", \"clearly\", \"very\", \"robust\", \"leveraging\".\n"
+    "- For each diagram spec, produce exactly one ```plantuml``` code block.\n"
+    "- The first non-blank line inside every PlantUML block must be a single-quote comment"
+    " containing \"diagram_id: <diagram_id>\" for the matching spec.\n"
+    "- Inside every PlantUML block include exactly one @startuml and one @enduml; do not wrap the block in Markdown fences other than ```plantuml.\n"
+    "- Keep all labels and element names on a single line; use explicit \\n escapes instead of real line breaks.\n"
+    "- Do not emit Mermaid, HTML, or Markdown inside PlantUML; stay within valid PlantUML grammar only.\n"
+    "- Use the plantuml_prompt or description to choose actors, lifelines, relationships, and to pick a valid PlantUML diagram type from the reference.\n"
+    "- Only emit PlantUML syntax that matches the supported patterns below (ignore unsupported formats).\n"
+    "Good example:\n```plantuml\n' diagram_id: diag-1\n@startuml\nactor User\nUser -> API : Request\nAPI --> User : Response\n@enduml\n```\n"
+    "Bad example (do not do this):\n```plantuml\n@startuml\n```mermaid\nflowchart LR\n@enduml\n```\n"
+    f"Supported PlantUML reference:\n{PLANTUML_REFERENCE_TEXT}\n"
+)
+
 
 @dataclass
 class SectionDraft:
@@ -15,9 +44,25 @@ class SectionDraft:
     markdown: str
 
 
+def _coalesce(chunks: Iterable[str], flush_chars: int) -> Iterator[str]:
+    """Merge small stream deltas so consumers see a few large chunks instead of many tiny ones."""
+    pending: List[str] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= flush_chars:
+            yield "".join(pending)
+            pending.clear()
+            size = 0
+    if pending:
+        yield "".join(pending)
+
+
 class WriterAgent:
-    def __init__(self, llm: LLMClient | None = None):
+    def __init__(self, llm: LLMClient | None = None, flush_chars: int = 1024):
         self.settings = get_settings()
+        self.flush_chars = flush_chars
         self.llm = llm or LLMClient(
             api_key=self.settings.openai_api_key,
             base_url=self.settings.openai_base_url,
@@ -32,13 +77,6 @@ class WriterAgent:
         dependency_context: Optional[str] = None,
         extra_guidance: Optional[str] = None,
     ) -> Iterator[str]:
-        sys = (
-            "You are a disciplined technical writer. Write Markdown that strictly adheres to the provided"
-            " plan, maintains global consistency, and embeds PlantUML diagrams where requested."
-            " Avoid filler, fluff, hedging, and throat-clearing."
-            " Be concise but not telegraphic. Use short-to-medium sentences; lead with the point."
-            " Use bullets and tables when they improve clarity; allow brief narrative paragraphs."
-        )
         style = plan.get("global_style", {})
         glossary = plan.get("glossary", {})
         diagram_specs = plan.get("diagram_specs", [])
@@ -51,43 +89,31 @@ class WriterAgent:
             f"Section: {section}\n"
             f"Diagrams: {section_diagrams}\n"
             f"Dependency context (key facts to respect): {dependency_context or 'N/A'}\n"
-            "Rules:\n- Use consistent terminology from the glossary.\n"
-            "- Be concise but thorough; prefer clear subsections and lists.\n"
-            "- Start the section with a 1-2 sentence summary.\n"
-            "- Paragraphs: max 6 sentences. Prefer <= 26 words per sentence.\n"
-            "- Use bullets for lists; no nested bullets.\n"
-            "- Avoid overusing phrases: \"in order to\", \"it is important to note\", \"clearly\", \"very\", \"robust\", \"leveraging\".\n"
-            "- For each diagram spec, produce exactly one ```plantuml``` code block.\n"
-            "- The first non-blank line inside every PlantUML block must be a single-quote comment"
-            " containing \"diagram_id: <diagram_id>\" for the matching spec.\n"
-            "- Inside every PlantUML block include exactly one @startuml and one @enduml; do not wrap the block in Markdown fences other than ```plantuml.\n"
-            "- Keep all labels and element names on a single line; use explicit \\n escapes instead of real line breaks.\n"
-            "- Do not emit Mermaid, HTML, or Markdown inside PlantUML; stay within valid PlantUML grammar only.\n"
-            "- Use the plantuml_prompt or description to choose actors, lifelines, relationships, and to pick a valid PlantUML diagram type from the reference.\n"
-            "- Only emit PlantUML syntax that matches the supported patterns below (ignore unsupported formats).\n"
-            "Good example:\n```plantuml\n' diagram_id: diag-1\n@startuml\nactor User\nUser -> API : Request\nAPI --> User : Response\n@enduml\n```\n"
-            "Bad example (do not do this):\n```plantuml\n@startuml\n```mermaid\nflowchart LR\n@enduml\n```\n"
-            f"Supported PlantUML reference:\n{PLANTUML_REFERENCE_TEXT}\n"
         )
         if extra_guidance:
             guide += (
                 "- Apply the following revision guidance (adjust prose accordingly; do not copy these notes verbatim):\n"
                 f"{extra_guidance}\n"
             )
+        messages = [
+            LLMMessage("system", _WRITER_SYSTEM_PROMPT),
+            LLMMessage("user", _WRITER_RULES),
+            LLMMessage("user", guide),
+        ]
 
         if self.settings.streaming:
             sid = str(section.get("id"))
             yield f"<!-- SECTION:{sid}:START -->\n"
-            for c in self.llm.chat_stream(
+            stream = self.llm.chat_stream(
                 model=self.settings.writer_model,
-                messages=[LLMMessage("system", sys), LLMMessage("user", guide)],
-            ):
-                yield c
+                messages=messages,
+            )
+            yield from _coalesce(stream, self.flush_chars)
             yield f"\n<!-- SECTION:{sid}:END -->\n"
         else:
             text = self.llm.chat(
                 model=self.settings.writer_model,
-                messages=[LLMMessage("system", sys), LLMMessage("user", guide)],
+                messages=messages,
             )
             sid = str(section.get("id"))
             yield f"<!-- SECTION:{sid}:START -->\n" + text + f"\n<!-- SECTION:{sid}:END -->\n"
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Mapping
-import os
 
 
 def _coerce_bool(value: Any, default: bool) -> bool:
@@ -45,6 +45,8 @@ class Settings:
     reviewer_model: str = "gpt-5.2"
     reviewer_api_version: str | None = "2025-04-01-preview"
     reviewer_use_responses: bool = True
+    reviewer_style_model: str = "gpt-4o-mini"
+    reviewer_cohesion_model: str = "gpt-4o-mini"
     writer_model: str = "gpt-5.2"
     writer_api_version: str | None = "2025-04-01-preview"
     writer_use_responses: bool = True
@@ -78,11 +80,18 @@ class Settings:
     sb_status_subscription: str = "console"
     sb_lock_renew_s: float = 900.0
     write_batch_size: int = 5
+    write_concurrency: int = 4
     review_batch_size: int = 3
     review_style_batch_size: int = 5
     review_cohesion_batch_size: int = 5
     review_summary_batch_size: int = 5
     review_max_prompt_tokens: int = 15000
+    review_max_concurrency: int = 3
+    review_compress_markdown: bool = True
+    review_cache_enabled: bool = True
+    review_use_batch_api: bool = False
+    review_batch_api_min_sections: int = 20
+    review_batch_api_poll_s: float = 60.0
     review_style_enabled: bool = True
     review_cohesion_enabled: bool = True
     review_summary_enabled: bool = True
@@ -112,6 +121,8 @@ class Settings:
             reviewer_model=env.get("DOCWRITER_REVIEWER_MODEL", cls.reviewer_model),
             reviewer_api_version=env.get("DOCWRITER_REVIEWER_API_VERSION", cls.reviewer_api_version),
             reviewer_use_responses=_coerce_bool(env.get("DOCWRITER_REVIEWER_USE_RESPONSES"), cls.reviewer_use_responses),
+            reviewer_style_model=env.get("DOCWRITER_REVIEWER_STYLE_MODEL", cls.reviewer_style_model),
+            reviewer_cohesion_model=env.get("DOCWRITER_REVIEWER_COHESION_MODEL", cls.reviewer_cohesion_model),
             writer_model=env.get("DOCWRITER_WRITER_MODEL", cls.writer_model),
             writer_api_version=env.get("DOCWRITER_WRITER_API_VERSION", cls.writer_api_version),
             writer_use_responses=_coerce_bool(env.get("DOCWRITER_WRITER_USE_RESPONSES"), cls.writer_use_responses),
@@ -141,11 +152,20 @@ class Settings:
             sb_status_subscription=env.get("SERVICE_BUS_STATUS_SUBSCRIPTION", cls.sb_status_subscription),
             sb_lock_renew_s=_coerce_float(env.get("SERVICE_BUS_LOCK_RENEW_S"), cls.sb_lock_renew_s),
             write_batch_size=_coerce_int(env.get("DOCWRITER_WRITE_BATCH_SIZE"), cls.write_batch_size),
+            write_concurrency=_coerce_int(env.get("DOCWRITER_WRITE_CONCURRENCY"), cls.write_concurrency),
             review_batch_size=_coerce_int(env.get("DOCWRITER_REVIEW_BATCH_SIZE"), cls.review_batch_size),
             review_style_batch_size=_coerce_int(env.get("DOCWRITER_REVIEW_STYLE_BATCH_SIZE"), cls.review_style_batch_size),
             review_cohesion_batch_size=_coerce_int(env.get("DOCWRITER_REVIEW_COHESION_BATCH_SIZE"), cls.review_cohesion_batch_size),
             review_summary_batch_size=_coerce_int(env.get("DOCWRITER_REVIEW_SUMMARY_BATCH_SIZE"), cls.review_summary_batch_size),
             review_max_prompt_tokens=_coerce_int(env.get("DOCWRITER_REVIEW_MAX_PROMPT_TOKENS"), cls.review_max_prompt_tokens),
+            review_max_concurrency=_coerce_int(env.get("DOCWRITER_REVIEW_MAX_CONCURRENCY"), cls.review_max_concurrency),
+            review_compress_markdown=_coerce_bool(env.get("DOCWRITER_REVIEW_COMPRESS_MARKDOWN"), cls.review_compress_markdown),
+            review_cache_enabled=_coerce_bool(env.get("DOCWRITER_REVIEW_CACHE_ENABLED"), cls.review_cache_enabled),
+            review_use_batch_api=_coerce_bool(env.get("DOCWRITER_REVIEW_USE_BATCH_API"), cls.review_use_batch_api),
+            review_batch_api_min_sections=_coerce_int(
+                env.get("DOCWRITER_REVIEW_BATCH_API_MIN_SECTIONS"), cls.review_batch_api_min_sections
+            ),
+            review_batch_api_poll_s=_coerce_float(env.get("DOCWRITER_REVIEW_BATCH_API_POLL_S"), cls.review_batch_api_poll_s),
             review_style_enabled=_coerce_bool(env.get("DOCWRITER_REVIEW_STYLE_ENABLED"), cls.review_style_enabled),
             review_cohesion_enabled=_coerce_bool(env.get("DOCWRITER_REVIEW_COHESION_ENABLED"), cls.review_cohesion_enabled),
             review_summary_enabled=_coerce_bool(env.get("DOCWRITER_REVIEW_SUMMARY_ENABLED"), cls.review_summary_enabled),
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Any, Mapping, MutableMapping, Optional
 
+from . import json_utils
+from .stages.cycles import CycleState, coerce_optional_int
 from .telemetry import track_exception
-from .stages.cycles import CycleState
 
 try:
     from .status_store import get_status_table_store
@@ -15,28 +16,26 @@ except Exception:  # pragma: no cover
 _CYCLE_FIELDS = ("cycles", "expected_cycles", "cycles_completed", "cycles_remaining")
 
 
-def _coerce_optional_int(value: Any) -> Optional[int]:
-    if value is None:
-        return None
+def _merge_cycles(target: MutableMapping[str, Any], source: Mapping[str, Any]) -> bool:
+    # Only fill fields the target is missing; existing values always win.
+    updates = {
+        field: value
+        for field in _CYCLE_FIELDS
+        if target.get(field) in (None, "", []) and (value := coerce_optional_int(source.get(field))) is not None
+    }
+    if updates:
+        target.update(updates)
+    return bool(updates)
+
+
+@lru_cache(maxsize=1024)
+def _parse_details(raw: str) -> Optional[Mapping[str, Any]]:
+    # The same status rows are re-read on every stage transition; treat results as read-only.
     try:
-        return int(value)
-    except (TypeError, ValueError):
+        parsed = json_utils.loads(raw)
+    except Exception:
         return None
-
-
-def _merge_cycles(target: MutableMapping[str, Any], source: Mapping[str, Any]) -> bool:
-    updated = False
-    for field in _CYCLE_FIELDS:
-        if field not in source:
-            continue
-        value = _coerce_optional_int(source.get(field))
-        if value is None:
-            continue
-        current = target.get(field)
-        if current in (None, "", []):
-            target[field] = value
-            updated = True
-    return updated
+    return parsed if isinstance(parsed, Mapping) else None
 
 
 def _extract_cycle_sources(raw: Any) -> list[Mapping[str, Any]]:
@@ -44,11 +43,8 @@ def _extract_cycle_sources(raw: Any) -> list[Mapping[str, Any]]:
     if isinstance(raw, Mapping):
         sources.append(raw)
     elif isinstance(raw, str):
-        try:
-            parsed = json.loads(raw)
-        except Exception:
-            parsed = None
-        if isinstance(parsed, Mapping):
+        parsed = _parse_details(raw)
+        if parsed is not None:
             sources.append(parsed)
     return sources
 
@@ -75,6 +71,9 @@ class CycleMetadataRepository:
     def hydrate(self, target: MutableMapping[str, Any], job_id: str) -> bool:
         if not job_id:
             return False
+        if all(target.get(field) not in (None, "", []) for field in _CYCLE_FIELDS):
+            # Nothing left to fill in; skip the status table entirely.
+            return False
         store = self._get_store()
         if store is None:
             return False
@@ -102,8 +101,13 @@ class CycleMetadataRepository:
             if populated:
                 return True
 
+        # One projected scan; folding it newest-first stops at the first row that fills a field.
+        cycle_history = getattr(store, "cycle_history", None)
         try:
-            history = store.timeline(job_id)
+            if cycle_history is not None:
+                history = cycle_history(job_id)
+            else:
+                history = store.timeline(job_id, columns=(*_CYCLE_FIELDS, "details"))
         except Exception as exc:
             track_exception(exc, {"job_id": job_id, "operation": "cycle_repo_timeline"})
             history = []
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from .config import get_settings
 from .llm import LLMClient, LLMMessage
 from .messaging import publish_stage_event, send_queue_message
-from .storage import BlobStore, JobStoragePaths
-from .telemetry import track_exception
 from .plantuml_reference import PLANTUML_REFERENCE_TEXT
+from .storage import BlobStore, JobStoragePaths, get_blob_store
+from .telemetry import track_exception
 
 
 class DiagramRenderError(RuntimeError):
@@ -243,7 +243,7 @@ def process_diagram_render(data: Dict[str, Any]) -> None:
         if not isinstance(requests, list):
             raise DiagramRenderError("diagram_requests payload must be a list")
         try:
-            store = BlobStore()
+            store = get_blob_store()
             total_requested = len(requests)
             start_message = (
                 f"Rendering {total_requested} diagram{'s' if total_requested != 1 else ''}"
@@ -383,7 +383,7 @@ def process_diagram_render(data: Dict[str, Any]) -> None:
     store: Optional[BlobStore] = None
     if source_path:
         try:
-            store = BlobStore()
+            store = get_blob_store()
             payload_source = store.get_text(source_path)
         except Exception as exc:
             raise DiagramRenderError(f"failed to load diagram source: {exc}") from exc
@@ -397,12 +397,12 @@ def process_diagram_render(data: Dict[str, Any]) -> None:
 
     formatted_source = _reformat_plantuml_text(payload_source)
     if source_path and formatted_source != payload_source:
-        (store or BlobStore()).put_text(source_path, formatted_source)
+        (store or get_blob_store()).put_text(source_path, formatted_source)
     content = _render_with_plantuml(formatted_source, fmt)
 
     try:
         blob_path = data.get("blob_path") or job_paths.images(f"{diagram_id}.{fmt}")
-        (store or BlobStore()).put_bytes(blob=blob_path, data_bytes=content)
+        (store or get_blob_store()).put_bytes(blob=blob_path, data_bytes=content)
     except Exception as exc:  # pragma: no cover - defensive
         track_exception(exc, {"job_id": job_id, "stage": "DIAGRAM_RENDER"})
         raise DiagramRenderError(f"unexpected rendering error: {exc}") from exc
@@ -4,10 +4,11 @@ import threading
 import time
 from typing import Any, Dict, List, Optional
 
-from azure.data.tables import TableServiceClient
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.data.tables import TableServiceClient
 
 from .config import get_settings
+from .storage import get_shared_transport
 
 _lock = threading.Lock()
 _store: Optional["DocumentIndexStore"] = None
@@ -26,7 +27,7 @@ def _coerce_value(value: Any) -> Any:
 
 class DocumentIndexStore:
     def __init__(self, connection_string: str, table_name: str) -> None:
-        self._service = TableServiceClient.from_connection_string(connection_string)
+        self._service = TableServiceClient.from_connection_string(connection_string, transport=get_shared_transport())
         self._table = self._service.get_table_client(table_name)
         try:
             self._table.create_table()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Both json.JSONDecodeError and orjson.JSONDecodeError derive from ValueError.
+JSONDecodeError = ValueError
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+_ORJSON_INDENT_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2) if orjson is not None else 0
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS)
+        except TypeError:
+            # Values orjson rejects (e.g. ints wider than 64 bits) take the stdlib path.
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Parse JSON from text or UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, Optional
 
@@ -41,11 +42,9 @@ class LLMClient:
                 "openai package not installed. Install with `pip install openai` or use FakeLLM in tests."
             )
         self.use_responses = use_responses
-        self.last_usage: Dict[str, Optional[int]] = {
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "total_tokens": 0,
-        }
+        self.is_azure = False
+        # Stages share one client across worker threads, so each thread sees the usage of its own last call.
+        self._usage = threading.local()
         client_kwargs: dict[str, object] = {}
         if timeout_s is not None:
             client_kwargs["timeout"] = timeout_s
@@ -65,12 +64,24 @@ class LLMClient:
                 }
             )
             self.client = AzureOpenAI(**client_kwargs)
+            self.is_azure = True
         else:
             client_kwargs.update({"api_key": api_key, "base_url": base_url})
             self.client = OpenAI(**client_kwargs)
 
-    def _supports_sampling(self, model: str) -> bool:
-        # OpenAI "smart" models (o1, o3, etc.) do not allow sampling params like temperature
+    @property
+    def last_usage(self) -> Dict[str, Optional[int]]:
+        return getattr(self._usage, "value", None) or {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    @last_usage.setter
+    def last_usage(self, value: Dict[str, Optional[int]]) -> None:
+        self._usage.value = value
+
+    def supports_sampling(self, model: str) -> bool:
+        """Whether requests to ``model`` send a sampling temperature.
+
+        OpenAI "smart" models (o1, o3, etc.) do not allow sampling params like temperature.
+        """
         return not model.lower().startswith("o") and not model.lower().startswith("gpt-5")
 
     def _supports_response_format(self) -> bool:
@@ -178,7 +189,7 @@ class LLMClient:
 
     def chat_stream(self, model: str, messages: list[LLMMessage]) -> Iterator[str]:
         inputs = [{"role": m.role, "content": m.content} for m in messages]
-        temp = 0.2 if self._supports_sampling(model) else None
+        temp = 0.2 if self.supports_sampling(model) else None
         if self.use_responses:
             request_kwargs = {"model": model, "input": inputs}
             if temp is not None:
@@ -194,19 +205,21 @@ class LLMClient:
             completion_kwargs = {"model": model, "messages": inputs}
             if temp is not None:
                 completion_kwargs["temperature"] = temp
-            stream_fn = lambda: self.client.chat.completions.create(stream=True, **completion_kwargs)
+            # Ask for the trailing usage chunk so token accounting does not have to re-count text.
+            stream_fn = lambda: self.client.chat.completions.create(
+                stream=True, stream_options={"include_usage": True}, **completion_kwargs
+            )
+            usage_chunk = None
             for chunk in stream_fn():
+                if getattr(chunk, "usage", None) is not None:
+                    usage_chunk = chunk
                 try:
                     delta = chunk.choices[0].delta.content
                     if delta:
                         yield delta
                 except Exception:
                     continue
-            self.last_usage = {
-                "prompt_tokens": None,
-                "completion_tokens": None,
-                "total_tokens": None,
-            }
+            self._update_usage(usage_chunk)
 
     def chat(
         self,
@@ -215,7 +228,7 @@ class LLMClient:
         response_format: Optional[dict] = None,
     ) -> str | dict:
         inputs = [{"role": m.role, "content": m.content} for m in messages]
-        temp = 0.2 if self._supports_sampling(model) else None
+        temp = 0.2 if self.supports_sampling(model) else None
         if self.use_responses:
             try:
                 return self._chat_via_responses(model, inputs, temp, response_format)
@@ -223,3 +236,56 @@ class LLMClient:
                 logger.info("LLM responses.create failed; falling back to chat.completions: %s", exc)
                 return self._chat_via_chat_completions(model, inputs, temp, response_format)
         return self._chat_via_chat_completions(model, inputs, temp, response_format)
+
+    # Batch API ----------------------------------------------------------
+    def submit_batch(self, model: str, requests: list[tuple[str, list[LLMMessage]]]) -> str:
+        """Submit ``(custom_id, messages)`` chat requests as one Batch API job; returns the batch id."""
+        url = "/chat/completions" if self.is_azure else "/v1/chat/completions"
+        temp = 0.2 if self.supports_sampling(model) else None
+        lines: list[str] = []
+        for custom_id, messages in requests:
+            body: Dict[str, Any] = {"model": model, "messages": [{"role": m.role, "content": m.content} for m in messages]}
+            if temp is not None:
+                body["temperature"] = temp
+            lines.append(json.dumps({"custom_id": custom_id, "method": "POST", "url": url, "body": body}))
+        upload = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl"),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(input_file_id=upload.id, endpoint=url, completion_window="24h")
+        return str(batch.id)
+
+    def batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Return ``custom_id -> content`` once the batch has finished, or None while it is still running.
+
+        Requests that failed inside a completed batch are simply absent from the result.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        status = getattr(batch, "status", None)
+        if status in {"validating", "in_progress", "finalizing"}:
+            return None
+        if status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status {status}")
+        results: Dict[str, str] = {}
+        prompt_tokens = 0
+        completion_tokens = 0
+        output_file_id = getattr(batch, "output_file_id", None)
+        if output_file_id:
+            for line in self.client.files.content(output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    body = item["response"]["body"]
+                    results[str(item["custom_id"])] = str(body["choices"][0]["message"]["content"] or "")
+                except Exception:
+                    continue
+                usage = body.get("usage") or {}
+                prompt_tokens += int(usage.get("prompt_tokens") or 0)
+                completion_tokens += int(usage.get("completion_tokens") or 0)
+        self.last_usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return results
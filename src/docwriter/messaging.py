@@ -3,8 +3,12 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Mapping, Optional, Set, Union
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 try:
     from azure.servicebus import ServiceBusClient, ServiceBusMessage  # type: ignore
@@ -35,6 +39,10 @@ class ServiceBusManager:
             "aidocwriter-status",
             "docwriter-status",
         }
+        # Open sender links keyed by ("queue" | "topic", name), each with a lock since senders
+        # are not thread-safe; reused so a send does not pay for a link attach every time.
+        self._senders: Dict[Tuple[str, str], Tuple[Any, threading.Lock]] = {}
+        self._senders_lock = threading.Lock()
 
     def ensure_ready(self) -> None:
         settings = get_settings()
@@ -44,6 +52,7 @@ class ServiceBusManager:
         fq_namespace = self._resolve_fully_qualified_namespace()
         if conn:
             if self._client is None or self._connection != conn:
+                self._close_senders()
                 self._client = ServiceBusClient.from_connection_string(conn)
                 self._connection = conn
                 self._fq_namespace = None
@@ -56,6 +65,7 @@ class ServiceBusManager:
         if DefaultAzureCredential is None:  # pragma: no cover
             raise RuntimeError("azure-identity not installed")
         if self._client is None or self._fq_namespace != fq_namespace:
+            self._close_senders()
             credential = DefaultAzureCredential()
             self._client = ServiceBusClient(
                 fully_qualified_namespace=fq_namespace,
@@ -65,23 +75,81 @@ class ServiceBusManager:
             self._fq_namespace = fq_namespace
             self._credential = credential
 
+    def status_enabled(self) -> bool:
+        """Whether status events can be published, so callers can skip building them."""
+        if ServiceBusClient is None or ServiceBusMessage is None:
+            return False
+        settings = get_settings()
+        if not (settings.sb_connection_string or self._resolve_fully_qualified_namespace()):
+            return False
+        return bool(self._status_topics())
+
     def get_client(self) -> ServiceBusClient:
         self.ensure_ready()
         assert self._client is not None  # for type-checkers
         return self._client
 
+    def _with_sender(self, kind: str, name: str, action: Callable[[Any], None]) -> None:
+        key = (kind, name)
+        # Resolved outside the lock: a changed connection closes the cached senders first.
+        client = self.get_client()
+        with self._senders_lock:
+            entry = self._senders.get(key)
+            if entry is None:
+                sender = client.get_queue_sender(name) if kind == "queue" else client.get_topic_sender(name)
+                entry = (sender, threading.Lock())
+                self._senders[key] = entry
+        sender, lock = entry
+        try:
+            with lock:
+                action(sender)
+        except Exception:
+            # Drop the link so the next send starts from a fresh one.
+            with self._senders_lock:
+                if self._senders.get(key) is entry:
+                    del self._senders[key]
+            try:
+                sender.close()
+            except Exception:
+                pass
+            raise
+
+    def _close_senders(self) -> None:
+        with self._senders_lock:
+            senders, self._senders = self._senders, {}
+        for sender, _ in senders.values():
+            try:
+                sender.close()
+            except Exception:
+                pass
+
     # Queue interactions -------------------------------------------------
-    def send_queue(self, queue_name: str, payload: Dict[str, Any]) -> None:
+    def send_queue(self, queue_name: str, payload: Dict[str, Any], *, delay_s: Optional[float] = None) -> None:
         self.ensure_ready()
-        client = self.get_client()
         safe_payload = _sanitize_queue_payload(payload)
-        try:
-            with client.get_queue_sender(queue_name) as sender:
-                sender.send_messages(
-                    ServiceBusMessage(
-                        json.dumps(safe_payload, default=_json_fallback),
-                    )
+        body = json.dumps(safe_payload, default=_json_fallback)
+        if delay_s:
+            # Scheduled messages go out immediately; they are not delivered before delay_s anyway.
+            scheduled = datetime.now(timezone.utc) + timedelta(seconds=delay_s)
+            try:
+                self._with_sender(
+                    "queue",
+                    queue_name,
+                    lambda sender: sender.send_messages(ServiceBusMessage(body, scheduled_enqueue_time_utc=scheduled)),
                 )
+            except Exception as exc:
+                track_exception(exc, {"queue": queue_name})
+                raise
+            return
+        bus = _outbound_bus.get()
+        if bus is not None:
+            bus._add(("queue", queue_name), body)
+            return
+        self.send_queue_bodies(queue_name, [body])
+
+    def send_queue_bodies(self, queue_name: str, bodies: List[str]) -> None:
+        try:
+            self._with_sender("queue", queue_name, lambda sender: _send_bodies(sender, bodies))
         except Exception as exc:
             track_exception(exc, {"queue": queue_name})
             raise
@@ -107,14 +175,23 @@ class ServiceBusManager:
             payload = payload.to_payload()
         self.ensure_ready()
         _ensure_status_message(payload)
-        topics = self._status_topics()
-        client = self.get_client()
+        body = json.dumps(payload)
+        bus = _outbound_bus.get()
+        if bus is not None:
+            bus._add(("status", ""), body)
+        else:
+            self.publish_status_bodies([body])
+        props = {k: str(v) for k, v in payload.items() if isinstance(v, (str, int, float))}
+        if "job_id" in payload:
+            props["job_id"] = str(payload["job_id"])
+        track_event("job_status", props)
+
+    def publish_status_bodies(self, bodies: List[str]) -> None:
         sent = False
         last_exc: Exception | None = None
-        for topic in topics:
+        for topic in self._status_topics():
             try:
-                with client.get_topic_sender(topic) as sender:
-                    sender.send_messages(ServiceBusMessage(json.dumps(payload)))
+                self._with_sender("topic", topic, lambda sender: _send_bodies(sender, bodies))
                 sent = True
                 break
             except Exception as exc:
@@ -122,10 +199,6 @@ class ServiceBusManager:
                 track_exception(exc, {"topic": topic})
         if not sent and last_exc:
             logging.error("Failed to publish status event to Service Bus: %s", last_exc)
-        props = {k: str(v) for k, v in payload.items() if isinstance(v, (str, int, float))}
-        if "job_id" in payload:
-            props["job_id"] = str(payload["job_id"])
-        track_event("job_status", props)
 
     def _resolve_fully_qualified_namespace(self) -> str | None:
         settings = get_settings()
@@ -171,6 +244,76 @@ class ServiceBusManager:
         self.publish_status(event_payload.to_payload())
 
 
+_outbound_bus: ContextVar[Optional["OutboundBus"]] = ContextVar("docwriter_outbound_bus", default=None)
+
+
+class OutboundBus(ContextDecorator):
+    """Collect queue sends and status events for one handler and flush them on exit.
+
+    Messages are grouped per destination and sent as a single
+    ``ServiceBusMessageBatch`` each, in the order destinations were first used.
+    Nested scopes defer to the outermost one.
+    """
+
+    def __init__(self, manager: Optional[ServiceBusManager] = None) -> None:
+        self._manager = manager
+        self._pending: Dict[Tuple[str, str], List[str]] = {}
+        self._token: Any = None
+
+    def _recreate_cm(self) -> "OutboundBus":
+        return OutboundBus(self._manager)
+
+    def _add(self, destination: Tuple[str, str], body: str) -> None:
+        self._pending.setdefault(destination, []).append(body)
+
+    def __enter__(self) -> "OutboundBus":
+        active = _outbound_bus.get()
+        if active is not None:
+            return active
+        self._token = _outbound_bus.set(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._token is None:
+            return
+        _outbound_bus.reset(self._token)
+        self._token = None
+        self.flush()
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        manager = self._manager or service_bus
+        for (kind, name), bodies in pending.items():
+            if kind == "queue":
+                manager.send_queue_bodies(name, bodies)
+            else:
+                manager.publish_status_bodies(bodies)
+
+
+def _send_bodies(sender: Any, bodies: List[str]) -> None:
+    if len(bodies) == 1:
+        sender.send_messages(ServiceBusMessage(bodies[0]))
+        return
+    batch = sender.create_message_batch()
+    count = 0
+    for body in bodies:
+        message = ServiceBusMessage(body)
+        try:
+            batch.add_message(message)
+        except ValueError:
+            # MessageSizeExceededError: ship what fits and start a new batch.
+            if not count:
+                raise
+            sender.send_messages(batch)
+            batch = sender.create_message_batch()
+            batch.add_message(message)
+            count = 0
+        count += 1
+    if count:
+        sender.send_messages(batch)
+
 
 _CYCLIC_STAGES: Set[str] = {
     "REVIEW",
@@ -273,14 +416,18 @@ def _build_default_message(stage: str, cycle: Optional[int]) -> str:
 service_bus = ServiceBusManager()
 
 
-def send_queue_message(queue_name: str, payload: Dict[str, Any]) -> None:
-    service_bus.send_queue(queue_name, payload)
+def send_queue_message(queue_name: str, payload: Dict[str, Any], *, delay_s: Optional[float] = None) -> None:
+    service_bus.send_queue(queue_name, payload, delay_s=delay_s)
 
 
 def publish_status(payload: Dict[str, Any]) -> None:
     service_bus.publish_status(payload)
 
 
+def status_enabled() -> bool:
+    return service_bus.status_enabled()
+
+
 def publish_stage_event(
     stage: str,
     event: str,
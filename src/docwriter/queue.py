@@ -1,31 +1,37 @@
 from __future__ import annotations
 
 import json
-import uuid
-from dataclasses import dataclass
 import logging
-from typing import Any, Dict, Optional, Mapping
 import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
 
-from .config import get_settings
+from .agents.cohesion_reviewer import CohesionReviewerAgent
+from .agents.interviewer import InterviewerAgent
 from .agents.planner import PlannerAgent
-from .agents.writer import WriterAgent
 from .agents.reviewer import ReviewerAgent
-from .agents.verifier import VerifierAgent
-from .summary import Summarizer
-from .graph import build_dependency_graph
-from .storage import BlobStore, JobStoragePaths
-from .telemetry import track_event, track_exception
-from .agents.interviewer import InterviewerAgent
 from .agents.style_reviewer import StyleReviewerAgent
-from .agents.cohesion_reviewer import CohesionReviewerAgent
 from .agents.summary_reviewer import SummaryReviewerAgent
-from .messaging import send_queue_message, service_bus, publish_stage_event as messaging_publish_stage_event, publish_status as messaging_publish_status
-from .workers import configure_logging as worker_configure_logging, run_processor as worker_run_processor
+from .agents.verifier import VerifierAgent
+from .agents.writer import WriterAgent
+from .config import get_settings
+from .graph import build_dependency_graph
+from .messaging import publish_stage_event as messaging_publish_stage_event
+from .messaging import publish_status as messaging_publish_status
+from .messaging import send_queue_message, service_bus
+from .models import StatusEvent
 from .stages import core as stages_core
 from .stages.diagram_prep import process_diagram_prep
-from .models import StatusEvent
-from docwriter.cycle_repository import ensure_cycle_state
+from .storage import JobStoragePaths, get_blob_store
+from .summary import Summarizer
+from .telemetry import track_event, track_exception
+from .workers import configure_logging as worker_configure_logging
+from .workers import run_processor as worker_run_processor
+
+# isort: split
+# cycle_repository imports through the stages package, so the stages have to be loaded first.
+from .cycle_repository import ensure_cycle_state
 
 
 @dataclass
@@ -70,7 +76,7 @@ def send_job(job: Job) -> str:
         raise ValueError("job.user_id is required to enqueue a job")
     job_paths = JobStoragePaths(user_id=job.user_id, job_id=job_id)
     try:
-        store = BlobStore()
+        store = get_blob_store()
         blob_path = store.allocate_document_blob(job_id, job.user_id)
     except Exception as exc:
         track_exception(exc, {"job_id": job_id, "operation": "allocate_document_blob"})
@@ -84,7 +90,7 @@ def send_job(job: Job) -> str:
         "user_id": job.user_id,
     }
     try:
-        store = BlobStore()
+        store = get_blob_store()
         context_snapshot = {
             "job_id": job_id,
             "title": job.title,
@@ -148,7 +154,7 @@ def send_resume(job_id: str, user_id: str | None = None) -> None:
     job_paths = JobStoragePaths(user_id=user_id, job_id=job_id)
     payload: Dict[str, Any] = {"job_id": job_id, "user_id": user_id}
     try:
-        store = BlobStore()
+        store = get_blob_store()
         context_blob = job_paths.intake("context.json")
         context_text = store.get_text(blob=context_blob)
         context = json.loads(context_text)
@@ -167,7 +173,7 @@ def send_resume(job_id: str, user_id: str | None = None) -> None:
     resolved_user_id = payload.get("user_id") or user_id
     if not isinstance(payload.get("out"), str) or not payload.get("out"):
         try:
-            payload["out"] = BlobStore().allocate_document_blob(job_id, resolved_user_id)
+            payload["out"] = get_blob_store().allocate_document_blob(job_id, resolved_user_id)
         except Exception as exc:
             track_exception(exc, {"job_id": job_id, "operation": "allocate_document_blob_resume"})
             payload["out"] = JobStoragePaths(user_id=resolved_user_id, job_id=job_id).draft()
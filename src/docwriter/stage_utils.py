@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
-from typing import Any, Dict, Tuple, Set
+from typing import Any, Dict, Set, Tuple
+
+from . import json_utils
 
 SECTION_START_RE = re.compile(r"<!-- SECTION:(?P<id>[^:]+):START -->")
+SECTION_BLOCK_RE = re.compile(
+    r"<!-- SECTION:(?P<id>[^:]+):START -->.*?<!-- SECTION:(?P=id):END -->",
+    re.DOTALL,
+)
 HEADING_RE = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<text>.+)$")
 HEADING_NUMBER_PREFIX_RE = re.compile(r"^\d+(?:\.\d+)*(?:\.)?\s+")
 TITLE_PAGE_START = "<!-- TITLE_PAGE_START -->"
@@ -36,21 +41,57 @@ def merge_revised_markdown(original: str, revised: str) -> str:
     revised_sections = extract_sections(revised)
     if not revised_sections:
         return revised
-    original_sections = extract_sections(original)
-    if not original_sections:
-        return revised
-    updated = original
+    replacements: Dict[str, str] = {}
     for sid, section_text in revised_sections.items():
-        original_section = original_sections.get(sid)
-        if not original_section:
-            continue
         inner = section_text.replace(f"<!-- SECTION:{sid}:START -->", "").replace(
             f"<!-- SECTION:{sid}:END -->", ""
         ).strip()
         if not inner or "content unchanged" in inner.lower():
             continue
-        updated = updated.replace(original_section, section_text)
-    return updated
+        replacements[sid] = section_text
+    found = False
+
+    def _swap(match: "re.Match[str]") -> str:
+        nonlocal found
+        found = True
+        return replacements.get(match.group("id"), match.group(0))
+
+    # One pass over the original instead of a full-text replace per revised section.
+    updated = SECTION_BLOCK_RE.sub(_swap, original)
+    return updated if found else revised
+
+
+def replace_sections(markdown: str, replacements: Dict[str, str]) -> str:
+    """Swap whole section blocks (markers included) by id in one pass; unknown ids are ignored."""
+    if not replacements:
+        return markdown
+    return SECTION_BLOCK_RE.sub(lambda match: replacements.get(match.group("id"), match.group(0)), markdown)
+
+
+def apply_patch_ops(markdown: str, patch_ops: Any, section_id: str | None = None) -> str:
+    """Apply reviewer ``{anchor, replace}`` edits, each to the first match of its anchor.
+
+    With ``section_id`` the edits are confined to that section's block when it exists.
+    Ops whose anchor is missing or empty are skipped.
+    """
+    if not isinstance(patch_ops, list) or not patch_ops:
+        return markdown
+    start, end = 0, len(markdown)
+    if section_id is not None:
+        for match in SECTION_BLOCK_RE.finditer(markdown):
+            if match.group("id") == str(section_id):
+                start, end = match.span()
+                break
+    region = markdown[start:end]
+    for op in patch_ops:
+        if not isinstance(op, dict):
+            continue
+        anchor = op.get("anchor")
+        replacement = op.get("replace")
+        if not isinstance(anchor, str) or not anchor or not isinstance(replacement, str):
+            continue
+        region = region.replace(anchor, replacement, 1)
+    return markdown[:start] + region + markdown[end:]
 
 
 def parse_review_guidance(raw: Any) -> Tuple[str, Set[str]]:
@@ -61,7 +102,7 @@ def parse_review_guidance(raw: Any) -> Tuple[str, Set[str]]:
         return "", set()
     sections: Set[str] = set()
     try:
-        parsed = json.loads(raw)
+        parsed = json_utils.loads(raw)
     except Exception:
         parsed = raw
 
@@ -90,7 +131,7 @@ def parse_review_guidance(raw: Any) -> Tuple[str, Set[str]]:
 
     guidance_text = "\n".join(line for line in lines if line).strip()
     if not guidance_text:
-        guidance_text = json.dumps(parsed, ensure_ascii=False)
+        guidance_text = json_utils.dumps(parsed)
     return guidance_text, sections
 
 
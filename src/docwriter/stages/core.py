@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-import time
+import os
 import re
-from datetime import datetime
-from typing import Any, Dict, Optional, Mapping, List
+import threading
+import time
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+import tiktoken
 
+from docwriter import json_utils
 from docwriter.agents.cohesion_reviewer import CohesionReviewerAgent
 from docwriter.agents.interviewer import InterviewerAgent
 from docwriter.agents.planner import PlannerAgent
@@ -16,28 +23,42 @@ from docwriter.agents.summary_reviewer import SummaryReviewerAgent
 from docwriter.agents.verifier import VerifierAgent
 from docwriter.agents.writer import WriterAgent
 from docwriter.artifacts import export_docx, export_pdf
-from docwriter.config import get_settings, Settings
+from docwriter.config import Settings, get_settings
+from docwriter.cycle_repository import ensure_cycle_state
 from docwriter.graph import build_dependency_graph
-from docwriter.messaging import publish_stage_event, publish_status, send_queue_message
+from docwriter.llm import LLMClient
+from docwriter.messaging import (
+    OutboundBus,
+    publish_stage_event,
+    publish_status,
+    send_queue_message,
+    status_enabled,
+)
 from docwriter.models import StatusEvent
 from docwriter.stage_utils import (
+    TITLE_PAGE_END,
+    apply_patch_ops,
     extract_sections,
     find_placeholder_sections,
     insert_table_of_contents,
     merge_revised_markdown,
     number_markdown_headings,
     parse_review_guidance,
-    TITLE_PAGE_END,
+    replace_sections,
 )
-from docwriter.storage import BlobStore, JobStoragePaths
+from docwriter.storage import BlobStore, JobStoragePaths, compress_bytes, get_blob_store
 from docwriter.summary import Summarizer
-from docwriter.telemetry import stage_timer, track_event, track_exception, StageTiming
-from .cycles import CycleState, enrich_details_with_cycles as _with_cycle_metadata
-from docwriter.cycle_repository import ensure_cycle_state
+from docwriter.telemetry import StageTiming, stage_timer, track_event, track_exception
 
-import tiktoken
+from .cycles import CycleState
+from .cycles import enrich_details_with_cycles as _with_cycle_metadata
 
 ENCODING_NAME = "cl100k_base"
+# Approximate cost of the "\n\n" joiner between batch context parts.
+_SEPARATOR_TOKENS = 1
+
+_FALLBACK_PLANTUML_RE = re.compile(r"```plantuml\s+([\s\S]*?)```", flags=re.IGNORECASE)
+_INLINE_UML_RE = re.compile(r"@startuml[\s\S]*?@enduml", flags=re.IGNORECASE)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +69,17 @@ REVIEW_AGENT_STAGES = {
     "summary": "REVIEW_SUMMARY",
 }
 
+_REVIEW_PROGRESS_SCHEMA = 1
+_REVIEW_PROGRESS_MERGE_ATTEMPTS = 5
+# Intermediate review deltas written before the next write compacts them into the snapshot.
+_REVIEW_DELTA_COMPACT_AFTER = 16
+# Run concurrently once the general review is done; verify waits for all three.
+_PARALLEL_REVIEW_AGENTS = ("style", "cohesion", "summary")
+_REVIEW_PAYLOAD_KEYS = frozenset({"review_progress", "review_json", "style_json", "cohesion_json", "exec_summary_json"})
+# Service Bus Standard caps a message at 256 KB and the rewrite payload already carries the plan and
+# dependency summaries; larger guidance stays in style.json/cohesion.json for rewrite to read.
+_MAX_CARRIED_GUIDANCE_BYTES = 64 * 1024
+
 
 def _job_paths(data: Mapping[str, Any]) -> JobStoragePaths:
     job_id = data.get("job_id")
@@ -59,21 +91,67 @@ def _job_paths(data: Mapping[str, Any]) -> JobStoragePaths:
     return JobStoragePaths(user_id=user_id, job_id=job_id)
 
 
+def _cycle_paths(job_paths: JobStoragePaths, cycle_idx: int, *names: str) -> Dict[str, str]:
+    return {name: job_paths.cycle(cycle_idx, name) for name in names}
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> "tiktoken.Encoding":
+    try:
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+
+
 def _estimate_tokens(text: str) -> int:
     if not text:
         return 0
+    encoding = _encoding()
     try:
-        encoding = tiktoken.get_encoding(ENCODING_NAME)
+        # encode_ordinary skips the special-token scan; drafts never carry control tokens.
+        return len(encoding.encode_ordinary(text))
     except Exception:
-        encoding = tiktoken.encoding_for_model("gpt-4o-mini")
+        return max(1, len(text) // 3)
+
+
+def _estimate_tokens_batch(texts: List[str]) -> List[int]:
+    """Token counts for many texts in one tiktoken call (encoded in parallel, outside the GIL)."""
+    if not texts:
+        return []
     try:
-        return len(encoding.encode(text))
+        encoded = _encoding().encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
     except Exception:
-        return max(1, len(text) // 3)
+        return [_estimate_tokens(text) for text in texts]
+    return [len(tokens) if text else 0 for text, tokens in zip(texts, encoded, strict=True)]
+
+
+def _estimate_structure_tokens(value: Any) -> int:
+    """Rough token count for a JSON-like structure without serializing or encoding it.
+
+    Only used for telemetry when the LLM client did not report usage.
+    """
+    chars = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            chars += len(item)
+        elif isinstance(item, Mapping):
+            for key, nested in item.items():
+                chars += len(str(key))
+                stack.append(nested)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif item is not None:
+            chars += len(str(item))
+    return max(1, chars // 3) if chars else 0
 
 
 def _init_review_progress(raw: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
     """Normalize review_progress into the new per-agent shape."""
+    if isinstance(raw, Mapping) and raw.get("_schema") == _REVIEW_PROGRESS_SCHEMA:
+        # Already written by _persist_review_progress in this shape.
+        return dict(raw)
     base = dict(raw) if isinstance(raw, Mapping) else {}
 
     def _agent_state(key: str) -> Dict[str, Any]:
@@ -86,7 +164,9 @@ def _init_review_progress(raw: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
         return state
 
     normalized = {
+        "_schema": _REVIEW_PROGRESS_SCHEMA,
         "tokens_total": base.get("tokens_total", 0) if isinstance(base.get("tokens_total"), (int, float)) else 0,
+        "tokens_total_by_model": dict(base.get("tokens_total_by_model") or {}) if isinstance(base.get("tokens_total_by_model"), Mapping) else {},
         "general": _agent_state("general"),
         "style": _agent_state("style"),
         "cohesion": _agent_state("cohesion"),
@@ -95,16 +175,51 @@ def _init_review_progress(raw: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
     return normalized
 
 
-def _ordered_section_ids(plan: Mapping[str, Any], sections: Mapping[str, str]) -> list[str]:
-    outline = plan.get("outline", []) if isinstance(plan, Mapping) else []
-    order: list[str] = []
+def _outline_fingerprint(outline: List[Mapping[str, Any]]) -> tuple:
+    return tuple(
+        (str(item.get("id")), tuple(str(dep) for dep in (item.get("dependencies", []) or [])))
+        for item in outline
+        if isinstance(item, Mapping) and item.get("id") is not None
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_topological_order(fingerprint: tuple) -> tuple[str, ...]:
+    outline = [{"id": sid, "dependencies": list(deps)} for sid, deps in fingerprint]
+    return tuple(build_dependency_graph(outline).topological_order())
+
+
+def _topological_order(outline: List[Mapping[str, Any]]) -> list[str]:
+    """Dependency order for an outline, cached across stage invocations of the same job."""
+    if not outline:
+        return []
+    return list(_cached_topological_order(_outline_fingerprint(outline)))
+
+
+def _plan_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Section lookup and dependency order for the message's plan, built once per message.
+
+    Kept on ``data["_plan_index"]`` rather than on the plan, which is sent to reviewers
+    verbatim; underscore keys are dropped from queue payloads, so it never travels.
+    """
+    index = data.get("_plan_index")
+    if isinstance(index, Mapping):
+        return index
+    plan = data.get("plan")
+    raw_outline = (plan.get("outline") if isinstance(plan, Mapping) else None) or []
+    outline = [item for item in raw_outline if isinstance(item, Mapping)]
     try:
-        graph = build_dependency_graph(outline)
-        order = [str(sid) for sid in graph.topological_order()]
+        ordered_ids = _topological_order(outline)
     except Exception:
-        order = [str(item.get("id")) for item in outline if isinstance(item, Mapping) and item.get("id") is not None]
+        ordered_ids = [str(item.get("id")) for item in outline if item.get("id") is not None]
+    index = {"id_to_section": {str(s.get("id")): s for s in outline}, "ordered_ids": ordered_ids}
+    data["_plan_index"] = index
+    return index
+
+
+def _ordered_section_ids(data: Dict[str, Any], sections: Mapping[str, str]) -> list[str]:
     # Keep only sections present in the draft
-    order = [sid for sid in order if sid in sections]
+    order = [sid for sid in _plan_index(data)["ordered_ids"] if sid in sections]
     if not order:
         order = list(sections.keys())
     return order
@@ -117,14 +232,16 @@ def _compose_section_batch(
 ) -> tuple[list[str], str]:
     section = id_to_section.get(current_sid, {})
     deps = section.get("dependencies", []) or []
-    dep_ids = [str(d) for d in deps if str(d) in sections]
     batch_ids: list[str] = []
     seen: set[str] = set()
-    for sid in dep_ids + [current_sid]:
+    for dep in deps:
+        sid = str(dep)
         if sid in sections and sid not in seen:
             batch_ids.append(sid)
             seen.add(sid)
-    batch_text = "\n\n".join(sections[sid] for sid in batch_ids if sid in sections)
+    if current_sid in sections and current_sid not in seen:
+        batch_ids.append(current_sid)
+    batch_text = "\n\n".join(sections[sid] for sid in batch_ids)
     return batch_ids, batch_text
 
 
@@ -137,24 +254,43 @@ def _dependency_stub(section_id: str, dependency_summaries: Mapping[str, str], i
     return f"Dependency {section_id}{title_part} summary unavailable; refer to prior context."
 
 
+_REVIEW_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_REVIEW_BLANK_RUN_RE = re.compile(r"\n{3,}")
+# Section markers stay: reviewers key their findings on them.
+_REVIEW_COMMENT_RE = re.compile(r"<!--(?!\s*SECTION:).*?-->", re.DOTALL)
+_REVIEW_QUOTE_RUN_RE = re.compile(r"^(?:>[ \t]*){2,}", re.MULTILINE)
+_REVIEW_DATA_URI_RE = re.compile(r"data:[\w/+.-]+;base64,[A-Za-z0-9+/=]+")
+
+
+def _compress_markdown_for_review(text: str) -> str:
+    """Deterministically shrink review prompts: comments, embedded data and whitespace runs."""
+    text = _REVIEW_COMMENT_RE.sub("", text)
+    text = _REVIEW_DATA_URI_RE.sub("data:omitted", text)
+    text = _REVIEW_QUOTE_RUN_RE.sub("> ", text)
+    text = _REVIEW_TRAILING_WS_RE.sub("\n", text)
+    return _REVIEW_BLANK_RUN_RE.sub("\n\n", text)
+
+
 def _build_batch_context(
     batch_ids: list[str],
     sections: Mapping[str, str],
     id_to_section: Mapping[str, Mapping[str, Any]],
     dependency_summaries: Mapping[str, str],
+    compress: bool = False,
 ) -> tuple[str, list[str]]:
     """Compose a combined markdown for a batch plus dependency stubs.
 
     Returns the combined text and the ordered dependency ids included (excluding targets).
     """
     dep_ids: list[str] = []
-    seen_deps: set[str] = set()
+    # Batch members never need a stub, so seed the dedup set with them.
+    seen_deps: set[str] = {str(sid) for sid in batch_ids}
     for sid in batch_ids:
         section = id_to_section.get(str(sid), {})
         deps = section.get("dependencies", []) or []
         for dep in deps:
             dep_str = str(dep)
-            if dep_str in batch_ids or dep_str in seen_deps:
+            if dep_str in seen_deps:
                 continue
             dep_ids.append(dep_str)
             seen_deps.add(dep_str)
@@ -167,6 +303,8 @@ def _build_batch_context(
         if section_text:
             batch_parts.append(section_text)
     combined_text = "\n\n".join(batch_parts)
+    if compress:
+        combined_text = _compress_markdown_for_review(combined_text)
     return combined_text, dep_ids
 
 
@@ -180,31 +318,259 @@ def _plan_review_batches(
     batch_size_override: int | None = None,
 ) -> list[list[str]]:
     """Greedy batching: group sections that share dependencies while staying under limits."""
+    if completed_ids.issuperset(ordered_section_ids):
+        # Redelivered or resumed message for a finished stage.
+        return []
     max_batch = max(1, int(batch_size_override or settings.review_batch_size or 1))
     max_tokens = max(1, int(settings.review_max_prompt_tokens or 1))
     remaining = [sid for sid in ordered_section_ids if sid not in completed_ids]
     batches: list[list[str]] = []
     current: list[str] = []
+    # Running estimate for the current batch; only the newly added section and
+    # any new dependency stubs are tokenized per step.
+    current_tokens = 0
+    current_dep_ids: set[str] = set()
+    # Section texts and dependency stubs are stable for the whole call, so
+    # tokenize each exactly once and size candidates by summing counts.
+    section_deps = {
+        sid: [str(dep) for dep in ((id_to_section.get(sid) or {}).get("dependencies", []) or [])]
+        for sid in remaining
+    }
+    stub_ids = list(dict.fromkeys(dep for deps in section_deps.values() for dep in deps))
+    counts = _estimate_tokens_batch(
+        [sections.get(sid) or "" for sid in remaining]
+        + [_dependency_stub(dep, dependency_summaries, id_to_section) for dep in stub_ids]
+    )
+    section_tokens = {sid: count + _SEPARATOR_TOKENS for sid, count in zip(remaining, counts[: len(remaining)], strict=True)}
+    stub_tokens = {dep: count + _SEPARATOR_TOKENS for dep, count in zip(stub_ids, counts[len(remaining) :], strict=True)}
 
+    def _delta(section_id: str, batch_ids: set[str], dep_ids: set[str]) -> tuple[int, list[str]]:
+        new_deps: list[str] = []
+        for dep_str in section_deps[section_id]:
+            if dep_str == section_id or dep_str in dep_ids or dep_str in batch_ids or dep_str in new_deps:
+                continue
+            new_deps.append(dep_str)
+        tokens = section_tokens[section_id] + sum(stub_tokens[dep] for dep in new_deps)
+        if section_id in dep_ids:
+            # The section replaces its own stub once it joins the batch.
+            tokens -= stub_tokens.get(section_id, 0)
+        return tokens, new_deps
+
+    # Membership mirror of ``current`` so dependency checks do not scan the batch list.
+    current_ids: set[str] = set()
     for sid in remaining:
-        candidate = current + [sid]
-        candidate_text, _ = _build_batch_context(candidate, sections, id_to_section, dependency_summaries)
-        candidate_tokens = _estimate_tokens(candidate_text)
+        delta, new_deps = _delta(sid, current_ids, current_dep_ids)
+        candidate_tokens = current_tokens + delta
         over_tokens = candidate_tokens > max_tokens
-        over_size = len(candidate) > max_batch
+        over_size = len(current) + 1 > max_batch
         if current and (over_tokens or over_size):
             batches.append(current)
             current = [sid]
+            current_ids = {sid}
+            current_tokens, new_deps = _delta(sid, set(), set())
+            current_dep_ids = set(new_deps)
         else:
-            current = candidate
+            current.append(sid)
+            current_ids.add(sid)
+            current_tokens = candidate_tokens
+            current_dep_ids.discard(sid)
+            current_dep_ids.update(new_deps)
         if len(current) >= max_batch:
             batches.append(current)
             current = []
+            current_ids = set()
+            current_tokens = 0
+            current_dep_ids = set()
     if current:
         batches.append(current)
     return batches
 
 
+def _run_review_batches(
+    batches: list[list[str]],
+    review: Callable[[list[str]], tuple[str, int]],
+    settings: Settings,
+) -> list[tuple[list[str], str, int]]:
+    """Review up to review_max_concurrency independent batches at once, keeping batch order.
+
+    Each batch covers distinct sections and only reads write-time dependency summaries,
+    so the LLM calls can overlap; callers merge the results sequentially.
+    """
+    selected = batches[: max(1, int(settings.review_max_concurrency or 1))]
+    if len(selected) == 1:
+        return [(selected[0], *review(selected[0]))]
+    with ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix="review") as pool:
+        return [(batch, *result) for batch, result in zip(selected, pool.map(review, selected), strict=True)]
+
+
+def _collect_review_batches(
+    agent_key: str,
+    batches: list[list[str]],
+    review: Callable[[list[str]], tuple[str, int]],
+    build_messages: Callable[[list[str]], list[Any]],
+    llm: Any,
+    progress: Dict[str, Any],
+    settings: Settings,
+    persist: Callable[[], None],
+    model: Optional[str] = None,
+) -> list[tuple[list[str], str, int]]:
+    """Review batches live, or through the provider Batch API for large cycles.
+
+    With review_use_batch_api, every planned batch is submitted as one Batch API job and
+    the job id is kept in progress; later messages poll it and return its results once
+    it has finished. An empty list means the job is still running.
+    """
+    state = progress[agent_key]
+    pending = state.get("batch_api")
+    if isinstance(pending, Mapping):
+        try:
+            results = llm.batch_results(pending["id"])
+        except Exception as exc:
+            track_exception(exc, {"stage": "REVIEW", "agent": agent_key, "action": "batch_api_poll"})
+            state.pop("batch_api", None)
+            persist()
+            return _run_review_batches(batches, review, settings)
+        if results is None:
+            return []
+        state.pop("batch_api", None)
+        persist()
+        usage = _usage_total(getattr(llm, "last_usage", None))
+        collected: list[tuple[list[str], str, int]] = []
+        for batch, custom_id in zip(pending.get("batches") or [], pending.get("custom_ids") or [], strict=True):
+            if custom_id in results:
+                # The job reports one usage total; attribute it to the first batch.
+                collected.append((list(batch), results[custom_id], usage))
+                usage = 0
+        return collected
+    remaining = sum(len(batch) for batch in batches)
+    if (
+        not settings.review_use_batch_api
+        or remaining < settings.review_batch_api_min_sections
+        or not hasattr(llm, "submit_batch")
+    ):
+        return _run_review_batches(batches, review, settings)
+    requests: list[tuple[str, list[Any]]] = []
+    for idx, batch in enumerate(batches):
+        messages = build_messages(batch)
+        digest = hashlib.sha256("\x1f".join(m.content for m in messages).encode("utf-8")).hexdigest()
+        requests.append((f"{agent_key}:{idx}:{digest}", messages))
+    batch_id = llm.submit_batch(model or settings.reviewer_model, requests)
+    state["batch_api"] = {
+        "id": batch_id,
+        "batches": batches,
+        "custom_ids": [custom_id for custom_id, _ in requests],
+    }
+    persist()
+    return []
+
+
+def _add_review_tokens(progress: Dict[str, Any], model: str, tokens: int, agent_key: Optional[str] = None) -> None:
+    """Add usage to the cycle totals and, with ``agent_key``, to that agent's own tally.
+
+    The per-agent tally is what lets concurrently running agents merge their progress.
+    """
+    progress["tokens_total"] = progress.get("tokens_total", 0) + tokens
+    if tokens:
+        by_model = progress.setdefault("tokens_total_by_model", {})
+        by_model[model] = by_model.get(model, 0) + tokens
+    if agent_key is not None:
+        state = progress[agent_key]
+        state["tokens"] = state.get("tokens", 0) + tokens
+        if tokens:
+            state_by_model = state.setdefault("tokens_by_model", {})
+            state_by_model[model] = state_by_model.get(model, 0) + tokens
+
+
+def _escalate_review_entries(
+    entries: list[Any],
+    escalate: Callable[[str], tuple[str, int]],
+    progress: Dict[str, Any],
+    settings: Settings,
+    agent_key: Optional[str] = None,
+) -> list[Any]:
+    """Re-review sections a downshifted reviewer flagged with ``escalate`` on the reviewer model."""
+    result: list[Any] = []
+    for entry in entries:
+        if (
+            isinstance(entry, Mapping)
+            and entry.get("section_id") is not None
+            and (entry.get("escalate") or entry.get("needs_deep_review"))
+        ):
+            sid = str(entry.get("section_id"))
+            raw, usage = escalate(sid)
+            _add_review_tokens(progress, settings.reviewer_model, usage, agent_key)
+            try:
+                parsed = json_utils.loads(raw)
+            except Exception:
+                parsed = {}
+            replacements = parsed.get("sections") if isinstance(parsed, Mapping) else None
+            for candidate in replacements if isinstance(replacements, list) else []:
+                if isinstance(candidate, Mapping) and str(candidate.get("section_id")) == sid:
+                    entry = candidate
+                    break
+        result.append(entry)
+    return result
+
+
+def _requeue_review(queue_name: str, data: Mapping[str, Any], agent_state: Mapping[str, Any], settings: Settings) -> None:
+    """Re-enqueue a review stage; while a Batch API job is running, schedule the next poll."""
+    if agent_state.get("batch_api"):
+        send_queue_message(queue_name, _strip_review_payload(data), delay_s=settings.review_batch_api_poll_s)
+    else:
+        send_queue_message(queue_name, _strip_review_payload(data))
+
+
+def _cached_reviewer_call(
+    agent_name: str,
+    call: Callable[..., str],
+    llm: LLMClient,
+    settings: Settings,
+    job_paths: JobStoragePaths,
+    model: Optional[str] = None,
+) -> Callable[..., tuple[str, int]]:
+    """Wrap a reviewer batch method with a content-addressed blob cache.
+
+    The wrapper returns ``(json, tokens)``; hits cost no tokens. Calls are only cached when
+    the client sends no sampling temperature for the reviewer model. Entries live under the
+    job's root, so they are only reused within the job (across cycles and redeliveries)
+    and go away with the job's blobs.
+    """
+    model = model or settings.reviewer_model
+    cacheable = settings.review_cache_enabled and not llm.supports_sampling(model)
+
+    def _call(*, plan: Mapping[str, Any], markdown: str, sections: list[dict]) -> tuple[str, int]:
+        if not cacheable:
+            result = call(plan=plan, markdown=markdown, sections=sections)
+            return result, _usage_total(getattr(llm, "last_usage", None))
+        key = hashlib.sha256(
+            b"|".join(
+                [
+                    agent_name.encode("utf-8"),
+                    model.encode("utf-8"),
+                    json_utils.dumps_bytes(plan),
+                    markdown.encode("utf-8"),
+                    json_utils.dumps_bytes(sections),
+                ]
+            )
+        ).hexdigest()
+        blob = job_paths.relative(f"cache/reviewer/{key}.json")
+        store = get_blob_store()
+        try:
+            return store.get_text(blob=blob), 0
+        except Exception:
+            pass
+        result = call(plan=plan, markdown=markdown, sections=sections)
+        usage = _usage_total(getattr(llm, "last_usage", None))
+        if result and result.strip() != "{}":
+            try:
+                store.put_text(blob=blob, text=result)
+            except Exception as exc:
+                track_exception(exc, {"stage": "REVIEW", "agent": agent_name, "action": "cache_put"})
+        return result, usage
+
+    return _call
+
+
 def _review_progress_path(job_paths: JobStoragePaths, cycle_idx: int) -> str:
     return job_paths.cycle(cycle_idx, "review_progress.json")
 
@@ -212,35 +578,325 @@ def _review_progress_path(job_paths: JobStoragePaths, cycle_idx: int) -> str:
 def _load_review_progress(job_paths: JobStoragePaths, cycle_idx: int) -> Dict[str, Any]:
     progress = _init_review_progress(None)
     try:
-        store = BlobStore()
+        store = get_blob_store()
         text = store.get_text(blob=_review_progress_path(job_paths, cycle_idx))
-        loaded = json.loads(text)
+        loaded = json_utils.loads(text)
         progress = _init_review_progress(loaded)
+        _load_review_deltas(store, job_paths, cycle_idx, progress)
     except Exception:
         pass
     return progress
 
 
-def _persist_review_progress(job_paths: JobStoragePaths, cycle_idx: int, progress: Dict[str, Any]) -> None:
+def _review_delta_prefix(job_paths: JobStoragePaths, cycle_idx: int, agent_key: str) -> str:
+    return job_paths.cycle(cycle_idx, f"review_progress_{agent_key}_")
+
+
+def _review_delta_mark(progress: Mapping[str, Any], agent_key: str) -> Dict[str, Any]:
+    """Record an agent's progress before a message's batches so they can be persisted as a delta."""
+    state = progress[agent_key]
+    accumulated = state.get("accumulated") or {}
+    return {
+        "agent": agent_key,
+        "tokens": state.get("tokens", 0),
+        "tokens_by_model": dict(state.get("tokens_by_model") or {}),
+        "sections_done": set(state.get("sections_done") or []),
+        "lengths": {key: len(value) for key, value in accumulated.items() if isinstance(value, list)},
+        "values": {key: value for key, value in accumulated.items() if not isinstance(value, list)},
+    }
+
+
+def _review_delta(progress: Mapping[str, Any], mark: Mapping[str, Any]) -> Dict[str, Any]:
+    state = progress[mark["agent"]]
+    accumulated = state.get("accumulated") or {}
+    lengths = mark["lengths"]
+    values = mark["values"]
+    return {
+        "batch_idx": state["delta_seq"],
+        "new_sections": [sid for sid in state.get("sections_done") or [] if sid not in mark["sections_done"]],
+        "tokens": state.get("tokens", 0) - mark["tokens"],
+        "tokens_by_model": {
+            model: tokens - mark["tokens_by_model"].get(model, 0)
+            for model, tokens in (state.get("tokens_by_model") or {}).items()
+            if tokens != mark["tokens_by_model"].get(model, 0)
+        },
+        "delta_accumulated": {
+            key: value[lengths.get(key, 0):]
+            for key, value in accumulated.items()
+            if isinstance(value, list) and len(value) > lengths.get(key, 0)
+        },
+        "replaced": {
+            key: value
+            for key, value in accumulated.items()
+            if not isinstance(value, list) and (key not in values or values[key] != value)
+        },
+    }
+
+
+def _fold_review_delta(progress: Dict[str, Any], agent_key: str, delta: Mapping[str, Any]) -> None:
+    state = progress[agent_key]
+    done_set = _sections_done_set(state)
+    for sid in delta.get("new_sections") or []:
+        if sid not in done_set:
+            insort(state["sections_done"], sid)
+            done_set.add(sid)
+    accumulated = state.get("accumulated") or {}
+    for key, items in (delta.get("delta_accumulated") or {}).items():
+        accumulated.setdefault(key, []).extend(items)
+    accumulated.update(delta.get("replaced") or {})
+    state["accumulated"] = accumulated
+    tokens_total = int(delta.get("tokens") or 0)
+    progress["tokens_total"] = progress.get("tokens_total", 0) + tokens_total
+    state["tokens"] = state.get("tokens", 0) + tokens_total
+    for model, tokens in (delta.get("tokens_by_model") or {}).items():
+        for by_model in (progress.setdefault("tokens_total_by_model", {}), state.setdefault("tokens_by_model", {})):
+            by_model[model] = by_model.get(model, 0) + int(tokens or 0)
+    state["delta_seq"] = int(delta["batch_idx"]) + 1
+
+
+def _load_review_deltas(store: BlobStore, job_paths: JobStoragePaths, cycle_idx: int, progress: Dict[str, Any]) -> None:
+    for agent_key in REVIEW_AGENT_STAGES:
+        state = progress.get(agent_key)
+        if not isinstance(state, dict) or state.get("done") or "delta_seq" not in state:
+            continue
+        pending: list[tuple[int, str]] = []
+        for name in store.list_blobs(_review_delta_prefix(job_paths, cycle_idx, agent_key)):
+            try:
+                idx = int(name.rsplit("_", 1)[1].split(".", 1)[0])
+            except (IndexError, ValueError):
+                continue
+            if idx >= state["delta_seq"]:
+                pending.append((idx, name))
+        for idx, name in sorted(pending):
+            if idx != state["delta_seq"]:
+                break
+            _fold_review_delta(progress, agent_key, json_utils.loads(store.get_bytes(blob=name)))
+
+
+def _persisted_review_progress(progress: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        key: {k: v for k, v in value.items() if k != "_done_set"} if isinstance(value, dict) else value
+        for key, value in progress.items()
+    }
+
+
+def _merge_review_progress(store: BlobStore, blob: str, progress: Dict[str, Any], agent_key: str) -> bool:
+    """Replace only ``agent_key``'s state in the stored snapshot, retrying on ETag conflicts.
+
+    Cycle token totals are rebased on the stored snapshot using the agent's own tally.
+    On success ``progress`` is refreshed with the other agents' stored state. Returns True
+    when this save is the one that finds style, cohesion and summary all done; it also
+    sets ``verify_queued`` so no later save (or redelivery) claims verification again.
+    """
+    own = progress[agent_key]
+    for _ in range(_REVIEW_PROGRESS_MERGE_ATTEMPTS):
+        raw, etag = store.get_bytes_with_etag(blob=blob)
+        stored = _init_review_progress(json_utils.loads(raw) if raw is not None else None)
+        previous = stored.get(agent_key) or {}
+        merged = {**stored, agent_key: own}
+        merged["tokens_total"] = stored.get("tokens_total", 0) - previous.get("tokens", 0) + own.get("tokens", 0)
+        by_model = dict(stored.get("tokens_total_by_model") or {})
+        for model, tokens in (previous.get("tokens_by_model") or {}).items():
+            by_model[model] = by_model.get(model, 0) - tokens
+        for model, tokens in (own.get("tokens_by_model") or {}).items():
+            by_model[model] = by_model.get(model, 0) + tokens
+        merged["tokens_total_by_model"] = by_model
+        if "draft_cache" in progress:
+            merged.setdefault("draft_cache", progress["draft_cache"])
+        completes_review = not stored.get("verify_queued") and all(
+            merged[key].get("done") for key in _PARALLEL_REVIEW_AGENTS
+        )
+        if completes_review:
+            merged["verify_queued"] = True
+        data_bytes, encoding = compress_bytes(json_utils.dumps_bytes(_persisted_review_progress(merged)))
+        if store.put_bytes_if(blob=blob, data_bytes=data_bytes, etag=etag, content_encoding=encoding):
+            progress.update(merged)
+            return completes_review
+    raise RuntimeError(f"Review progress kept changing while saving {agent_key}; gave up")
+
+
+def _review_delta_blob(job_paths: JobStoragePaths, cycle_idx: int, agent_key: str, batch_idx: int) -> str:
+    return f"{_review_delta_prefix(job_paths, cycle_idx, agent_key)}{batch_idx:05d}.jsonl"
+
+
+def _advance_review_delta_base(progress: Dict[str, Any], agent_keys: Iterable[str]) -> Dict[str, range]:
+    """Mark the agents' deltas as folded into the snapshot about to be written.
+
+    Returns the delta indexes that become prunable once that snapshot is saved.
+    """
+    prunable: Dict[str, range] = {}
+    for agent_key in agent_keys:
+        state = progress[agent_key]
+        if "delta_seq" not in state:
+            continue
+        base = state.get("delta_base", 0)
+        state["delta_base"] = state["delta_seq"]
+        if state["delta_seq"] > base:
+            prunable[agent_key] = range(base, state["delta_seq"])
+    return prunable
+
+
+def _prune_review_deltas(job_paths: JobStoragePaths, cycle_idx: int, prunable: Mapping[str, range]) -> None:
+    """Delete delta blobs a saved snapshot already contains; failures only leave garbage behind."""
+    store = get_blob_store()
+    for agent_key, indexes in prunable.items():
+        for batch_idx in indexes:
+            try:
+                store.delete_blob(blob=_review_delta_blob(job_paths, cycle_idx, agent_key, batch_idx))
+            except Exception as exc:
+                track_exception(exc, {"job_id": job_paths.job_id, "stage": "REVIEW", "action": "prune_progress"})
+                return
+
+
+def _write_review_delta(
+    job_paths: JobStoragePaths, cycle_idx: int, progress: Dict[str, Any], delta_mark: Mapping[str, Any]
+) -> None:
+    """Write what changed since ``delta_mark`` as the agent's next numbered delta blob."""
+    agent_key = delta_mark["agent"]
+    try:
+        delta = _review_delta(progress, delta_mark)
+        get_blob_store().put_bytes(
+            blob=_review_delta_blob(job_paths, cycle_idx, agent_key, delta["batch_idx"]),
+            data_bytes=json_utils.dumps_bytes(delta) + b"\n",
+        )
+        progress[agent_key]["delta_seq"] = delta["batch_idx"] + 1
+    except Exception as exc:
+        track_exception(exc, {"job_id": job_paths.job_id, "stage": "REVIEW", "action": "persist_progress"})
+
+
+def _write_review_snapshot(job_paths: JobStoragePaths, cycle_idx: int, progress: Dict[str, Any]) -> None:
+    """Overwrite the whole progress snapshot; used by the general reviewer, which runs alone."""
+    prunable = _advance_review_delta_base(progress, REVIEW_AGENT_STAGES)
     try:
-        store = BlobStore()
-        store.put_text(blob=_review_progress_path(job_paths, cycle_idx), text=json.dumps(progress, ensure_ascii=False))
+        data_bytes, encoding = compress_bytes(json_utils.dumps_bytes(_persisted_review_progress(progress)))
+        get_blob_store().put_bytes(
+            blob=_review_progress_path(job_paths, cycle_idx), data_bytes=data_bytes, content_encoding=encoding
+        )
     except Exception as exc:
         track_exception(exc, {"job_id": job_paths.job_id, "stage": "REVIEW", "action": "persist_progress"})
+        return
+    _prune_review_deltas(job_paths, cycle_idx, prunable)
+
+
+def _merge_review_snapshot(
+    job_paths: JobStoragePaths, cycle_idx: int, progress: Dict[str, Any], agent_key: str
+) -> bool:
+    """Merge one parallel agent's state into the snapshot; errors propagate (see ``_merge_review_progress``)."""
+    prunable = _advance_review_delta_base(progress, (agent_key,))
+    completes_review = _merge_review_progress(
+        get_blob_store(), _review_progress_path(job_paths, cycle_idx), progress, agent_key
+    )
+    _prune_review_deltas(job_paths, cycle_idx, prunable)
+    return completes_review
+
+
+def _persist_review_progress(
+    job_paths: JobStoragePaths,
+    cycle_idx: int,
+    progress: Dict[str, Any],
+    *,
+    delta_mark: Optional[Mapping[str, Any]] = None,
+    agent_key: Optional[str] = None,
+) -> bool:
+    """Persist review progress.
+
+    With ``delta_mark`` (intermediate batches), only what changed since the mark is written
+    to a numbered ``review_progress_<agent>_<n>.jsonl`` blob. The first intermediate write
+    for an agent, every ``_REVIEW_DELTA_COMPACT_AFTER``-th one and every final write are
+    full snapshots, after which the deltas they fold in are deleted. Style, cohesion and
+    summary run concurrently, so they pass ``agent_key`` and their snapshots are merged
+    rather than overwritten.
+
+    Merges raise on failure: they carry the completion flags the verify barrier waits on,
+    so the message must be redelivered rather than dropped. Other writes are checkpoints
+    and only report errors. Returns True only for the merge that completes the parallel
+    review (see ``_merge_review_progress``).
+    """
+    if delta_mark is not None:
+        state = progress[delta_mark["agent"]]
+        if "delta_seq" in state and state["delta_seq"] - state.get("delta_base", 0) < _REVIEW_DELTA_COMPACT_AFTER:
+            _write_review_delta(job_paths, cycle_idx, progress, delta_mark)
+            return False
+        state.setdefault("delta_seq", 0)
+    if agent_key is not None:
+        return _merge_review_snapshot(job_paths, cycle_idx, progress, agent_key)
+    _write_review_snapshot(job_paths, cycle_idx, progress)
+    return False
+
+
+def _review_sections_path(job_paths: JobStoragePaths, cycle_idx: int) -> str:
+    return job_paths.cycle(cycle_idx, "review_sections.json")
+
+
+def _review_draft_view(
+    data: Dict[str, Any], progress: Dict[str, Any], job_paths: JobStoragePaths, cycle_idx: int
+) -> tuple[Optional[str], Dict[str, str], list[str]]:
+    """Draft sections and review order, parsed once per cycle.
+
+    The draft only changes between cycles (rewrite). Review progress keeps just the draft
+    digest and section order; the parsed sections go to a per-cycle sidecar blob stamped
+    with the same digest. The draft text is returned only when it was downloaded; a draft
+    without section markers is never cached.
+    """
+    cache = progress.get("draft_cache")
+    if isinstance(cache, Mapping) and cache.get("blob") == data["out"] and cache.get("digest"):
+        try:
+            sidecar = json_utils.loads(get_blob_store().get_bytes(blob=_review_sections_path(job_paths, cycle_idx)))
+        except Exception:
+            sidecar = None
+        if isinstance(sidecar, Mapping) and sidecar.get("digest") == cache["digest"] and sidecar.get("sections"):
+            return None, dict(sidecar["sections"]), list(cache.get("ordered_ids") or [])
+    store = get_blob_store()
+    draft = store.get_text(blob=data["out"])
+    sections = extract_sections(draft)
+    ordered_ids = _ordered_section_ids(data, sections)
+    if sections:
+        digest = _draft_digest(draft)
+        try:
+            data_bytes, encoding = compress_bytes(json_utils.dumps_bytes({"digest": digest, "sections": sections}))
+            store.put_bytes(
+                blob=_review_sections_path(job_paths, cycle_idx), data_bytes=data_bytes, content_encoding=encoding
+            )
+        except Exception as exc:
+            track_exception(exc, {"job_id": job_paths.job_id, "stage": "REVIEW", "action": "cache_sections"})
+        else:
+            progress["draft_cache"] = {"blob": data["out"], "digest": digest, "ordered_ids": ordered_ids}
+    return draft, sections, ordered_ids
 
 
 def _strip_review_payload(data: Mapping[str, Any]) -> Dict[str, Any]:
-    return {k: v for k, v in data.items() if k not in {"review_progress", "review_json", "style_json", "cohesion_json", "exec_summary_json"}}
+    """Payload to forward without bulky review artifacts; the result is only ever enqueued."""
+    if isinstance(data, dict) and _REVIEW_PAYLOAD_KEYS.isdisjoint(data):
+        # Nothing to strip; send_queue_message serializes a sanitized copy anyway.
+        return data
+    stripped = dict(data)
+    for key in _REVIEW_PAYLOAD_KEYS:
+        stripped.pop(key, None)
+    return stripped
 
 
 def _apply_diagram_results(text: str, results: List[Dict[str, Any]], job_paths: JobStoragePaths) -> str:
     if not results:
         return text
 
-    updated = text
-    fallback_pattern = re.compile(r"```plantuml\s+([\s\S]*?)```", flags=re.IGNORECASE)
-    inline_uml_pattern = re.compile(r"@startuml[\s\S]*?@enduml", flags=re.IGNORECASE)
     root_prefix = f"{job_paths.root}/"
+    # Locate every replacement site against the original text once, then splice in a single pass.
+    edits: list[tuple[int, int, str]] = []
+    fallback_blocks: list[re.Match[str]] | None = None
+    inline_blocks: list[re.Match[str]] | None = None
+
+    def _is_free(start: int, end: int) -> bool:
+        return all(end <= s or start >= e for s, e, _ in edits)
+
+    def _claim_block(matches: list[re.Match[str]], diagram_id: str, replacement: str) -> bool:
+        markers = (f"diagram_id: {diagram_id}", f"diagram_id:{diagram_id}")
+        for match in matches:
+            block = match.group(0)
+            if (markers[0] in block or markers[1] in block) and _is_free(match.start(), match.end()):
+                edits.append((match.start(), match.end(), replacement))
+                return True
+        return False
+
     for item in results:
         code_block = item.get("code_block")
         blob_path = item.get("relative_path") or item.get("blob_path")
@@ -250,23 +906,22 @@ def _apply_diagram_results(text: str, results: List[Dict[str, Any]], job_paths:
         alt_text = item.get("alt_text") or (f"Diagram {diagram_id}" if diagram_id else "Diagram")
         replacement = f"![{alt_text}]({relative_path})"
         replaced = False
-        if code_block and code_block in updated:
-            updated = updated.replace(code_block, replacement, 1)
-            replaced = True
-        if not replaced and diagram_id:
-            for match in fallback_pattern.finditer(updated):
-                block = match.group(0)
-                if f"diagram_id: {diagram_id}" in block or f"diagram_id:{diagram_id}" in block:
-                    updated = updated.replace(block, replacement, 1)
+        if code_block:
+            pos = text.find(code_block)
+            while pos != -1:
+                if _is_free(pos, pos + len(code_block)):
+                    edits.append((pos, pos + len(code_block), replacement))
                     replaced = True
                     break
+                pos = text.find(code_block, pos + 1)
         if not replaced and diagram_id:
-            for match in inline_uml_pattern.finditer(updated):
-                block = match.group(0)
-                if f"diagram_id: {diagram_id}" in block or f"diagram_id:{diagram_id}" in block:
-                    updated = updated.replace(block, replacement, 1)
-                    replaced = True
-                    break
+            if fallback_blocks is None:
+                fallback_blocks = list(_FALLBACK_PLANTUML_RE.finditer(text))
+            replaced = _claim_block(fallback_blocks, diagram_id, replacement)
+        if not replaced and diagram_id:
+            if inline_blocks is None:
+                inline_blocks = list(_INLINE_UML_RE.finditer(text))
+            replaced = _claim_block(inline_blocks, diagram_id, replacement)
         if not replaced:
             alt_text = item.get("alt_text").strip()
             if not alt_text:
@@ -279,7 +934,28 @@ def _apply_diagram_results(text: str, results: List[Dict[str, Any]], job_paths:
                 job_paths.job_id,
                 diagram_id,
             )
-    return updated
+    if not edits:
+        return text
+    parts: list[str] = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+_utc_date_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_date_string() -> str:
+    """Current UTC date as YYYY-MM-DD, formatted once per day."""
+    global _utc_date_cache
+    day = int(time.time() // 86400)
+    if _utc_date_cache[0] != day:
+        _utc_date_cache = (day, time.strftime("%Y-%m-%d", time.gmtime(day * 86400)))
+    return _utc_date_cache[1]
 
 
 def _build_title_page(plan: Dict[str, Any], metadata: Dict[str, Any]) -> str:
@@ -290,7 +966,7 @@ def _build_title_page(plan: Dict[str, Any], metadata: Dict[str, Any]) -> str:
     if not audience:
         audience = str(metadata.get("audience") or "").strip()
     job_id = metadata.get("job_id")
-    generated_on = datetime.utcnow().strftime("%Y-%m-%d")
+    generated_on = _utc_date_string()
 
     lines: List[str] = ["<!-- TITLE_PAGE_START -->", f"# {title}", ""]
     lines.append("")  # spacer
@@ -319,6 +995,7 @@ def _format_duration(duration_s: float | None) -> str:
     return f"{seconds} sec"
 
 
+@lru_cache(maxsize=64)
 def _pretty_stage(stage: str) -> str:
     return stage.replace("_", " ").title()
 
@@ -346,14 +1023,12 @@ def _build_stage_message(
 def _usage_total(usage: Optional[Dict[str, Optional[int]]]) -> int:
     if not usage:
         return 0
-    total = usage.get("total_tokens")
-    if isinstance(total, int) and total >= 0:
-        return total
-    prompt = usage.get("prompt_tokens") or 0
-    completion = usage.get("completion_tokens") or 0
     try:
-        return int(prompt or 0) + int(completion or 0)
-    except Exception:
+        total = usage.get("total_tokens")
+        if total:
+            return max(0, int(total))
+        return int(usage.get("prompt_tokens") or 0) + int(usage.get("completion_tokens") or 0)
+    except (TypeError, ValueError):
         return 0
 
 
@@ -405,10 +1080,7 @@ def process_plan_intake(data: Dict[str, Any], interviewer: InterviewerAgent | No
         title = data["title"]
         questions = interviewer.propose_questions(title)
         try:
-            store = BlobStore()
-            store.put_text(
-                blob=artifact_path, text=json.dumps(questions, indent=2)
-            )
+            store = get_blob_store()
             context_snapshot = {
                 "job_id": data.get("job_id"),
                 "title": data.get("title"),
@@ -416,22 +1088,21 @@ def process_plan_intake(data: Dict[str, Any], interviewer: InterviewerAgent | No
                 "out": data.get("out"),
                 "user_id": job_paths.user_id,
             }
-            store.put_text(
-                blob=job_paths.intake("context.json"),
-                text=json.dumps(context_snapshot, indent=2),
-            )
             sample_answers = {
                 str(item.get("id")): item.get("sample", "") for item in questions if isinstance(item, dict)
             }
-            store.put_text(
-                blob=job_paths.intake("sample_answers.json"),
-                text=json.dumps(sample_answers, indent=2),
+            store.put_texts(
+                [
+                    (artifact_path, json_utils.dumps(questions, indent=True)),
+                    (job_paths.intake("context.json"), json_utils.dumps(context_snapshot, indent=True)),
+                    (job_paths.intake("sample_answers.json"), json_utils.dumps(sample_answers, indent=True)),
+                ]
             )
         except Exception as exc:
             track_exception(exc, {"job_id": data["job_id"], "stage": "PLAN_INTAKE"})
     question_tokens = _usage_total(getattr(interviewer.llm, "last_usage", None))
     if not question_tokens:
-        question_tokens = _estimate_tokens(json.dumps(questions, ensure_ascii=False))
+        question_tokens = _estimate_structure_tokens(questions)
     intake_details = _with_cycle_metadata(
         {
             "duration_s": timing.duration_s,
@@ -474,9 +1145,9 @@ def process_intake_resume(data: Dict[str, Any]) -> None:
         needs_context = any(data.get(key) in (None, "", []) for key in needed_keys)
         if needs_context:
             try:
-                store = BlobStore()
+                store = get_blob_store()
                 context_text = store.get_text(blob=job_paths.intake("context.json"))
-                context = json.loads(context_text)
+                context = json_utils.loads(context_text)
             except Exception as exc:
                 context = None
                 track_exception(exc, {"job_id": job_id, "stage": "INTAKE_RESUME", "operation": "load_intake_context"})
@@ -526,7 +1197,7 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
     job_paths = _job_paths(data)
     store: BlobStore | None = None
     try:
-        store = BlobStore()
+        store = get_blob_store()
     except Exception:
         store = None
     print(
@@ -544,7 +1215,7 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
         if store:
             try:
                 plan_text = store.get_text(blob=job_paths.plan())
-                existing_plan = json.loads(plan_text)
+                existing_plan = json_utils.loads(plan_text)
                 title = existing_plan.get("title", title)
                 audience = existing_plan.get("audience", audience)
                 if existing_plan.get("length_pages") is not None:
@@ -554,7 +1225,7 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
 
             try:
                 answers_text = store.get_text(blob=job_paths.intake("answers.json"))
-                answers = json.loads(answers_text)
+                answers = json_utils.loads(answers_text)
                 audience = answers.get("audience", audience)
                 title = answers.get("title", title)
                 length_pages = int(answers.get("length_pages", length_pages))
@@ -586,8 +1257,8 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
         "intake_answers": answers,
     }
     try:
-        target_store = store or BlobStore()
-        target_store.put_text(blob=job_paths.plan(), text=json.dumps(payload["plan"], indent=2))
+        target_store = store or get_blob_store()
+        target_store.put_text(blob=job_paths.plan(), text=json_utils.dumps(payload["plan"], indent=True))
     except Exception as exc:
         track_exception(exc, {"job_id": data["job_id"], "stage": "PLAN"})
     publish_stage_event("WRITE", "QUEUED", payload)
@@ -595,7 +1266,7 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
     artifact_path = job_paths.plan()
     plan_tokens = _usage_total(getattr(planner.llm, "last_usage", None))
     if not plan_tokens:
-        plan_tokens = _estimate_tokens(json.dumps(payload["plan"], ensure_ascii=False))
+        plan_tokens = _estimate_structure_tokens(payload["plan"])
     publish_status(
         _stage_completed_event(
             data["job_id"],
@@ -610,6 +1281,44 @@ def process_plan(data: Dict[str, Any], planner: PlannerAgent | None = None) -> N
     print("[worker-plan] Dispatched job", data.get("job_id"), "to writing queue")
 
 
+_DRAFT_CACHE_MAX = 8
+# Keyed by (job_id, blob path); a job's entry is dropped once its last WRITE batch is done.
+_draft_cache: Dict[tuple[str, str], tuple[str, str]] = {}
+_draft_cache_lock = threading.Lock()
+
+
+def _draft_digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _remember_draft(job_id: str, blob_path: str, text: str) -> str:
+    """Keep the last uploaded draft in-process so the next WRITE batch can skip the download."""
+    digest = _draft_digest(text)
+    key = (job_id, blob_path)
+    with _draft_cache_lock:
+        _draft_cache.pop(key, None)
+        _draft_cache[key] = (digest, text)
+        while len(_draft_cache) > _DRAFT_CACHE_MAX:
+            _draft_cache.pop(next(iter(_draft_cache)))
+    return digest
+
+
+def _forget_draft(job_id: str, blob_path: str) -> None:
+    with _draft_cache_lock:
+        _draft_cache.pop((job_id, blob_path), None)
+
+
+def _cached_draft(job_id: str, blob_path: str, digest: Any) -> Optional[str]:
+    """Return the cached draft only when it matches the digest carried in the payload."""
+    if not isinstance(digest, str) or not digest:
+        return None
+    with _draft_cache_lock:
+        cached = _draft_cache.get((job_id, blob_path))
+    if cached and cached[0] == digest:
+        return cached[1]
+    return None
+
+
 def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summarizer: Summarizer | None = None) -> None:
     settings = get_settings()
     writer = writer or WriterAgent()
@@ -618,18 +1327,19 @@ def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summa
     job_paths = _job_paths(data)
     blob_path = data.get("out")
     if not isinstance(blob_path, str) or not blob_path:
-        blob_path = BlobStore().allocate_document_blob(job_paths.job_id, job_paths.user_id)
+        blob_path = get_blob_store().allocate_document_blob(job_paths.job_id, job_paths.user_id)
     write_batch_size = max(1, int(data.get("write_batch_size") or settings.write_batch_size or 5))
 
     tokens_total = int(data.get("write_tokens_total") or 0)
     written_sections_raw = data.get("written_sections") or []
-    written_sections = {str(s) for s in written_sections_raw if s is not None}
+    # Ordered list for the payload, set for membership checks.
+    written_order = list(dict.fromkeys(str(s) for s in written_sections_raw if s is not None))
+    written_sections = set(written_order)
     with stage_timer(job_id=data["job_id"], stage="WRITE", user_id=job_paths.user_id) as timing:
         plan = data["plan"]
         outline = plan.get("outline", [])
-        graph = build_dependency_graph(outline)
-        order = graph.topological_order() if outline else []
-        id_to_section = {str(s.get("id")): s for s in outline}
+        order = _topological_order(outline)
+        id_to_section = _plan_index(data)["id_to_section"]
         dependency_summaries = data.get("dependency_summaries", {})
         renew_lock = data.get("_renew_lock")
         last_lock_renew = time.perf_counter()
@@ -637,8 +1347,9 @@ def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summa
         existing_title_page = ""
         existing_body = ""
         try:
-            store = BlobStore()
-            existing_text = store.get_text(blob=blob_path)
+            existing_text = _cached_draft(job_paths.job_id, blob_path, data.get("draft_digest"))
+            if existing_text is None:
+                existing_text = get_blob_store().get_text(blob=blob_path)
             if TITLE_PAGE_END in existing_text:
                 title_part, rest = existing_text.split(TITLE_PAGE_END, 1)
                 existing_title_page = f"{title_part}{TITLE_PAGE_END}"
@@ -652,24 +1363,59 @@ def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summa
         document_text_parts: list[str] = [existing_body] if existing_body else []
         remaining = [sid for sid in order if sid not in written_sections]
         batch = remaining[:write_batch_size]
-        for idx, sid in enumerate(batch, start=1):
+
+        max_workers = max(1, int(settings.write_concurrency or 1))
+        # With one writer the summaries would be serial round-trips, so each wave's summaries are
+        # requested together instead; with several writers each is summarized as soon as it lands.
+        summarize_inline = max_workers > 1
+
+        def _write_one(sid: str) -> tuple[str, str, int]:
             section = id_to_section[sid]
             deps = section.get("dependencies", []) or []
             dep_context = "\n".join([dependency_summaries.get(str(d), "") for d in deps if dependency_summaries.get(str(d))])
-            section_output = "".join(list(writer.write_section(plan=plan, section=section, dependency_context=dep_context)))
-            document_text_parts.append(section_output)
-            summary = summarizer.summarize_section("\n\n".join(document_text_parts))
-            dependency_summaries[sid] = summary
-            tokens_total += _usage_total(getattr(writer.llm, "last_usage", None))
-            if renew_lock:
-                try:
-                    now = time.perf_counter()
-                    if now - last_lock_renew > 60:  # renew at least once a minute
-                        renew_lock()
-                        last_lock_renew = now
-                except Exception as exc:
-                    track_exception(exc, {"job_id": data["job_id"], "stage": "WRITE", "action": "renew_lock"})
-            written_sections.add(sid)
+            section_output = "".join(writer.write_section(plan=plan, section=section, dependency_context=dep_context))
+            # last_usage is per thread, so this is this section's call even with several writers.
+            usage = _usage_total(getattr(writer.llm, "last_usage", None))
+            # Summarize only the new section on top of its dependencies' summaries rather than
+            # re-sending the whole draft so far; the summaries are already recursive.
+            summary_input = f"{dep_context}\n\n{section_output}" if dep_context else section_output
+            if not summarize_inline:
+                return section_output, summary_input, usage
+            return section_output, summarizer.summarize_section(summary_input), usage
+
+        # Sections whose dependencies are outside the pending set are independent LLM
+        # round-trips, so write each such wave concurrently and keep topological order.
+        outputs: Dict[str, str] = {}
+        pending = list(batch)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="write") as pool:
+            while pending:
+                pending_set = set(pending)
+                wave = [
+                    sid
+                    for sid in pending
+                    if not any(str(d) in pending_set for d in (id_to_section[sid].get("dependencies", []) or []))
+                ] or pending[:1]
+                results = list(pool.map(_write_one, wave))
+                if not summarize_inline:
+                    summaries = summarizer.summarize_sections([summary_input for _, summary_input, _ in results])
+                    results = [(output, summary, usage) for (output, _, usage), summary in zip(results, summaries, strict=True)]
+                for sid, (section_output, summary, usage) in zip(wave, results, strict=True):
+                    outputs[sid] = section_output
+                    dependency_summaries[sid] = summary
+                    tokens_total += usage
+                    written_sections.add(sid)
+                    written_order.append(sid)
+                wave_set = set(wave)
+                pending = [sid for sid in pending if sid not in wave_set]
+                if renew_lock:
+                    try:
+                        now = time.perf_counter()
+                        if now - last_lock_renew > 60:  # renew at least once a minute
+                            renew_lock()
+                            last_lock_renew = now
+                    except Exception as exc:
+                        track_exception(exc, {"job_id": data["job_id"], "stage": "WRITE", "action": "renew_lock"})
+        document_text_parts.extend(outputs[sid] for sid in batch)
         body_text = "\n\n".join(document_text_parts)
         if existing_title_page:
             document_text = f"{existing_title_page}\n\n{body_text}".strip()
@@ -680,15 +1426,16 @@ def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summa
         **data,
         "out": blob_path,
         "dependency_summaries": dependency_summaries,
-        "written_sections": list(written_sections),
+        "written_sections": written_order,
         "write_tokens_total": tokens_total,
         "write_batch_size": write_batch_size,
     }
     try:
-        store = BlobStore()
-        store.put_text(blob=blob_path, text=document_text)
-        store.put_text(blob=job_paths.draft(), text=document_text)
+        targets = dict.fromkeys([blob_path, job_paths.draft()])
+        get_blob_store().put_texts((target, document_text) for target in targets)
+        payload["draft_digest"] = _remember_draft(job_paths.job_id, blob_path, document_text)
     except Exception as exc:
+        payload.pop("draft_digest", None)
         track_exception(exc, {"job_id": data["job_id"], "stage": "WRITE"})
     total_sections = len(order)
     completed_count = len(written_sections)
@@ -697,17 +1444,20 @@ def process_write(data: Dict[str, Any], writer: WriterAgent | None = None, summa
         publish_stage_event("WRITE", "QUEUED", payload, extra={"message": message})
         send_queue_message(settings.sb_queue_write, payload)
         progress_details = {"written": completed_count, "total": total_sections}
-        status_payload = StatusEvent(
-            job_id=data["job_id"],
-            stage="WRITE_IN_PROGRESS",
-            ts=time.time(),
-            message=message,
-            cycle=None,
-            extra={"details": {**progress_details, "tokens": tokens_total}},
-        ).to_payload()
-        publish_status(status_payload)
+        if status_enabled():
+            status_payload = StatusEvent(
+                job_id=data["job_id"],
+                stage="WRITE_IN_PROGRESS",
+                ts=time.time(),
+                message=message,
+                cycle=None,
+                extra={"details": {**progress_details, "tokens": tokens_total}},
+            ).to_payload()
+            publish_status(status_payload)
     else:
         payload.pop("written_sections", None)
+        payload.pop("draft_digest", None)
+        _forget_draft(job_paths.job_id, blob_path)
         tokens_total = tokens_total or _estimate_tokens(document_text)
         publish_stage_event(REVIEW_AGENT_STAGES["general"], "QUEUED", payload)
         send_queue_message(settings.sb_queue_review_general, _strip_review_payload(payload))
@@ -737,6 +1487,7 @@ def _ensure_not_exhausted(cycle_state: CycleState, data: Mapping[str, Any], sett
     return True
 
 
+@OutboundBus()
 def process_review_general(data: Dict[str, Any], reviewer: ReviewerAgent | None = None) -> None:
     agent_stage = REVIEW_AGENT_STAGES["general"]
     settings = get_settings()
@@ -749,25 +1500,25 @@ def process_review_general(data: Dict[str, Any], reviewer: ReviewerAgent | None
     cycle_idx = min(cycle_state.requested, cycle_state.completed + 1)
     progress = _load_review_progress(job_paths, cycle_idx)
     if progress["general"].get("done"):
-        publish_stage_event(agent_stage, "DONE", data, extra={"message": "General review already complete; forwarding to style"})
-        send_queue_message(settings.sb_queue_review_style, _strip_review_payload(data))
+        publish_stage_event(
+            agent_stage, "DONE", data, extra={"message": "General review already complete; forwarding to style, cohesion and summary"}
+        )
+        _fan_out_review(data, settings)
         return
 
     publish_stage_event("REVIEW", "START", data, extra={"message": "Running general reviewer"})
     with stage_timer(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
-        store = BlobStore()
-        draft = store.get_text(blob=data["out"])
-        sections = extract_sections(draft)
-        id_to_section = {str(s.get("id")): s for s in (data.get("plan", {}).get("outline", []) or [])}
-        ordered_section_ids = _ordered_section_ids(data.get("plan", {}), sections)
+        store = get_blob_store()
+        draft, sections, ordered_section_ids = _review_draft_view(data, progress, job_paths, cycle_idx)
+        id_to_section = _plan_index(data)["id_to_section"]
         reviewed_sections = {str(s) for s in progress["general"].get("sections_done", [])}
         dependency_summaries = data.get("dependency_summaries", {}) or {}
 
         if not sections:
             review_json = reviewer.review(plan=data["plan"], draft_markdown=draft)
             data["review_json"] = review_json
-            store.put_text(blob=job_paths.cycle(cycle_idx, "review.json"), text=review_json)
-            progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(reviewer.llm, "last_usage", None))
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "review.json"), text=review_json)
+            _add_review_tokens(progress, settings.reviewer_model, _usage_total(getattr(reviewer.llm, "last_usage", None)), "general")
             progress["general"]["done"] = True
         else:
             batches = _plan_review_batches(
@@ -782,77 +1533,115 @@ def process_review_general(data: Dict[str, Any], reviewer: ReviewerAgent | None
             if not batches:
                 progress["general"]["done"] = True
             else:
-                current_batch = batches[0]
-                batch_text, dep_ids = _build_batch_context(current_batch, sections, id_to_section, dependency_summaries)
-                logger.info(
-                    "General review batch for job %s: targets=%s deps=%s est_tokens=%s",
-                    data.get("job_id"),
-                    current_batch,
-                    dep_ids,
-                    _estimate_tokens(batch_text),
-                )
-                section_meta = [
-                    {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in current_batch
-                ]
-                review_json = reviewer.review_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
-                try:
-                    parsed = json.loads(review_json)
-                except Exception:
-                    parsed = {}
+                def _prompt(batch: list[str]) -> tuple[str, list[dict]]:
+                    batch_text, dep_ids = _build_batch_context(batch, sections, id_to_section, dependency_summaries)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "General review batch for job %s: targets=%s deps=%s est_tokens=%s",
+                            data.get("job_id"),
+                            batch,
+                            dep_ids,
+                            _estimate_tokens(batch_text),
+                        )
+                    section_meta = [
+                        {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in batch
+                    ]
+                    return batch_text, section_meta
+
+                review_batch = _cached_reviewer_call("general", reviewer.review_batch, reviewer.llm, settings, job_paths)
+
+                def _review(batch: list[str]) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt(batch)
+                    return review_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
+
                 accumulated = progress["general"].get("accumulated") or {
                     "findings": [],
                     "suggested_changes": [],
-                    "revised_markdown": draft,
                 }
-                accumulated.setdefault("revised_markdown", draft)
-                findings = accumulated.get("findings") or []
-                suggestions = accumulated.get("suggested_changes") or []
-                entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
-                if isinstance(entries, list):
-                    for entry in entries:
-                        if not isinstance(entry, Mapping):
-                            continue
-                        findings.extend(entry.get("findings") or [])
-                        suggestions.extend(entry.get("suggested_changes") or [])
-                        revised_chunk = entry.get("revised_markdown")
-                        if isinstance(revised_chunk, str) and revised_chunk.strip():
-                            accumulated["revised_markdown"] = merge_revised_markdown(
-                                accumulated.get("revised_markdown") or draft, revised_chunk
-                            )
-                        sid = entry.get("section_id")
-                        if sid is not None:
-                            reviewed_sections.add(str(sid))
-                if not entries:
-                    reviewed_sections.update(current_batch)
-                accumulated["findings"] = findings
-                accumulated["suggested_changes"] = suggestions
+                if not accumulated.get("revised_markdown"):
+                    accumulated["revised_markdown"] = draft if draft is not None else store.get_text(blob=data["out"])
+                findings = accumulated.setdefault("findings", [])
+                suggestions = accumulated.setdefault("suggested_changes", [])
+                progress["general"]["accumulated"] = accumulated
+                delta_mark = _review_delta_mark(progress, "general")
+                batch_results = _collect_review_batches(
+                    "general",
+                    batches,
+                    _review,
+                    lambda batch: reviewer.review_batch_messages(data["plan"], *_prompt(batch)),
+                    reviewer.llm,
+                    progress,
+                    settings,
+                    lambda: _persist_review_progress(job_paths, cycle_idx, progress),
+                )
+                for current_batch, review_json, usage in batch_results:
+                    try:
+                        parsed = json_utils.loads(review_json)
+                    except Exception:
+                        parsed = {}
+                    entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
+                    if isinstance(entries, list):
+                        for entry in entries:
+                            if not isinstance(entry, Mapping):
+                                continue
+                            findings.extend(entry.get("findings") or [])
+                            suggestions.extend(entry.get("suggested_changes") or [])
+                            # Revisions are applied to revised_markdown once the stage completes,
+                            # so intermediate progress deltas stay small.
+                            patch_ops = entry.get("patch_ops")
+                            revised_chunk = entry.get("revised_markdown")
+                            if isinstance(patch_ops, list) and patch_ops:
+                                accumulated.setdefault("revised_chunks", []).append(
+                                    {"section_id": entry.get("section_id"), "patch_ops": patch_ops}
+                                )
+                            elif isinstance(revised_chunk, str) and revised_chunk.strip():
+                                accumulated.setdefault("revised_chunks", []).append(revised_chunk)
+                            sid = entry.get("section_id")
+                            if sid is not None:
+                                reviewed_sections.add(str(sid))
+                    if not entries:
+                        reviewed_sections.update(current_batch)
+                    _add_review_tokens(progress, settings.reviewer_model, usage, "general")
+                batch_size = sum(len(batch) for batch, _, _ in batch_results)
                 progress["general"]["accumulated"] = accumulated
                 progress["general"]["sections_done"] = sorted(reviewed_sections)
-                progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(reviewer.llm, "last_usage", None))
                 remaining_after_batch = [sid for sid in ordered_section_ids if sid not in reviewed_sections]
                 if remaining_after_batch:
-                    message = f"General review: {len(reviewed_sections)} of {len(ordered_section_ids)} sections (batch size {len(current_batch)})"
+                    message = f"General review: {len(reviewed_sections)} of {len(ordered_section_ids)} sections (batch size {batch_size})"
                     publish_stage_event(agent_stage, "QUEUED", data, extra={"message": message})
-                    _persist_review_progress(job_paths, cycle_idx, progress)
-                    send_queue_message(settings.sb_queue_review_general, _strip_review_payload(data))
-                    status_payload = StatusEvent(
-                        job_id=data["job_id"],
-                        stage=f"{agent_stage}_IN_PROGRESS",
-                        ts=time.time(),
-                        message=message,
-                        cycle=cycle_idx,
-                        extra={
-                            "details": {
-                                "agent": "general",
-                                "completed_sections": list(reviewed_sections),
-                                "remaining_sections": remaining_after_batch,
-                            }
-                        },
-                    ).to_payload()
-                    publish_status(status_payload)
+                    _persist_review_progress(job_paths, cycle_idx, progress, delta_mark=delta_mark)
+                    _requeue_review(settings.sb_queue_review_general, data, progress["general"], settings)
+                    if status_enabled():
+                        status_payload = StatusEvent(
+                            job_id=data["job_id"],
+                            stage=f"{agent_stage}_IN_PROGRESS",
+                            ts=time.time(),
+                            message=message,
+                            cycle=cycle_idx,
+                            extra={
+                                "details": {
+                                    "agent": "general",
+                                    "completed_sections": list(reviewed_sections),
+                                    "remaining_sections": remaining_after_batch,
+                                }
+                            },
+                        ).to_payload()
+                        publish_status(status_payload)
                     return
-                final_review_json = json.dumps(progress["general"].get("accumulated", {}), ensure_ascii=False)
-                store.put_text(blob=job_paths.cycle(cycle_idx, "review.json"), text=final_review_json)
+                revised_markdown = accumulated["revised_markdown"]
+                for revised_chunk in accumulated.pop("revised_chunks", []):
+                    if isinstance(revised_chunk, Mapping):
+                        section_id = revised_chunk.get("section_id")
+                        revised_markdown = apply_patch_ops(
+                            revised_markdown,
+                            revised_chunk.get("patch_ops"),
+                            str(section_id) if section_id is not None else None,
+                        )
+                    else:
+                        revised_markdown = merge_revised_markdown(revised_markdown, revised_chunk)
+                accumulated["revised_markdown"] = revised_markdown
+                final_review_json = json_utils.dumps(progress["general"].get("accumulated", {}))
+                store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "review.json"), text=final_review_json)
                 progress["general"]["done"] = True
 
     try:
@@ -862,18 +1651,53 @@ def process_review_general(data: Dict[str, Any], reviewer: ReviewerAgent | None
         track_exception(exc, {"job_id": data["job_id"], "stage": "REVIEW", "action": "renew_lock"})
 
     _persist_review_progress(job_paths, cycle_idx, progress)
-    message = "General review complete; queuing style reviewer"
+    message = "General review complete; queuing style, cohesion and summary reviewers"
     publish_stage_event(agent_stage, "DONE", data, extra={"message": message})
-    send_queue_message(settings.sb_queue_review_style, _strip_review_payload(data))
-    status_payload = StatusEvent(
-        job_id=data["job_id"],
-        stage=f"{agent_stage}_DONE",
-        ts=time.time(),
-        message=message,
-        cycle=cycle_idx,
-        extra={"details": {"agent": "general", "completed_sections": progress["general"].get("sections_done", [])}},
-    ).to_payload()
-    publish_status(status_payload)
+    _fan_out_review(data, settings)
+    if status_enabled():
+        status_payload = StatusEvent(
+            job_id=data["job_id"],
+            stage=f"{agent_stage}_DONE",
+            ts=time.time(),
+            message=message,
+            cycle=cycle_idx,
+            extra={"details": {"agent": "general", "completed_sections": progress["general"].get("sections_done", [])}},
+        ).to_payload()
+        publish_status(status_payload)
+
+
+def _fan_out_review(data: Mapping[str, Any], settings: Settings) -> None:
+    payload = _strip_review_payload(data)
+    for queue_name in (settings.sb_queue_review_style, settings.sb_queue_review_cohesion, settings.sb_queue_review_summary):
+        send_queue_message(queue_name, payload)
+
+
+def _complete_review(
+    data: Mapping[str, Any],
+    progress: Mapping[str, Any],
+    job_paths: JobStoragePaths,
+    cycle_idx: int,
+    settings: Settings,
+    timing: Optional[StageTiming] = None,
+) -> None:
+    """Queue verification and publish REVIEW completion for the cycle.
+
+    Only the agent whose progress merge set ``verify_queued`` calls this, so verification
+    is queued once per cycle even when style, cohesion or summary messages are redelivered.
+    """
+    send_queue_message(settings.sb_queue_verify, _strip_review_payload(data))
+    publish_status(
+        _stage_completed_event(
+            data["job_id"],
+            "REVIEW",
+            timing
+            or StageTiming(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, start=time.perf_counter(), duration_s=0.0),
+            artifact=job_paths.cycle(cycle_idx, "review.json"),
+            tokens=int(progress.get("tokens_total") or 0),
+            model=settings.reviewer_model,
+            source=data,
+        )
+    )
 
 
 def _accumulate_section_guidance(
@@ -886,9 +1710,9 @@ def _accumulate_section_guidance(
     extra_fields: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     agent_state = progress[agent_key]
-    accumulated = agent_state.get("accumulated") or {"issues": [], "suggestions": [], "sections": []}
-    accumulated["issues"] = (accumulated.get("issues") or []) + (issues or [])
-    accumulated["suggestions"] = (accumulated.get("suggestions") or []) + (suggestions or [])
+    accumulated = agent_state.get("accumulated") or {}
+    accumulated.setdefault("issues", []).extend(issues or [])
+    accumulated.setdefault("suggestions", []).extend(suggestions or [])
     section_entry: Dict[str, Any] = {
         "section_id": section_id,
         "title": section_title,
@@ -897,20 +1721,73 @@ def _accumulate_section_guidance(
     }
     if extra_fields:
         section_entry.update(extra_fields)
-    sections_list = accumulated.get("sections") or []
-    sections_list.append(section_entry)
-    accumulated["sections"] = sections_list
+    accumulated.setdefault("sections", []).append(section_entry)
     agent_state["accumulated"] = accumulated
-    sections_done = set(agent_state.get("sections_done") or [])
-    sections_done.add(section_id)
-    agent_state["sections_done"] = sorted(sections_done)
+    done_set = _sections_done_set(agent_state)
+    if section_id not in done_set:
+        insort(agent_state["sections_done"], section_id)
+        done_set.add(section_id)
     return progress
 
 
+def _apply_review_entries(
+    progress: Dict[str, Any],
+    agent_key: str,
+    entries: Any,
+    batch: list[str],
+    id_to_section: Mapping[str, Mapping[str, Any]],
+    extra_field_map: Optional[Mapping[str, Callable[[Mapping[str, Any]], Any]]] = None,
+) -> None:
+    """Accumulate one batch's per-section reviewer entries; a batch without entries counts as reviewed."""
+    accumulate = _accumulate_section_guidance
+    section_for = id_to_section.get
+    if isinstance(entries, list):
+        extra_items = tuple((extra_field_map or {}).items())
+        for entry in entries:
+            if not isinstance(entry, Mapping):
+                continue
+            get = entry.get
+            raw_sid = get("section_id")
+            sid = str(raw_sid) if raw_sid is not None else None
+            if not sid:
+                continue
+            issues = get("issues")
+            suggestions = get("suggestions")
+            extras: Dict[str, Any] = {}
+            for field, extract in extra_items:
+                value = extract(entry)
+                if value:
+                    extras[field] = value
+            accumulate(
+                progress,
+                agent_key,
+                sid,
+                section_for(sid, {}).get("title"),
+                issues if isinstance(issues, list) else [],
+                suggestions if isinstance(suggestions, list) else [],
+                extras,
+            )
+    if not entries:
+        for sid in batch:
+            accumulate(progress, agent_key, sid, section_for(sid, {}).get("title"), [], [])
+
+
+def _sections_done_set(agent_state: Dict[str, Any]) -> set[str]:
+    """Membership set mirroring the sorted sections_done list; never persisted."""
+    done_set = agent_state.get("_done_set")
+    if done_set is None:
+        done_set = set(agent_state.get("sections_done") or [])
+        agent_state["sections_done"] = sorted(done_set)
+        agent_state["_done_set"] = done_set
+    return done_set
+
+
+@OutboundBus()
 def process_review_style(data: Dict[str, Any], style_agent: StyleReviewerAgent | None = None) -> None:
     agent_stage = REVIEW_AGENT_STAGES["style"]
     settings = get_settings()
     style_agent = style_agent or StyleReviewerAgent()
+    agent_model = getattr(style_agent, "model", None) or settings.reviewer_model
     cycle_state = ensure_cycle_state(data)
     job_paths = _job_paths(data)
     if not _ensure_not_exhausted(cycle_state, data, settings):
@@ -920,29 +1797,27 @@ def process_review_style(data: Dict[str, Any], style_agent: StyleReviewerAgent |
     if not settings.review_style_enabled:
         publish_stage_event(agent_stage, "SKIPPED", data, extra={"message": "Style review disabled; skipping"})
         progress["style"]["done"] = True
-        _persist_review_progress(job_paths, cycle_idx, progress)
-        send_queue_message(settings.sb_queue_review_cohesion, _strip_review_payload(data))
+        if _persist_review_progress(job_paths, cycle_idx, progress, agent_key="style"):
+            _complete_review(data, progress, job_paths, cycle_idx, settings)
         return
     if progress["style"].get("done"):
-        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Style review already complete; forwarding to cohesion"})
-        send_queue_message(settings.sb_queue_review_cohesion, _strip_review_payload(data))
+        # Redelivered after this agent finished; whichever save completed the review queued verify.
+        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Style review already complete"})
         return
 
     publish_stage_event(agent_stage, "START", data, extra={"message": "Running style reviewer"})
     with stage_timer(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
-        store = BlobStore()
-        draft = store.get_text(blob=data["out"])
-        sections = extract_sections(draft)
-        id_to_section = {str(s.get("id")): s for s in (data.get("plan", {}).get("outline", []) or [])}
-        ordered_section_ids = _ordered_section_ids(data.get("plan", {}), sections)
-        reviewed_sections = {str(s) for s in progress["style"].get("sections_done", [])}
+        store = get_blob_store()
+        draft, sections, ordered_section_ids = _review_draft_view(data, progress, job_paths, cycle_idx)
+        id_to_section = _plan_index(data)["id_to_section"]
+        reviewed_sections = _sections_done_set(progress["style"])
         dependency_summaries = data.get("dependency_summaries", {}) or {}
 
         if not sections:
             style_json = style_agent.review_style(plan=data["plan"], markdown=draft)
             data["style_json"] = style_json
-            store.put_text(blob=job_paths.cycle(cycle_idx, "style.json"), text=style_json)
-            progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(style_agent.llm, "last_usage", None))
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "style.json"), text=style_json)
+            _add_review_tokens(progress, agent_model, _usage_total(getattr(style_agent.llm, "last_usage", None)), "style")
             progress["style"]["done"] = True
         else:
             batches = _plan_review_batches(
@@ -957,93 +1832,118 @@ def process_review_style(data: Dict[str, Any], style_agent: StyleReviewerAgent |
             if not batches:
                 progress["style"]["done"] = True
             else:
-                current_batch = batches[0]
-                batch_text, dep_ids = _build_batch_context(current_batch, sections, id_to_section, dependency_summaries)
-                logger.info(
-                    "Style review batch for job %s: targets=%s deps=%s est_tokens=%s",
-                    data.get("job_id"),
-                    current_batch,
-                    dep_ids,
-                    _estimate_tokens(batch_text),
-                )
-                section_meta = [
-                    {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in current_batch
-                ]
-                style_json = style_agent.review_style_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
-                try:
-                    parsed = json.loads(style_json)
-                except Exception:
-                    parsed = {}
-                entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
-                if isinstance(entries, list):
-                    for entry in entries:
-                        if not isinstance(entry, Mapping):
-                            continue
-                        issues = entry.get("issues") if isinstance(entry.get("issues"), list) else []
-                        suggestions = entry.get("suggestions") if isinstance(entry.get("suggestions"), list) else []
-                        revised_snippets = entry.get("revised_snippets")
-                        sid = str(entry.get("section_id")) if entry.get("section_id") is not None else None
-                        if sid:
-                            progress = _accumulate_section_guidance(
-                                progress,
-                                "style",
-                                sid,
-                                id_to_section.get(sid, {}).get("title"),
-                                issues,
-                                suggestions,
-                                {"revised_snippets": revised_snippets} if revised_snippets else {},
-                            )
-                if not entries:
-                    for sid in current_batch:
-                        progress = _accumulate_section_guidance(
-                            progress, "style", sid, id_to_section.get(sid, {}).get("title"), [], []
+                def _prompt(batch: list[str]) -> tuple[str, list[dict]]:
+                    batch_text, dep_ids = _build_batch_context(
+                        batch, sections, id_to_section, dependency_summaries, settings.review_compress_markdown
+                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Style review batch for job %s: targets=%s deps=%s est_tokens=%s",
+                            data.get("job_id"),
+                            batch,
+                            dep_ids,
+                            _estimate_tokens(batch_text),
                         )
-                progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(style_agent.llm, "last_usage", None))
-                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in set(progress["style"].get("sections_done", []))]
+                    section_meta = [
+                        {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in batch
+                    ]
+                    return batch_text, section_meta
+
+                review_batch = _cached_reviewer_call(
+                    "style", style_agent.review_style_batch, style_agent.llm, settings, job_paths, agent_model
+                )
+
+                def _review(batch: list[str]) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt(batch)
+                    return review_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
+
+                delta_mark = _review_delta_mark(progress, "style")
+                batch_results = _collect_review_batches(
+                    "style",
+                    batches,
+                    _review,
+                    lambda batch: style_agent.review_style_batch_messages(data["plan"], *_prompt(batch)),
+                    style_agent.llm,
+                    progress,
+                    settings,
+                    lambda: _persist_review_progress(job_paths, cycle_idx, progress, agent_key="style"),
+                    agent_model,
+                )
+                def _escalate(sid: str) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt([sid])
+                    escalated_json = style_agent.review_style_batch(
+                        plan=data["plan"], markdown=batch_text, sections=section_meta, model=settings.reviewer_model
+                    )
+                    return escalated_json, _usage_total(getattr(style_agent.llm, "last_usage", None))
+
+                for current_batch, style_json, usage in batch_results:
+                    try:
+                        parsed = json_utils.loads(style_json)
+                    except Exception:
+                        parsed = {}
+                    entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
+                    if isinstance(entries, list) and agent_model != settings.reviewer_model:
+                        entries = _escalate_review_entries(entries, _escalate, progress, settings, "style")
+                    _apply_review_entries(
+                        progress,
+                        "style",
+                        entries,
+                        current_batch,
+                        id_to_section,
+                        {"revised_snippets": lambda entry: entry.get("revised_snippets")},
+                    )
+                    _add_review_tokens(progress, agent_model, usage, "style")
+                batch_size = sum(len(batch) for batch, _, _ in batch_results)
+                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in reviewed_sections]
                 if remaining_after_batch:
-                    message = f"Style review: {len(progress['style']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {len(current_batch)})"
+                    message = f"Style review: {len(progress['style']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {batch_size})"
                     publish_stage_event(agent_stage, "QUEUED", data, extra={"message": message})
-                    _persist_review_progress(job_paths, cycle_idx, progress)
-                    send_queue_message(settings.sb_queue_review_style, _strip_review_payload(data))
-                    status_payload = StatusEvent(
-                        job_id=data["job_id"],
-                        stage=f"{agent_stage}_IN_PROGRESS",
-                        ts=time.time(),
-                        message=message,
-                        cycle=cycle_idx,
-                        extra={
-                            "details": {
-                                "agent": "style",
-                                "completed_sections": progress["style"]["sections_done"],
-                                "remaining_sections": remaining_after_batch,
-                            }
-                        },
-                    ).to_payload()
-                    publish_status(status_payload)
+                    _persist_review_progress(job_paths, cycle_idx, progress, delta_mark=delta_mark, agent_key="style")
+                    _requeue_review(settings.sb_queue_review_style, data, progress["style"], settings)
+                    if status_enabled():
+                        status_payload = StatusEvent(
+                            job_id=data["job_id"],
+                            stage=f"{agent_stage}_IN_PROGRESS",
+                            ts=time.time(),
+                            message=message,
+                            cycle=cycle_idx,
+                            extra={
+                                "details": {
+                                    "agent": "style",
+                                    "completed_sections": progress["style"]["sections_done"],
+                                    "remaining_sections": remaining_after_batch,
+                                }
+                            },
+                        ).to_payload()
+                        publish_status(status_payload)
                     return
-            final_style_json = json.dumps(progress["style"]["accumulated"], ensure_ascii=False)
-            store.put_text(blob=job_paths.cycle(cycle_idx, "style.json"), text=final_style_json)
+            final_style_json = json_utils.dumps(progress["style"]["accumulated"])
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "style.json"), text=final_style_json)
             progress["style"]["done"] = True
 
-    _persist_review_progress(job_paths, cycle_idx, progress)
-    message = "Style review complete; queuing cohesion reviewer"
+    completes_review = _persist_review_progress(job_paths, cycle_idx, progress, agent_key="style")
+    message = "Style review complete"
     publish_stage_event(agent_stage, "DONE", data, extra={"message": message})
-    send_queue_message(settings.sb_queue_review_cohesion, _strip_review_payload(data))
-    status_payload = StatusEvent(
-        job_id=data["job_id"],
-        stage=f"{agent_stage}_DONE",
-        ts=time.time(),
-        message=message,
-        cycle=cycle_idx,
-        extra={"details": {"agent": "style", "completed_sections": progress["style"].get("sections_done", [])}},
-    ).to_payload()
-    publish_status(status_payload)
+    if completes_review:
+        _complete_review(data, progress, job_paths, cycle_idx, settings, timing)
+    if status_enabled():
+        status_payload = StatusEvent(
+            job_id=data["job_id"],
+            stage=f"{agent_stage}_DONE",
+            ts=time.time(),
+            message=message,
+            cycle=cycle_idx,
+            extra={"details": {"agent": "style", "completed_sections": progress["style"].get("sections_done", [])}},
+        ).to_payload()
+        publish_status(status_payload)
 
 
+@OutboundBus()
 def process_review_cohesion(data: Dict[str, Any], cohesion_agent: CohesionReviewerAgent | None = None) -> None:
     agent_stage = REVIEW_AGENT_STAGES["cohesion"]
     settings = get_settings()
     cohesion_agent = cohesion_agent or CohesionReviewerAgent()
+    agent_model = getattr(cohesion_agent, "model", None) or settings.reviewer_model
     cycle_state = ensure_cycle_state(data)
     job_paths = _job_paths(data)
     if not _ensure_not_exhausted(cycle_state, data, settings):
@@ -1053,29 +1953,27 @@ def process_review_cohesion(data: Dict[str, Any], cohesion_agent: CohesionReview
     if not settings.review_cohesion_enabled:
         publish_stage_event(agent_stage, "SKIPPED", data, extra={"message": "Cohesion review disabled; skipping"})
         progress["cohesion"]["done"] = True
-        _persist_review_progress(job_paths, cycle_idx, progress)
-        send_queue_message(settings.sb_queue_review_summary, _strip_review_payload(data))
+        if _persist_review_progress(job_paths, cycle_idx, progress, agent_key="cohesion"):
+            _complete_review(data, progress, job_paths, cycle_idx, settings)
         return
     if progress["cohesion"].get("done"):
-        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Cohesion review already complete; forwarding to summary"})
-        send_queue_message(settings.sb_queue_review_summary, _strip_review_payload(data))
+        # Redelivered after this agent finished; whichever save completed the review queued verify.
+        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Cohesion review already complete"})
         return
 
     publish_stage_event(agent_stage, "START", data, extra={"message": "Running cohesion reviewer"})
     with stage_timer(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
-        store = BlobStore()
-        draft = store.get_text(blob=data["out"])
-        sections = extract_sections(draft)
-        id_to_section = {str(s.get("id")): s for s in (data.get("plan", {}).get("outline", []) or [])}
-        ordered_section_ids = _ordered_section_ids(data.get("plan", {}), sections)
-        reviewed_sections = {str(s) for s in progress["cohesion"].get("sections_done", [])}
+        store = get_blob_store()
+        draft, sections, ordered_section_ids = _review_draft_view(data, progress, job_paths, cycle_idx)
+        id_to_section = _plan_index(data)["id_to_section"]
+        reviewed_sections = _sections_done_set(progress["cohesion"])
         dependency_summaries = data.get("dependency_summaries", {}) or {}
 
         if not sections:
             cohesion_json = cohesion_agent.review_cohesion(plan=data["plan"], markdown=draft)
             data["cohesion_json"] = cohesion_json
-            store.put_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"), text=cohesion_json)
-            progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(cohesion_agent.llm, "last_usage", None))
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"), text=cohesion_json)
+            _add_review_tokens(progress, agent_model, _usage_total(getattr(cohesion_agent.llm, "last_usage", None)), "cohesion")
             progress["cohesion"]["done"] = True
         else:
             batches = _plan_review_batches(
@@ -1090,87 +1988,106 @@ def process_review_cohesion(data: Dict[str, Any], cohesion_agent: CohesionReview
             if not batches:
                 progress["cohesion"]["done"] = True
             else:
-                current_batch = batches[0]
-                batch_text, dep_ids = _build_batch_context(current_batch, sections, id_to_section, dependency_summaries)
-                logger.info(
-                    "Cohesion review batch for job %s: targets=%s deps=%s est_tokens=%s",
-                    data.get("job_id"),
-                    current_batch,
-                    dep_ids,
-                    _estimate_tokens(batch_text),
-                )
-                section_meta = [
-                    {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in current_batch
-                ]
-                cohesion_json = cohesion_agent.review_cohesion_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
-                try:
-                    parsed = json.loads(cohesion_json)
-                except Exception:
-                    parsed = {}
-                entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
-                if isinstance(entries, list):
-                    for entry in entries:
-                        if not isinstance(entry, Mapping):
-                            continue
-                        issues = entry.get("issues") if isinstance(entry.get("issues"), list) else []
-                        suggestions = entry.get("suggestions") if isinstance(entry.get("suggestions"), list) else []
-                        sid = str(entry.get("section_id")) if entry.get("section_id") is not None else None
-                        if sid:
-                            progress = _accumulate_section_guidance(
-                                progress,
-                                "cohesion",
-                                sid,
-                                id_to_section.get(sid, {}).get("title"),
-                                issues,
-                                suggestions,
-                            )
-                if not entries:
-                    for sid in current_batch:
-                        progress = _accumulate_section_guidance(
-                            progress, "cohesion", sid, id_to_section.get(sid, {}).get("title"), [], []
+                def _prompt(batch: list[str]) -> tuple[str, list[dict]]:
+                    batch_text, dep_ids = _build_batch_context(
+                        batch, sections, id_to_section, dependency_summaries, settings.review_compress_markdown
+                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Cohesion review batch for job %s: targets=%s deps=%s est_tokens=%s",
+                            data.get("job_id"),
+                            batch,
+                            dep_ids,
+                            _estimate_tokens(batch_text),
                         )
-                progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(cohesion_agent.llm, "last_usage", None))
-                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in set(progress["cohesion"].get("sections_done", []))]
+                    section_meta = [
+                        {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in batch
+                    ]
+                    return batch_text, section_meta
+
+                review_batch = _cached_reviewer_call(
+                    "cohesion", cohesion_agent.review_cohesion_batch, cohesion_agent.llm, settings, job_paths, agent_model
+                )
+
+                def _review(batch: list[str]) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt(batch)
+                    return review_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
+
+                delta_mark = _review_delta_mark(progress, "cohesion")
+                batch_results = _collect_review_batches(
+                    "cohesion",
+                    batches,
+                    _review,
+                    lambda batch: cohesion_agent.review_cohesion_batch_messages(data["plan"], *_prompt(batch)),
+                    cohesion_agent.llm,
+                    progress,
+                    settings,
+                    lambda: _persist_review_progress(job_paths, cycle_idx, progress, agent_key="cohesion"),
+                    agent_model,
+                )
+                def _escalate(sid: str) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt([sid])
+                    escalated_json = cohesion_agent.review_cohesion_batch(
+                        plan=data["plan"], markdown=batch_text, sections=section_meta, model=settings.reviewer_model
+                    )
+                    return escalated_json, _usage_total(getattr(cohesion_agent.llm, "last_usage", None))
+
+                for current_batch, cohesion_json, usage in batch_results:
+                    try:
+                        parsed = json_utils.loads(cohesion_json)
+                    except Exception:
+                        parsed = {}
+                    entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
+                    if isinstance(entries, list) and agent_model != settings.reviewer_model:
+                        entries = _escalate_review_entries(entries, _escalate, progress, settings, "cohesion")
+                    _apply_review_entries(progress, "cohesion", entries, current_batch, id_to_section)
+                    _add_review_tokens(progress, agent_model, usage, "cohesion")
+                batch_size = sum(len(batch) for batch, _, _ in batch_results)
+                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in reviewed_sections]
                 if remaining_after_batch:
-                    message = f"Cohesion review: {len(progress['cohesion']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {len(current_batch)})"
+                    message = f"Cohesion review: {len(progress['cohesion']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {batch_size})"
                     publish_stage_event(agent_stage, "QUEUED", data, extra={"message": message})
-                    _persist_review_progress(job_paths, cycle_idx, progress)
-                    send_queue_message(settings.sb_queue_review_cohesion, _strip_review_payload(data))
-                    status_payload = StatusEvent(
-                        job_id=data["job_id"],
-                        stage=f"{agent_stage}_IN_PROGRESS",
-                        ts=time.time(),
-                        message=message,
-                        cycle=cycle_idx,
-                        extra={
-                            "details": {
-                                "agent": "cohesion",
-                                "completed_sections": progress["cohesion"]["sections_done"],
-                                "remaining_sections": remaining_after_batch,
-                            }
-                        },
-                    ).to_payload()
-                    publish_status(status_payload)
+                    _persist_review_progress(job_paths, cycle_idx, progress, delta_mark=delta_mark, agent_key="cohesion")
+                    _requeue_review(settings.sb_queue_review_cohesion, data, progress["cohesion"], settings)
+                    if status_enabled():
+                        status_payload = StatusEvent(
+                            job_id=data["job_id"],
+                            stage=f"{agent_stage}_IN_PROGRESS",
+                            ts=time.time(),
+                            message=message,
+                            cycle=cycle_idx,
+                            extra={
+                                "details": {
+                                    "agent": "cohesion",
+                                    "completed_sections": progress["cohesion"]["sections_done"],
+                                    "remaining_sections": remaining_after_batch,
+                                }
+                            },
+                        ).to_payload()
+                        publish_status(status_payload)
                     return
-            final_cohesion_json = json.dumps(progress["cohesion"]["accumulated"], ensure_ascii=False)
-            store.put_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"), text=final_cohesion_json)
+            final_cohesion_json = json_utils.dumps(progress["cohesion"]["accumulated"])
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"), text=final_cohesion_json)
             progress["cohesion"]["done"] = True
 
-    _persist_review_progress(job_paths, cycle_idx, progress)
-    message = "Cohesion review complete; queuing summary reviewer"
+    completes_review = _persist_review_progress(job_paths, cycle_idx, progress, agent_key="cohesion")
+    message = "Cohesion review complete"
     publish_stage_event(agent_stage, "DONE", data, extra={"message": message})
-    send_queue_message(settings.sb_queue_review_summary, _strip_review_payload(data))
-    status_payload = StatusEvent(
-        job_id=data["job_id"],
-        stage=f"{agent_stage}_DONE",
-        ts=time.time(),
-        message=message,
-        cycle=cycle_idx,
-        extra={"details": {"agent": "cohesion", "completed_sections": progress["cohesion"].get("sections_done", [])}},
-    ).to_payload()
-    publish_status(status_payload)
+    if completes_review:
+        _complete_review(data, progress, job_paths, cycle_idx, settings, timing)
+    if status_enabled():
+        status_payload = StatusEvent(
+            job_id=data["job_id"],
+            stage=f"{agent_stage}_DONE",
+            ts=time.time(),
+            message=message,
+            cycle=cycle_idx,
+            extra={"details": {"agent": "cohesion", "completed_sections": progress["cohesion"].get("sections_done", [])}},
+        ).to_payload()
+        publish_status(status_payload)
 
 
+@OutboundBus()
 def process_review_summary(data: Dict[str, Any], summary_agent: SummaryReviewerAgent | None = None) -> None:
     agent_stage = REVIEW_AGENT_STAGES["summary"]
     settings = get_settings()
@@ -1182,56 +2099,29 @@ def process_review_summary(data: Dict[str, Any], summary_agent: SummaryReviewerA
     cycle_idx = min(cycle_state.requested, cycle_state.completed + 1)
     progress = _load_review_progress(job_paths, cycle_idx)
     if not settings.review_summary_enabled:
-        progress["summary"]["done"] = True
-        _persist_review_progress(job_paths, cycle_idx, progress)
-        review_tokens = int(progress.get("tokens_total") or 0)
         publish_stage_event(agent_stage, "SKIPPED", data, extra={"message": "Executive summary review disabled; skipping"})
-        publish_stage_event("REVIEW", "DONE", data, extra={"message": "Review completed (style/cohesion/summary disabled)"})
-        send_queue_message(settings.sb_queue_verify, _strip_review_payload(data))
-        publish_status(
-            _stage_completed_event(
-                data["job_id"],
-                "REVIEW",
-                StageTiming(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, start=time.perf_counter(), duration_s=0.0),
-                artifact=job_paths.cycle(cycle_idx, "review.json"),
-                tokens=review_tokens,
-                model=settings.reviewer_model,
-                source=data,
-            )
-        )
+        progress["summary"]["done"] = True
+        if _persist_review_progress(job_paths, cycle_idx, progress, agent_key="summary"):
+            _complete_review(data, progress, job_paths, cycle_idx, settings)
         return
     if progress["summary"].get("done"):
-        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Summary review already complete; forwarding to verify"})
-        review_tokens = int(progress.get("tokens_total") or 0)
-        publish_status(
-            _stage_completed_event(
-                data["job_id"],
-                "REVIEW",
-                StageTiming(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, start=time.perf_counter(), duration_s=0.0),
-                artifact=job_paths.cycle(cycle_idx, "review.json"),
-                tokens=review_tokens,
-                model=settings.reviewer_model,
-                source=data,
-            )
-        )
-        send_queue_message(settings.sb_queue_verify, _strip_review_payload(data))
+        # Redelivered after this agent finished; whichever save completed the review queued verify.
+        publish_stage_event(agent_stage, "DONE", data, extra={"message": "Summary review already complete"})
         return
 
     publish_stage_event(agent_stage, "START", data, extra={"message": "Running executive summary reviewer"})
     with stage_timer(job_id=data["job_id"], stage="REVIEW", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
-        store = BlobStore()
-        draft = store.get_text(blob=data["out"])
-        sections = extract_sections(draft)
-        id_to_section = {str(s.get("id")): s for s in (data.get("plan", {}).get("outline", []) or [])}
-        ordered_section_ids = _ordered_section_ids(data.get("plan", {}), sections)
-        reviewed_sections = {str(s) for s in progress["summary"].get("sections_done", [])}
+        store = get_blob_store()
+        draft, sections, ordered_section_ids = _review_draft_view(data, progress, job_paths, cycle_idx)
+        id_to_section = _plan_index(data)["id_to_section"]
+        reviewed_sections = _sections_done_set(progress["summary"])
         dependency_summaries = data.get("dependency_summaries", {}) or {}
 
         if not sections:
             summary_json = summary_agent.review_executive_summary(plan=data["plan"], markdown=draft)
             data["exec_summary_json"] = summary_json
-            store.put_text(blob=job_paths.cycle(cycle_idx, "executive_summary.json"), text=summary_json)
-            progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(summary_agent.llm, "last_usage", None))
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "executive_summary.json"), text=summary_json)
+            _add_review_tokens(progress, settings.reviewer_model, _usage_total(getattr(summary_agent.llm, "last_usage", None)), "summary")
             progress["summary"]["done"] = True
         else:
             batches = _plan_review_batches(
@@ -1243,74 +2133,84 @@ def process_review_summary(data: Dict[str, Any], summary_agent: SummaryReviewerA
                 settings,
                 settings.review_summary_batch_size,
             )
+            parsed: Any = {}
             if not batches:
                 progress["summary"]["done"] = True
             else:
-                current_batch = batches[0]
-                batch_text, dep_ids = _build_batch_context(current_batch, sections, id_to_section, dependency_summaries)
-                logger.info(
-                    "Summary review batch for job %s: targets=%s deps=%s est_tokens=%s",
-                    data.get("job_id"),
-                    current_batch,
-                    dep_ids,
-                    _estimate_tokens(batch_text),
+                def _prompt(batch: list[str]) -> tuple[str, list[dict]]:
+                    batch_text, dep_ids = _build_batch_context(
+                        batch, sections, id_to_section, dependency_summaries, settings.review_compress_markdown
+                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Summary review batch for job %s: targets=%s deps=%s est_tokens=%s",
+                            data.get("job_id"),
+                            batch,
+                            dep_ids,
+                            _estimate_tokens(batch_text),
+                        )
+                    section_meta = [
+                        {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in batch
+                    ]
+                    return batch_text, section_meta
+
+                review_batch = _cached_reviewer_call(
+                    "summary", summary_agent.review_executive_summary_batch, summary_agent.llm, settings, job_paths
                 )
-                section_meta = [
-                    {"section_id": sid, "title": (id_to_section.get(sid) or {}).get("title")} for sid in current_batch
-                ]
-                summary_json = summary_agent.review_executive_summary_batch(
-                    plan=data["plan"], markdown=batch_text, sections=section_meta
+
+                def _review(batch: list[str]) -> tuple[str, int]:
+                    batch_text, section_meta = _prompt(batch)
+                    return review_batch(plan=data["plan"], markdown=batch_text, sections=section_meta)
+
+                delta_mark = _review_delta_mark(progress, "summary")
+                batch_results = _collect_review_batches(
+                    "summary",
+                    batches,
+                    _review,
+                    lambda batch: summary_agent.review_executive_summary_batch_messages(data["plan"], *_prompt(batch)),
+                    summary_agent.llm,
+                    progress,
+                    settings,
+                    lambda: _persist_review_progress(job_paths, cycle_idx, progress, agent_key="summary"),
                 )
-                try:
-                    parsed = json.loads(summary_json)
-                except Exception:
-                    parsed = {}
-                entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
-                if isinstance(entries, list):
-                    for entry in entries:
-                        if not isinstance(entry, Mapping):
-                            continue
-                        issues = entry.get("issues") if isinstance(entry.get("issues"), list) else []
-                        suggestions = entry.get("suggestions") if isinstance(entry.get("suggestions"), list) else []
-                        section_summary = entry.get("summary") if isinstance(entry.get("summary"), str) else None
-                        sid = str(entry.get("section_id")) if entry.get("section_id") is not None else None
-                        if sid:
-                            progress = _accumulate_section_guidance(
-                                progress,
-                                "summary",
-                                sid,
-                                id_to_section.get(sid, {}).get("title"),
-                                issues,
-                                suggestions,
-                                {"summary": section_summary} if section_summary else {},
-                            )
-                if not entries:
-                    for sid in current_batch:
-                        progress = _accumulate_section_guidance(
-                            progress, "summary", sid, id_to_section.get(sid, {}).get("title"), [], []
-                        )
-                progress["tokens_total"] = progress.get("tokens_total", 0) + _usage_total(getattr(summary_agent.llm, "last_usage", None))
-                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in set(progress["summary"].get("sections_done", []))]
+                for current_batch, summary_json, usage in batch_results:
+                    try:
+                        parsed = json_utils.loads(summary_json)
+                    except Exception:
+                        parsed = {}
+                    entries = parsed.get("sections") if isinstance(parsed, Mapping) else []
+                    _apply_review_entries(
+                        progress,
+                        "summary",
+                        entries,
+                        current_batch,
+                        id_to_section,
+                        {"summary": lambda entry: entry.get("summary") if isinstance(entry.get("summary"), str) else None},
+                    )
+                    _add_review_tokens(progress, settings.reviewer_model, usage, "summary")
+                batch_size = sum(len(batch) for batch, _, _ in batch_results)
+                remaining_after_batch = [sid for sid in ordered_section_ids if sid not in reviewed_sections]
                 if remaining_after_batch:
-                    message = f"Summary review: {len(progress['summary']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {len(current_batch)})"
+                    message = f"Summary review: {len(progress['summary']['sections_done'])} of {len(ordered_section_ids)} sections (batch size {batch_size})"
                     publish_stage_event(agent_stage, "QUEUED", data, extra={"message": message})
-                    _persist_review_progress(job_paths, cycle_idx, progress)
-                    send_queue_message(settings.sb_queue_review_summary, _strip_review_payload(data))
-                    status_payload = StatusEvent(
-                        job_id=data["job_id"],
-                        stage=f"{agent_stage}_IN_PROGRESS",
-                        ts=time.time(),
-                        message=message,
-                        cycle=cycle_idx,
-                        extra={
-                            "details": {
-                                "agent": "summary",
-                                "completed_sections": progress["summary"]["sections_done"],
-                                "remaining_sections": remaining_after_batch,
-                            }
-                        },
-                    ).to_payload()
-                    publish_status(status_payload)
+                    _persist_review_progress(job_paths, cycle_idx, progress, delta_mark=delta_mark, agent_key="summary")
+                    _requeue_review(settings.sb_queue_review_summary, data, progress["summary"], settings)
+                    if status_enabled():
+                        status_payload = StatusEvent(
+                            job_id=data["job_id"],
+                            stage=f"{agent_stage}_IN_PROGRESS",
+                            ts=time.time(),
+                            message=message,
+                            cycle=cycle_idx,
+                            extra={
+                                "details": {
+                                    "agent": "summary",
+                                    "completed_sections": progress["summary"]["sections_done"],
+                                    "remaining_sections": remaining_after_batch,
+                                }
+                            },
+                        ).to_payload()
+                        publish_status(status_payload)
                     return
             sections_entries = progress["summary"]["accumulated"].get("sections", []) if isinstance(progress["summary"].get("accumulated"), dict) else []
             combined_summary_parts: list[str] = []
@@ -1322,31 +2222,19 @@ def process_review_summary(data: Dict[str, Any], summary_agent: SummaryReviewerA
                 if summary_text:
                     combined_summary_parts.append(f"{title}: {summary_text}")
             combined_summary = "\n\n".join(combined_summary_parts).strip() if combined_summary_parts else parsed.get("summary", "")
-            final_summary_json = json.dumps(
+            final_summary_json = json_utils.dumps(
                 {
                     **(progress["summary"].get("accumulated") or {}),
                     "summary": combined_summary or (parsed.get("summary") if isinstance(parsed, dict) else ""),
                 },
-                ensure_ascii=False,
             )
-            store.put_text(blob=job_paths.cycle(cycle_idx, "executive_summary.json"), text=final_summary_json)
+            store.put_compressed_text(blob=job_paths.cycle(cycle_idx, "executive_summary.json"), text=final_summary_json)
             progress["summary"]["done"] = True
 
-    _persist_review_progress(job_paths, cycle_idx, progress)
-    review_tokens = int(progress.get("tokens_total") or 0)
-    publish_stage_event(agent_stage, "DONE", data, extra={"message": "Summary review complete; queuing verify"})
-    send_queue_message(settings.sb_queue_verify, _strip_review_payload(data))
-    publish_status(
-        _stage_completed_event(
-            data["job_id"],
-            "REVIEW",
-            timing,
-            artifact=job_paths.cycle(cycle_idx, "review.json"),
-            tokens=review_tokens,
-            model=settings.reviewer_model,
-            source=data,
-        )
-    )
+    completes_review = _persist_review_progress(job_paths, cycle_idx, progress, agent_key="summary")
+    publish_stage_event(agent_stage, "DONE", data, extra={"message": "Summary review complete"})
+    if completes_review:
+        _complete_review(data, progress, job_paths, cycle_idx, settings, timing)
 
 
 # Backward-compatible entrypoint for legacy single-queue review
@@ -1360,24 +2248,31 @@ def process_verify(data: Dict[str, Any], verifier: VerifierAgent | None = None)
     cycle_state = ensure_cycle_state(data)
     cycle_idx = min(cycle_state.requested, cycle_state.completed + 1)
     job_paths = _job_paths(data)
+    cycle_paths = _cycle_paths(
+        job_paths, cycle_idx, "review.json", "revision.md", "contradictions.json", "style.json", "cohesion.json"
+    )
     publish_stage_event("VERIFY", "START", data)
+    prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verify-prefetch")
     with stage_timer(job_id=data["job_id"], stage="VERIFY", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
-        store = BlobStore()
+        store = get_blob_store()
+        # Reviewer guidance is always needed afterwards; fetch it while the verifier runs.
+        style_future = prefetch_pool.submit(store.get_text, blob=cycle_paths["style.json"])
+        cohesion_future = prefetch_pool.submit(store.get_text, blob=cycle_paths["cohesion.json"])
+        prefetch_pool.shutdown(wait=False)
         draft = store.get_text(blob=data["out"])
         try:
-            review_text = store.get_text(blob=job_paths.cycle(cycle_idx, "review.json"))
+            review_text = store.get_text(blob=cycle_paths["review.json"])
         except Exception:
             review_text = data.get("review_json", "{}")
         try:
-            review_data = json.loads(review_text or "{}")
+            review_data = json_utils.loads(review_text or "{}")
             revised = review_data.get("revised_markdown")
             if isinstance(revised, str) and revised.strip():
                 merged = merge_revised_markdown(draft, revised)
                 if merged != draft:
                     draft = merged
                     try:
-                        store.put_text(blob=data["out"], text=merged)
-                        store.put_text(blob=job_paths.cycle(cycle_idx, "revision.md"), text=merged)
+                        store.put_texts([(data["out"], merged), (cycle_paths["revision.md"], merged)])
                     except Exception:
                         pass
         except Exception:
@@ -1390,25 +2285,28 @@ def process_verify(data: Dict[str, Any], verifier: VerifierAgent | None = None)
         except Exception as exc:
             track_exception(exc, {"job_id": data["job_id"], "stage": "VERIFY"})
             raise
-    payload = {**data, "verification_json": verification_json}
+    payload = data.copy()
     cycle_state = ensure_cycle_state(payload)
     try:
-        store = BlobStore()
-        store.put_text(blob=job_paths.cycle(cycle_idx, "contradictions.json"), text=verification_json)
+        store.put_text(blob=cycle_paths["contradictions.json"], text=verification_json)
     except Exception as exc:
         track_exception(exc, {"job_id": data["job_id"], "stage": "VERIFY"})
     try:
-        verification = json.loads(verification_json)
+        verification = json_utils.loads(verification_json)
         contradictions = verification.get("contradictions", [])
     except Exception:
+        verification = {"contradictions": []}
         contradictions = []
+    # Carry the parsed result rather than the raw text so rewrite batches skip the re-parse.
+    payload.pop("verification_json", None)
+    payload["verification_parsed"] = verification
 
     try:
-        style_raw = BlobStore().get_text(blob=job_paths.cycle(cycle_idx, "style.json"))
+        style_raw = style_future.result()
     except Exception:
         style_raw = data.get("style_json")
     try:
-        cohesion_raw = BlobStore().get_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"))
+        cohesion_raw = cohesion_future.result()
     except Exception:
         cohesion_raw = data.get("cohesion_json")
 
@@ -1423,9 +2321,13 @@ def process_verify(data: Dict[str, Any], verifier: VerifierAgent | None = None)
 
     payload["placeholder_sections"] = sorted(placeholder_sections)
     payload["requires_rewrite"] = needs_rewrite
-    artifact_path = job_paths.cycle(cycle_idx, "contradictions.json")
+    _carry_review_guidance(
+        payload, needs_rewrite, (style_guidance, style_sections), (cohesion_guidance, cohesion_sections)
+    )
+    artifact_path = cycle_paths["contradictions.json"]
     verify_tokens = _usage_total(getattr(verifier.llm, "last_usage", None))
     if not verify_tokens:
+        logger.warning("Verifier reported no token usage for job %s; estimating from output", data["job_id"])
         verify_tokens = _estimate_tokens(verification_json)
     notes_list: list[str] = []
     if contradictions:
@@ -1477,126 +2379,174 @@ def process_verify(data: Dict[str, Any], verifier: VerifierAgent | None = None)
     send_queue_message(settings.sb_queue_rewrite, payload)
 
 
+def _carry_review_guidance(
+    payload: Dict[str, Any],
+    needs_rewrite: bool,
+    style: tuple[str, set[str]],
+    cohesion: tuple[str, set[str]],
+) -> None:
+    """Attach parsed guidance so rewrite batches skip re-downloading style.json/cohesion.json.
+
+    Guidance over ``_MAX_CARRIED_GUIDANCE_BYTES`` is left out and rewrite falls back to the blobs.
+    """
+    payload.pop("review_guidance", None)
+    if not needs_rewrite:
+        return
+    guidance = {
+        "style": {"text": style[0], "sections": sorted(style[1])},
+        "cohesion": {"text": cohesion[0], "sections": sorted(cohesion[1])},
+    }
+    if len(json_utils.dumps_bytes(guidance)) <= _MAX_CARRIED_GUIDANCE_BYTES:
+        payload["review_guidance"] = guidance
+
+
+def _carried_review_guidance(carried: Mapping[str, Any], key: str) -> tuple[str, set[str]]:
+    entry = carried.get(key)
+    if not isinstance(entry, Mapping):
+        return "", set()
+    return str(entry.get("text") or ""), {str(sid) for sid in entry.get("sections") or []}
+
+
 def process_rewrite(data: Dict[str, Any], writer: WriterAgent | None = None) -> None:
     settings = get_settings()
     writer = writer or WriterAgent()
     cycle_state = ensure_cycle_state(data)
     job_paths = _job_paths(data)
     rewrite_tokens_total = 0
+    rewrite_calls = 0
     requires_rewrite = bool(data.get("requires_rewrite"))
     rewritten_sections = {str(s) for s in (data.get("rewritten_sections") or []) if s is not None}
     cycle_idx = min(cycle_state.requested, cycle_state.completed + 1)
+    cycle_paths = _cycle_paths(job_paths, cycle_idx, "contradictions.json", "style.json", "cohesion.json", "rewrite.md")
     publish_stage_event("REWRITE", "START", data)
     with stage_timer(job_id=data["job_id"], stage="REWRITE", cycle=cycle_idx, user_id=job_paths.user_id) as timing:
         plan = data["plan"]
-        store = BlobStore()
+        store = get_blob_store()
         text = store.get_text(blob=data["out"])
         if requires_rewrite:
-            try:
-                verification_text = BlobStore().get_text(blob=job_paths.cycle(cycle_idx, "contradictions.json"))
-            except Exception:
-                verification_text = data.get("verification_json", "{}")
-            try:
-                verification = json.loads(verification_text or "{}")
-            except Exception:
-                verification = {"contradictions": []}
+            verification = data.get("verification_parsed")
+            if not isinstance(verification, Mapping):
+                verification_text = data.get("verification_json")
+                if not verification_text:
+                    try:
+                        verification_text = store.get_text(blob=cycle_paths["contradictions.json"])
+                    except Exception:
+                        verification_text = "{}"
+                try:
+                    verification = json_utils.loads(verification_text or "{}")
+                except Exception:
+                    verification = {"contradictions": []}
             contradictions = verification.get("contradictions", [])
-            id_to_section = {str(s.get("id")): s for s in plan.get("outline", [])}
+            id_to_section = _plan_index(data)["id_to_section"]
             dependency_summaries = data.get("dependency_summaries", {})
 
-            try:
-                style_raw = BlobStore().get_text(blob=job_paths.cycle(cycle_idx, "style.json"))
-            except Exception:
-                style_raw = data.get("style_json")
-            try:
-                cohesion_raw = BlobStore().get_text(blob=job_paths.cycle(cycle_idx, "cohesion.json"))
-            except Exception:
-                cohesion_raw = data.get("cohesion_json")
-
-            style_guidance, style_sections = parse_review_guidance(style_raw)
-            cohesion_guidance, cohesion_sections = parse_review_guidance(cohesion_raw)
+            carried = data.get("review_guidance")
+            if isinstance(carried, Mapping):
+                style_guidance, style_sections = _carried_review_guidance(carried, "style")
+                cohesion_guidance, cohesion_sections = _carried_review_guidance(carried, "cohesion")
+            else:
+                try:
+                    style_raw = store.get_text(blob=cycle_paths["style.json"])
+                except Exception:
+                    style_raw = data.get("style_json")
+                try:
+                    cohesion_raw = store.get_text(blob=cycle_paths["cohesion.json"])
+                except Exception:
+                    cohesion_raw = data.get("cohesion_json")
+                style_guidance, style_sections = parse_review_guidance(style_raw)
+                cohesion_guidance, cohesion_sections = parse_review_guidance(cohesion_raw)
             combined_guidance = "\n".join(filter(None, [style_guidance, cohesion_guidance]))
 
-            affected = {str(c.get("section_id")) for c in contradictions if c.get("section_id")}
-            affected.update(style_sections)
-            affected.update(cohesion_sections)
+            affected = set().union(
+                (str(c.get("section_id")) for c in contradictions if c.get("section_id")),
+                style_sections,
+                cohesion_sections,
+            )
 
             if not affected and combined_guidance:
                 affected = set(id_to_section.keys())
 
             placeholder_sections = {str(s) for s in data.get("placeholder_sections", [])}
-            affected.update(placeholder_sections)
+            affected |= placeholder_sections
 
-            remaining = [sid for sid in affected if sid not in rewritten_sections]
+            # Batch in plan order so progress reads the same way from one message to the next.
+            pending = affected - rewritten_sections
+            remaining = [sid for sid in _plan_index(data)["ordered_ids"] if sid in pending]
+            remaining += sorted(pending.difference(remaining))
             batch_size = max(1, int(settings.write_batch_size or 5))
             batch = remaining[:batch_size]
 
             if batch:
-                for sid in batch:
-                    section = id_to_section.get(sid)
-                    if not section:
-                        continue
+
+                def _rewrite_one(sid: str) -> tuple[str, int]:
+                    section = id_to_section[sid]
                     deps = section.get("dependencies", []) or []
                     dep_context = "\n".join(
                         [dependency_summaries.get(str(d), "") for d in deps if dependency_summaries.get(str(d))]
                     )
                     try:
                         new_text = "".join(
-                            list(
-                                writer.write_section(
-                                    plan=plan,
-                                    section=section,
-                                    dependency_context=dep_context,
-                                    extra_guidance=combined_guidance,
-                                )
+                            writer.write_section(
+                                plan=plan,
+                                section=section,
+                                dependency_context=dep_context,
+                                extra_guidance=combined_guidance,
                             )
                         )
                     except Exception as exc:
                         track_exception(exc, {"job_id": job_paths.job_id, "stage": "REWRITE", "section": sid})
                         raise
-                    start_marker = f"<!-- SECTION:{sid}:START -->"
-                    end_marker = f"<!-- SECTION:{sid}:END -->"
-                    start_idx = text.find(start_marker)
-                    end_idx = text.find(end_marker)
-                    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                        end_idx += len(end_marker)
-                        text = text[:start_idx] + new_text + text[end_idx:]
-                    rewrite_tokens_total += _usage_total(getattr(writer.llm, "last_usage", None))
-                    rewritten_sections.add(sid)
-                store.put_text(blob=data["out"], text=text)
-                try:
-                    store.put_text(blob=job_paths.cycle(cycle_idx, "rewrite.md"), text=text)
-                except Exception:
-                    pass
-            remaining_after_batch = [sid for sid in affected if sid not in rewritten_sections]
+                    # last_usage is per thread, so this is this rewrite's call even when the pool is busy.
+                    return new_text, _usage_total(getattr(writer.llm, "last_usage", None))
+
+                # Rewrites only read the cycle's dependency summaries, so the batch's LLM calls
+                # are independent; the draft is spliced once they have all returned.
+                targets = [sid for sid in batch if id_to_section.get(sid)]
+                new_sections: Dict[str, str] = {}
+                max_workers = max(1, min(len(targets), int(settings.write_concurrency or 1)))
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rewrite") as pool:
+                    for sid, (new_text, usage) in zip(targets, pool.map(_rewrite_one, targets), strict=True):
+                        new_sections[sid] = new_text
+                        rewrite_tokens_total += usage
+                        rewrite_calls += 1
+                        rewritten_sections.add(sid)
+                if new_sections:
+                    text = replace_sections(text, new_sections)
+                    # Upload the cycle copy alongside the draft; it stays best-effort.
+                    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rewrite-put") as pool:
+                        cycle_copy = pool.submit(store.put_text, cycle_paths["rewrite.md"], text)
+                        store.put_text(blob=data["out"], text=text)
+                        try:
+                            cycle_copy.result()
+                        except Exception:
+                            pass
+            remaining_after_batch = affected - rewritten_sections
             if remaining_after_batch:
                 progress_msg = f"Rewrite sections: {len(rewritten_sections)} done of {len(affected)}"
-                progress_payload = {
-                    **data,
-                    "out": data["out"],
-                    "requires_rewrite": True,
-                    "rewritten_sections": list(rewritten_sections),
-                    "dependency_summaries": data.get("dependency_summaries", {}),
-                    "placeholder_sections": list(placeholder_sections),
-                }
+                progress_payload = data.copy()
+                progress_payload["requires_rewrite"] = True
+                progress_payload["rewritten_sections"] = list(rewritten_sections)
+                progress_payload["dependency_summaries"] = data.get("dependency_summaries", {})
+                progress_payload["placeholder_sections"] = list(placeholder_sections)
                 publish_stage_event("REWRITE", "QUEUED", progress_payload, extra={"message": progress_msg})
                 send_queue_message(settings.sb_queue_rewrite, progress_payload)
-                status_payload = StatusEvent(
-                    job_id=data["job_id"],
-                    stage="REWRITE_IN_PROGRESS",
-                    ts=time.time(),
-                    message=progress_msg,
-                    cycle=cycle_idx,
-                    extra={"details": {"written": len(rewritten_sections), "total": len(affected)}},
-                ).to_payload()
-                publish_status(status_payload)
+                if status_enabled():
+                    status_payload = StatusEvent(
+                        job_id=data["job_id"],
+                        stage="REWRITE_IN_PROGRESS",
+                        ts=time.time(),
+                        message=progress_msg,
+                        cycle=cycle_idx,
+                        extra={"details": {"written": len(rewritten_sections), "total": len(affected)}},
+                    ).to_payload()
+                    publish_status(status_payload)
                 return
-    payload = {
-        **data,
-        "placeholder_sections": [],
-        "rewritten_sections": list(rewritten_sections),
-    }
+    payload = data.copy()
+    payload["placeholder_sections"] = []
+    payload["rewritten_sections"] = list(rewritten_sections)
     payload.pop("review_progress", None)
+    payload.pop("review_guidance", None)
+    payload.pop("verification_parsed", None)
     next_completed = min(cycle_state.requested, cycle_state.completed + 1)
     next_cycle_state = CycleState(cycle_state.requested, next_completed)
     next_cycle_state.apply(payload)
@@ -1608,6 +2558,8 @@ def process_rewrite(data: Dict[str, Any], writer: WriterAgent | None = None) ->
         publish_stage_event("DIAGRAM", "QUEUED", payload)
         send_queue_message(settings.sb_queue_diagram_prep, payload)
     if not rewrite_tokens_total:
+        if rewrite_calls:
+            logger.warning("Writer reported no token usage for job %s rewrite; estimating from draft", data["job_id"])
         rewrite_tokens_total = _estimate_tokens(text)
     publish_status(
         _stage_completed_event(
@@ -1627,23 +2579,37 @@ def process_finalize(data: Dict[str, Any]) -> None:
     final_text = ""
     job_paths = _job_paths(data)
     with stage_timer(job_id=data["job_id"], stage="FINALIZE", user_id=job_paths.user_id) as timing:
-        store = BlobStore()
+        store = get_blob_store()
         target_blob = data["out"]
         final_text = store.get_text(blob=target_blob)
-        final_text = _apply_diagram_results(
-            final_text,
-            data.get("diagram_results", []),
-            job_paths,
-        )
-        final_text = number_markdown_headings(final_text)
-        final_text = insert_table_of_contents(final_text)
-        store.put_text(blob=job_paths.final("md"), text=final_text)
-        pdf_bytes = export_pdf(final_text, {}, store, job_paths)
-        if pdf_bytes:
-            store.put_bytes(blob=job_paths.final("pdf"), data_bytes=pdf_bytes)
-        docx_bytes = export_docx(final_text, {}, store, job_paths)
-        if docx_bytes:
-            store.put_bytes(blob=job_paths.final("docx"), data_bytes=docx_bytes)
+        diagram_results = data.get("diagram_results") or []
+        source_digest = hashlib.sha256(
+            final_text.encode("utf-8") + json_utils.dumps_bytes(diagram_results)
+        ).hexdigest()
+        digest_blob = job_paths.final("sha256")
+        try:
+            finalized_digest = store.get_text(blob=digest_blob).strip()
+        except Exception:
+            finalized_digest = None
+
+        # A redelivered finalize for the same draft and diagrams would rebuild identical artifacts.
+        if finalized_digest != source_digest:
+            if diagram_results:
+                final_text = _apply_diagram_results(final_text, diagram_results, job_paths)
+            final_text = number_markdown_headings(final_text)
+            final_text = insert_table_of_contents(final_text)
+            store.put_text(blob=job_paths.final("md"), text=final_text)
+            # WeasyPrint and the DOCX exporter are not documented as thread-safe, so render in turn.
+            pdf_bytes = export_pdf(final_text, {}, store, job_paths)
+            if pdf_bytes:
+                store.put_bytes(blob=job_paths.final("pdf"), data_bytes=pdf_bytes)
+            docx_bytes = export_docx(final_text, {}, store, job_paths)
+            if docx_bytes:
+                store.put_bytes(blob=job_paths.final("docx"), data_bytes=docx_bytes)
+            try:
+                store.put_text(blob=digest_blob, text=source_digest)
+            except Exception as exc:
+                track_exception(exc, {"job_id": data["job_id"], "stage": "FINALIZE"})
     final_tokens = 0
     publish_status(
         _stage_completed_event(
@@ -12,6 +12,16 @@ def coerce_int(value: Any, default: int = 0) -> int:
         return default
 
 
+def coerce_optional_int(value: Any) -> Optional[int]:
+    """Like :func:`coerce_int` but keeps ``None`` for missing or unparseable values."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 @dataclass(frozen=True)
 class CycleState:
     requested: int
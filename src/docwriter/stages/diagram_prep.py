@@ -2,47 +2,64 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import get_settings
-from ..messaging import publish_stage_event, send_queue_message
-from ..storage import BlobStore, JobStoragePaths
+from ..messaging import OutboundBus, publish_stage_event, send_queue_message
+from ..storage import JobStoragePaths, get_blob_store
 from ..telemetry import track_exception
 
-
 DIAGRAM_BLOCK_RE = re.compile(r"```(?P<lang>plantuml)\s+(?P<body>[\s\S]*?)```", re.IGNORECASE)
 INLINE_UML_RE = re.compile(r"@startuml[\s\S]*?@enduml", re.IGNORECASE)
+# Markdown fences and "' diagram_id: ..." style comment lines. Spelled out rather than IGNORECASE,
+# which would also accept dotted/dotless i where a str.lower() comparison does not.
+DROPPED_LINE_RE = re.compile(r"\s*(?:```|(?:'|//|#).*[Dd][Ii][Aa][Gg][Rr][Aa][Mm]_[Ii][Dd])")
 DIAGRAM_ID_RE = re.compile(r"(?:^|\n)\s*(?:'|//|#)\s*diagram_id\s*:\s*([A-Za-z0-9_.\-]+)", re.IGNORECASE)
+SLUG_INVALID_RE = re.compile(r"[^a-z0-9_.-]+")
 
 
 def _sanitize_source(body: str) -> str:
     raw = body.replace("\r\n", "\n").replace("\r", "\n")
     raw = raw.replace("\\n", "\n")
+    lowered = raw.lower()
+    if "```" not in raw and "diagram_id" not in lowered:
+        # Well-formed source: nothing to drop past the leading blank lines, so slice them
+        # off without splitting into lines at all.
+        content = raw.lstrip()
+        if _is_startuml(content):
+            start = raw.rfind("\n", 0, len(raw) - len(content)) + 1
+            # Only blank lines were dropped, so the lowered source still answers the @enduml check.
+            return _ensure_enduml(raw[start:], "@enduml" in lowered)
     lines = raw.split("\n")
     sanitized: List[str] = []
     started = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("```"):
+    for idx, line in enumerate(lines):
+        if DROPPED_LINE_RE.match(line):
             continue
-        if not started:
-            if stripped.lower().startswith("@startuml"):
-                sanitized.append(line)
-                started = True
-            elif stripped.startswith(("'", "//", "#")) and "diagram_id" in stripped.lower():
-                continue
-            elif stripped == "":
-                continue
-            else:
-                sanitized.append(line)
-        else:
-            if stripped.startswith(("'", "//", "#")) and "diagram_id" in stripped.lower():
-                continue
+        stripped = line.strip()
+        if _is_startuml(stripped):
+            # Past the opening marker only fences and diagram_id comments are dropped.
+            sanitized.append(line)
+            sanitized.extend(rest for rest in lines[idx + 1 :] if not DROPPED_LINE_RE.match(rest))
+            started = True
+            break
+        if stripped:
             sanitized.append(line)
     if not started:
         sanitized = ["@startuml"] + sanitized + ["@enduml"]
-    text = "\n".join(sanitized)
-    if "@enduml" not in text.lower():
+    return _ensure_enduml("\n".join(sanitized))
+
+
+def _is_startuml(stripped_line: str) -> bool:
+    # Lowercase just the marker-sized prefix instead of the whole line.
+    return stripped_line[:9].lower() == "@startuml"
+
+
+def _ensure_enduml(text: str, has_enduml: Optional[bool] = None) -> str:
+    if has_enduml is None:
+        has_enduml = "@enduml" in text.lower()
+    if not has_enduml:
         if not text.endswith("\n"):
             text += "\n"
         text += "@enduml"
@@ -60,35 +77,41 @@ def _validate_plantuml_source(source: str) -> List[str]:
         issues.append("contains markdown code fences inside PlantUML")
     if "@startmermaid" in lower or "```mermaid" in lower:
         issues.append("contains Mermaid instead of PlantUML")
-    stripped = re.sub(r"@startuml", "", source, flags=re.IGNORECASE)
-    stripped = re.sub(r"@enduml", "", stripped, flags=re.IGNORECASE).strip()
-    if not stripped:
+    if not lower.replace("@startuml", "").replace("@enduml", "").strip():
         issues.append("empty diagram body")
     return issues
 
 
-def _extract_diagrams(markdown: str) -> List[Tuple[str, str]]:
-    matches: List[Tuple[int, int, str, str]] = []
-
-    for match in DIAGRAM_BLOCK_RE.finditer(markdown):
-        body = match.group("body").strip()
-        matches.append((*match.span(), match.group(0), body))
+def _slugify(value: str) -> str:
+    return SLUG_INVALID_RE.sub("-", value.lower()).strip("-") or "diagram"
 
-    def _span_overlaps(span: Tuple[int, int]) -> bool:
-        return any(not (span[1] <= s or span[0] >= e) for s, e, _, _ in matches)
 
+def _extract_diagrams(markdown: str) -> List[Tuple[str, str]]:
+    # Most drafts have no diagrams; a substring probe is far cheaper than both lazy regex scans.
+    # casefold (not lower) so it admits everything the IGNORECASE patterns do, e.g. long s (U+017F) for "s".
+    folded = markdown.casefold()
+    if "@startuml" not in folded and "```plantuml" not in folded:
+        return []
+    fenced = [(match.span(), match.group(0), match.group("body").strip()) for match in DIAGRAM_BLOCK_RE.finditer(markdown)]
+    diagrams: List[Tuple[str, str]] = []
+    # Both match lists come out in document order and fenced spans never overlap each
+    # other, so one sweep merges them and skips inline diagrams that touch a fence.
+    idx = 0
     for match in INLINE_UML_RE.finditer(markdown):
-        span = match.span()
-        if _span_overlaps(span):
+        start, end = match.span()
+        while idx < len(fenced) and fenced[idx][0][1] <= start:
+            diagrams.append(fenced[idx][1:])
+            idx += 1
+        if idx < len(fenced) and fenced[idx][0][0] < end:
             continue
         block = match.group(0)
         body = block.replace("@startuml", "", 1).rsplit("@enduml", 1)[0].strip()
-        matches.append((*span, block, f"@startuml\n{body}\n@enduml"))
-
-    matches.sort(key=lambda item: item[0])
-    return [(block, body) for _, _, block, body in matches]
+        diagrams.append((block, f"@startuml\n{body}\n@enduml"))
+    diagrams.extend((block, body) for _, block, body in fenced[idx:])
+    return diagrams
 
 
+@OutboundBus()
 def process_diagram_prep(data: Dict[str, Any]) -> None:
     settings = get_settings()
     job_id = data.get("job_id")
@@ -101,7 +124,7 @@ def process_diagram_prep(data: Dict[str, Any]) -> None:
         return
     job_paths = JobStoragePaths(user_id=user_id, job_id=job_id)
 
-    store = BlobStore()
+    store = get_blob_store()
     markdown = store.get_text(blob=data["out"])
 
     diagrams = _extract_diagrams(markdown)
@@ -117,49 +140,43 @@ def process_diagram_prep(data: Dict[str, Any]) -> None:
         plan_specs = (data.get("plan") or {}).get("diagram_specs") or []
     except Exception:
         plan_specs = []
-    spec_lookup = {}
-    ordered_specs: List[Dict[str, Any]] = []
-    for spec in plan_specs:
-        if not isinstance(spec, dict):
-            continue
-        ordered_specs.append(spec)
+    ordered_specs = [spec for spec in plan_specs if isinstance(spec, dict)]
+    spec_lookup: Dict[str, int] = {}
+    for idx, spec in enumerate(ordered_specs):
         spec_id = spec.get("diagram_id")
         if isinstance(spec_id, str) and spec_id:
-            spec_lookup[spec_id] = spec
+            spec_lookup[spec_id] = idx
+    claimed = [False] * len(ordered_specs)
+    next_unclaimed = 0
 
-    def _claim_spec(spec_id: str | None, used: set[int]) -> Dict[str, Any] | None:
+    def _claim_spec(spec_id: str | None) -> Dict[str, Any] | None:
+        # Claims only ever grow, so the first unclaimed spec never moves backwards.
+        nonlocal next_unclaimed
         if spec_id and spec_id in spec_lookup:
-            spec = spec_lookup[spec_id]
-            used.add(id(spec))
-            return spec
-        for candidate in ordered_specs:
-            cid = id(candidate)
-            if cid in used:
-                continue
-            used.add(cid)
-            return candidate
-        return None
-
-    def _slugify(value: str) -> str:
-        cleaned = re.sub(r"[^a-z0-9_.-]+", "-", value.lower())
-        cleaned = cleaned.strip("-") or "diagram"
-        return cleaned
-
-    requests: List[Dict[str, Any]] = []
-    code_blocks: Dict[str, str] = {}
+            idx = spec_lookup[spec_id]
+            claimed[idx] = True
+            return ordered_specs[idx]
+        while next_unclaimed < len(ordered_specs) and claimed[next_unclaimed]:
+            next_unclaimed += 1
+        if next_unclaimed == len(ordered_specs):
+            return None
+        claimed[next_unclaimed] = True
+        return ordered_specs[next_unclaimed]
+
+    prepared: List[Tuple[str, str, Dict[str, Any]]] = []
     preferred_format = _normalize_format(data.get("diagram_format"))
-    used_specs: set[int] = set()
     for idx, (code_block, body) in enumerate(diagrams, start=1):
         ident_match = DIAGRAM_ID_RE.search(code_block)
         diagram_id = ident_match.group(1).strip() if ident_match else None
-        spec = _claim_spec(diagram_id, used_specs)
+        spec = _claim_spec(diagram_id)
         if not diagram_id:
             if spec and isinstance(spec.get("diagram_id"), str):
                 diagram_id = spec.get("diagram_id")
         if not diagram_id:
             diagram_id = f"diagram_{idx}"
         safe_id = _slugify(diagram_id)
-        fmt = _normalize_format((spec or {}).get("format") or preferred_format)
+        spec_format = (spec or {}).get("format")
+        fmt = _normalize_format(spec_format) if spec_format else preferred_format
         alt_text = None
         if spec:
             alt_text = spec.get("alt_text") or spec.get("title") or spec.get("diagram_type")
@@ -182,22 +199,34 @@ def process_diagram_prep(data: Dict[str, Any]) -> None:
             )
             return
         source_blob = job_paths.diagrams(f"{safe_id}.puml")
-        try:
-            store.put_text(blob=source_blob, text=clean_source)
-        except Exception as exc:
-            track_exception(exc, {"job_id": job_id, "stage": "DIAGRAM_PREP", "operation": "write_diagram_source"})
-            continue
-        code_blocks[diagram_id] = code_block
-        requests.append(
-            {
-                "diagram_id": diagram_id,
-                "source_path": source_blob,
-                "format": fmt,
-                "blob_path": blob_path,
-                "alt_text": alt_text,
-            }
+        prepared.append(
+            (
+                code_block,
+                clean_source,
+                {
+                    "diagram_id": diagram_id,
+                    "source_path": source_blob,
+                    "format": fmt,
+                    "blob_path": blob_path,
+                    "alt_text": alt_text,
+                },
+            )
         )
 
+    # Every diagram validated; upload the sources together rather than one round-trip at a time.
+    requests: List[Dict[str, Any]] = []
+    code_blocks: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(len(prepared), 8), thread_name_prefix="diagram-prep") as pool:
+        futures = [pool.submit(store.put_text, request["source_path"], source) for _, source, request in prepared]
+        for (code_block, _, request), future in zip(prepared, futures, strict=True):
+            try:
+                future.result()
+            except Exception as exc:
+                track_exception(exc, {"job_id": job_id, "stage": "DIAGRAM_PREP", "operation": "write_diagram_source"})
+                continue
+            code_blocks[request["diagram_id"]] = code_block
+            requests.append(request)
+
     finalize_payload = {**data, "diagram_code_blocks": code_blocks}
     finalize_payload.setdefault("user_id", user_id)
     message = {
@@ -1,25 +1,36 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
-from azure.data.tables import TableServiceClient
-from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables import TableServiceClient, TableTransactionError, UpdateMode
 
+from . import json_utils
 from .config import get_settings
 from .document_index import get_document_index_store
+from .storage import get_shared_transport
+from .telemetry import track_exception
 
 _lock = threading.Lock()
 _store: Optional["StatusTableStore"] = None
+_CYCLE_COLUMNS = ("cycles", "expected_cycles", "cycles_completed", "cycles_remaining", "details")
+# job_id is bound as a query parameter, so it is escaped by the SDK and the filter text never changes.
+_HISTORY_FILTER = "PartitionKey eq @job_id and RowKey ne 'latest'"
+_SYSTEM_KEYS = frozenset({"PartitionKey", "RowKey", "Timestamp"})
+
+# One writer keeps a job's index updates in order; record() overlaps the upsert with its
+# own table writes and waits for it before returning.
+_INDEX_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="document-index")
 
 
 def _coerce_value(value: Any) -> Any:
     if isinstance(value, (str, int, float, bool)) or value is None:
         return value
     try:
-        return json.dumps(value)
+        return json_utils.dumps(value)
     except Exception:
         return str(value)
 
@@ -38,14 +49,54 @@ def _coerce_int_safe(value: Any) -> Optional[int]:
         return None
 
 
+def _index_fields(payload: Dict[str, Any], ts: float) -> Dict[str, Any]:
+    details_payload = payload.get("details")
+    expected_cycles = None
+    cycles_completed = None
+    if isinstance(details_payload, dict):
+        expected_cycles = details_payload.get("expected_cycles") or details_payload.get("cycles")
+        cycles_completed = details_payload.get("cycles_completed")
+    if expected_cycles is None:
+        expected_cycles = payload.get("cycles")
+    stage_value = str(payload.get("stage", ""))
+    has_error = stage_value.upper().endswith("_FAILED")
+    return {
+        "stage": stage_value,
+        "message": payload.get("message"),
+        "artifact": payload.get("artifact"),
+        "updated": ts,
+        "cycles_requested": _coerce_int_safe(expected_cycles),
+        "cycles_completed": _coerce_int_safe(cycles_completed),
+        "has_error": has_error,
+        "last_error": payload.get("message") if has_error else None,
+    }
+
+
+def _apply_index_update(user_id: str, job_id: str, payload: Dict[str, Any], ts: float) -> None:
+    # Index failures never fail the status write, but they are reported rather than dropped.
+    try:
+        get_document_index_store().upsert(user_id, job_id, **_index_fields(payload, ts))
+    except Exception as exc:
+        track_exception(exc, {"job_id": job_id, "action": "document_index_upsert"})
+
+
 class StatusTableStore:
     def __init__(self, connection_string: str, table_name: str) -> None:
-        self._service = TableServiceClient.from_connection_string(connection_string)
+        self._service = TableServiceClient.from_connection_string(connection_string, transport=get_shared_transport())
+        self._table_name = table_name
         self._table = self._service.get_table_client(table_name)
-        try:
-            self._table.create_table()
-        except ResourceExistsError:
-            pass
+        # Creating the table costs a round-trip, so it waits for the first write instead of
+        # running on every cold start that may only read (or never touch) status.
+        self._table_ready = False
+        self._table_lock = threading.Lock()
+
+    def _ensure_table(self) -> None:
+        if self._table_ready:
+            return
+        with self._table_lock:
+            if not self._table_ready:
+                self._service.create_table_if_not_exists(self._table_name)
+                self._table_ready = True
 
     def record(self, payload: Dict[str, Any]) -> None:
         job_id = payload.get("job_id")
@@ -66,42 +117,31 @@ class StatusTableStore:
                 continue
             entity[key] = _coerce_value(value)
         entity["updated"] = _coerce_value(ts)
-        self._table.upsert_entity(entity=entity, mode="replace")
 
         history_entity = dict(entity)
         history_entity["RowKey"] = _history_row_key(ts, payload.get("stage"))
         history_entity["is_latest"] = False
-        self._table.upsert_entity(entity=history_entity, mode="replace")
-
         user_id = payload.get("user_id")
+        index_update: Optional[Future[None]] = None
         if isinstance(user_id, str) and user_id:
+            index_update = _INDEX_EXECUTOR.submit(_apply_index_update, user_id, job_id, payload, ts)
+        try:
+            self._ensure_table()
+            # Both rows share the job's partition, so one entity-group transaction writes them together.
             try:
-                index_store = get_document_index_store()
-                details_payload = payload.get("details")
-                expected_cycles = None
-                cycles_completed = None
-                if isinstance(details_payload, dict):
-                    expected_cycles = details_payload.get("expected_cycles") or details_payload.get("cycles")
-                    cycles_completed = details_payload.get("cycles_completed")
-                if expected_cycles is None:
-                    expected_cycles = payload.get("cycles")
-                stage_value = str(payload.get("stage", ""))
-                stage_upper = stage_value.upper()
-                has_error = stage_upper.endswith("_FAILED")
-                index_store.upsert(
-                    user_id,
-                    job_id,
-                    stage=stage_value,
-                    message=payload.get("message"),
-                    artifact=payload.get("artifact"),
-                    updated=ts,
-                    cycles_requested=_coerce_int_safe(expected_cycles),
-                    cycles_completed=_coerce_int_safe(cycles_completed),
-                    has_error=has_error,
-                    last_error=payload.get("message") if has_error else None,
+                self._table.submit_transaction(
+                    [
+                        ("upsert", entity, {"mode": UpdateMode.REPLACE}),
+                        ("upsert", history_entity, {"mode": UpdateMode.REPLACE}),
+                    ]
                 )
-            except Exception:
-                pass
+            except TableTransactionError:
+                self._table.upsert_entity(entity=entity, mode=UpdateMode.REPLACE)
+                self._table.upsert_entity(entity=history_entity, mode=UpdateMode.REPLACE)
+        finally:
+            # Nothing is left pending once the handler returns and the host may freeze the worker.
+            if index_update is not None:
+                index_update.result()
 
     def latest(self, job_id: str) -> Optional[Dict[str, Any]]:
         try:
@@ -109,8 +149,8 @@ class StatusTableStore:
         except ResourceNotFoundError:
             return None
         result: Dict[str, Any] = {}
-        for key, value in dict(entity).items():
-            if key in {"PartitionKey", "RowKey", "Timestamp"} or key.startswith("odata."):
+        for key, value in entity.items():
+            if key in _SYSTEM_KEYS or key.startswith("odata."):
                 continue
             if key == "updated" and isinstance(value, str):
                 result["ts"] = value
@@ -120,22 +160,55 @@ class StatusTableStore:
             result["job_id"] = job_id
         return result
 
-    def timeline(self, job_id: str) -> List[Dict[str, Any]]:
-        filter_expr = f"PartitionKey eq '{job_id}' and RowKey ne 'latest'"
-        entities = list(self._table.query_entities(query_filter=filter_expr))
+    def cycle_history(self, job_id: str) -> List[Dict[str, Any]]:
+        """History rows that can carry cycle metadata, oldest-first, with only those columns read.
+
+        Most rows carry cycle fields inside the ``details`` JSON, which a table filter cannot
+        inspect, so the query keeps the plain history filter and rows without any cycle field
+        are dropped here; the caller still decides which row populates what.
+        """
+        entities = self._table.query_entities(
+            query_filter=_HISTORY_FILTER,
+            parameters={"job_id": job_id},
+            select=["RowKey", *_CYCLE_COLUMNS],
+        )
+        rows: List[Dict[str, Any]] = []
+        try:
+            for entity in entities:
+                row = {key: entity.get(key) for key in _CYCLE_COLUMNS if entity.get(key) not in (None, "")}
+                details = row.get("details")
+                # Details without any cycle field would parse to nothing; skip them here.
+                if len(row) > (1 if details is not None else 0) or (isinstance(details, str) and "cycles" in details):
+                    rows.append(row)
+        except ResourceNotFoundError:
+            # Table not created yet: nothing has been recorded.
+            return []
+        return rows
+
+    def timeline(self, job_id: str, columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Status history oldest-first; ``columns`` limits which properties are fetched."""
+        query: Dict[str, Any] = {"query_filter": _HISTORY_FILTER, "parameters": {"job_id": job_id}}
+        if columns:
+            query["select"] = ["RowKey", *columns]
         events: List[Dict[str, Any]] = []
-        for entity in sorted(entities, key=lambda e: e["RowKey"]):
-            event: Dict[str, Any] = {"job_id": job_id}
-            for key, value in dict(entity).items():
-                if key in {"PartitionKey", "RowKey", "Timestamp"} or key.startswith("odata."):
-                    continue
-                if key == "updated":
-                    event["ts"] = value
-                    continue
-                event[key] = value
-            if "ts" not in event:
-                event["ts"] = entity.get("RowKey")
-            events.append(event)
+        # The service returns a partition's rows ordered by RowKey, and history RowKeys are
+        # zero-padded microsecond timestamps, so this is already chronological.
+        try:
+            for entity in self._table.query_entities(**query):
+                event: Dict[str, Any] = {"job_id": job_id}
+                for key, value in entity.items():
+                    if key in _SYSTEM_KEYS or key.startswith("odata."):
+                        continue
+                    if key == "updated":
+                        event["ts"] = value
+                        continue
+                    event[key] = value
+                if "ts" not in event:
+                    event["ts"] = entity.get("RowKey")
+                events.append(event)
+        except ResourceNotFoundError:
+            # Table not created yet: nothing has been recorded.
+            return []
         return events
 
 
@@ -1,36 +1,100 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+import gzip
+import io
+import logging
 import posixpath
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Optional
 
 try:
-    from azure.storage.blob import BlobServiceClient  # type: ignore
+    from azure.storage.blob import BlobServiceClient, ContentSettings  # type: ignore
 except Exception:  # pragma: no cover
     BlobServiceClient = None  # type: ignore
+    ContentSettings = None  # type: ignore
+
+try:
+    from azure.core import MatchConditions  # type: ignore
+    from azure.core.exceptions import (  # type: ignore
+        ResourceExistsError,
+        ResourceModifiedError,
+        ResourceNotFoundError,
+    )
+except Exception:  # pragma: no cover
+    MatchConditions = None  # type: ignore
+    ResourceExistsError = ResourceModifiedError = ResourceNotFoundError = None  # type: ignore
+
+try:
+    import requests  # type: ignore
+    from azure.core.pipeline.transport import RequestsTransport  # type: ignore
+except Exception:  # pragma: no cover
+    requests = None  # type: ignore
+    RequestsTransport = None  # type: ignore
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
 
 from .config import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Containers already created (or found to exist) by this process; creation is one round-trip per
+# process, not per BlobStore.
+_ENSURED_CONTAINERS: set[tuple[str, str]] = set()
+# Relative paths made only of ordinary components, which normpath leaves as they are.
+_CLEAN_RELATIVE_RE = re.compile(r"(?!\.\.?(?:/|$))[^/]+(?:/(?!\.\.?(?:/|$))[^/]+)*")
+# Blobs over the SDK's single-put limit are uploaded as blocks; send that many blocks at once.
+_UPLOAD_CONCURRENCY = 8
+
+_transport_lock = threading.Lock()
+_shared_transport: Optional["RequestsTransport"] = None
+
 
-@dataclass(frozen=True)
+def get_shared_transport() -> Optional["RequestsTransport"]:
+    """Process-wide HTTP transport so storage clients share one session and connection pool.
+
+    The transport does not own its session: a client that is closed, or leaves its ``with``
+    block, closes the transport, and that must not close the pool for every other client.
+    """
+    global _shared_transport
+    if RequestsTransport is None:
+        return None
+    with _transport_lock:
+        if _shared_transport is None:
+            _shared_transport = RequestsTransport(session=requests.Session(), session_owner=False)
+        return _shared_transport
+
+
+@dataclass(frozen=True, slots=True)
 class BlobPath:
     container: str
     blob: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobStoragePaths:
     user_id: str
     job_id: str
+    _root: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.user_id:
             raise ValueError("user_id is required for JobStoragePaths")
         if not self.job_id:
             raise ValueError("job_id is required for JobStoragePaths")
+        root = f"jobs/{self._sanitize_segment(self.user_id)}/{self._sanitize_segment(self.job_id)}"
+        object.__setattr__(self, "_root", root)
 
     @property
     def root(self) -> str:
-        return f"jobs/{self._sanitize_segment(self.user_id)}/{self._sanitize_segment(self.job_id)}"
+        return self._root
 
     def draft(self) -> str:
         return self._join("draft.md")
@@ -63,10 +127,12 @@ class JobStoragePaths:
         return self._join(relative)
 
     def _join(self, *segments: str) -> str:
+        if len(segments) == 1 and segments[0]:
+            return f"{self._root}/{self._normalize_relative(segments[0])}"
         normalized = [self._normalize_relative(seg) for seg in segments if seg]
         if not normalized:
-            return self.root
-        return f"{self.root}/{'/'.join(normalized)}"
+            return self._root
+        return f"{self._root}/{'/'.join(normalized)}"
 
     @staticmethod
     def _sanitize_segment(segment: str) -> str:
@@ -78,11 +144,16 @@ class JobStoragePaths:
         return segment
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_relative(relative: str) -> str:
         relative = (relative or "").strip()
         if not relative:
             raise ValueError("Relative path segment cannot be empty")
-        cleaned = posixpath.normpath(relative.strip("/"))
+        stripped = relative.strip("/")
+        if _CLEAN_RELATIVE_RE.fullmatch(stripped):
+            # No empty, "." or ".." components: normpath would return it unchanged.
+            return stripped
+        cleaned = posixpath.normpath(stripped)
         if cleaned in {"", "."}:
             raise ValueError("Relative path resolves to empty")
         if cleaned.startswith("../") or cleaned == "..":
@@ -90,6 +161,61 @@ class JobStoragePaths:
         return cleaned
 
 
+def compress_bytes(data: bytes) -> tuple[bytes, str]:
+    """Compress a payload for upload; returns the bytes and their Content-Encoding."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data), "zstd"
+    return gzip.compress(data, compresslevel=1), "gzip"
+
+
+def decompress_bytes(data: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo ``compress_bytes`` based on the blob's Content-Encoding; other blobs pass through."""
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard not installed. Install with `pip install zstandard`.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+class _PreallocatedSink(io.RawIOBase):
+    """Seekable write target over a fixed-size bytearray, for ``StorageStreamDownloader.readinto``."""
+
+    def __init__(self, size: int) -> None:
+        self.buffer = bytearray(size)
+        self._view = memoryview(self.buffer)
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        self._pos = offset
+        return self._pos
+
+    def write(self, data) -> int:  # type: ignore[override]
+        size = len(data)
+        self._view[self._pos : self._pos + size] = data
+        self._pos += size
+        return size
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+
 class BlobStore:
     def __init__(self):
         self.settings = get_settings()
@@ -99,30 +225,123 @@ class BlobStore:
             )
         if not self.settings.blob_connection_string:
             raise RuntimeError("AZURE_STORAGE_CONNECTION_STRING not set")
-        self.client = BlobServiceClient.from_connection_string(self.settings.blob_connection_string)
+        self.client = BlobServiceClient.from_connection_string(
+            self.settings.blob_connection_string, transport=get_shared_transport()
+        )
         self.container = self.client.get_container_client(self.settings.blob_container)
-        try:
-            self.container.create_container()
-        except Exception:
-            pass
+        container_key = (self.settings.blob_connection_string, self.settings.blob_container)
+        if container_key not in _ENSURED_CONTAINERS:
+            try:
+                self.container.create_container()
+            except ResourceExistsError:
+                _ENSURED_CONTAINERS.add(container_key)
+            except Exception:
+                # Credentials may not allow creating containers that already exist; keep going,
+                # but leave the key out so the next BlobStore tries again.
+                logger.warning("Could not ensure blob container %s", self.settings.blob_container, exc_info=True)
+            else:
+                _ENSURED_CONTAINERS.add(container_key)
 
     def allocate_document_blob(self, job_id: str, user_id: str) -> str:
         return JobStoragePaths(user_id=user_id, job_id=job_id).draft()
 
     def put_text(self, blob: str, text: str) -> BlobPath:
-        self.container.upload_blob(name=blob, data=text.encode("utf-8"), overwrite=True)
+        data = text.encode("utf-8")
+        # An explicit length lets the SDK pick single-shot vs. block upload without probing the data.
+        self.container.upload_blob(
+            name=blob, data=data, length=len(data), overwrite=True, max_concurrency=_UPLOAD_CONCURRENCY
+        )
         return BlobPath(container=self.settings.blob_container, blob=blob)
 
-    def put_bytes(self, blob: str, data_bytes: bytes) -> BlobPath:
-        self.container.upload_blob(name=blob, data=data_bytes, overwrite=True)
+    def put_texts(self, items: Iterable[tuple[str, str]]) -> list[BlobPath]:
+        """Upload several text blobs concurrently; results follow the input order."""
+        pending = list(items)
+        if len(pending) <= 1:
+            return [self.put_text(blob=blob, text=text) for blob, text in pending]
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="blob-put") as pool:
+            futures = [pool.submit(self.put_text, blob, text) for blob, text in pending]
+            return [future.result() for future in futures]
+
+    def put_bytes(self, blob: str, data_bytes: bytes, content_encoding: Optional[str] = None) -> BlobPath:
+        if content_encoding:
+            self.container.upload_blob(
+                name=blob,
+                data=data_bytes,
+                length=len(data_bytes),
+                overwrite=True,
+                max_concurrency=_UPLOAD_CONCURRENCY,
+                content_settings=ContentSettings(content_encoding=content_encoding),
+            )
+        else:
+            self.container.upload_blob(
+                name=blob,
+                data=data_bytes,
+                length=len(data_bytes),
+                overwrite=True,
+                max_concurrency=_UPLOAD_CONCURRENCY,
+            )
         return BlobPath(container=self.settings.blob_container, blob=blob)
 
+    def put_compressed_text(self, blob: str, text: str) -> BlobPath:
+        """Upload text compressed (zstd when available, else gzip); ``get_text`` decodes it."""
+        data_bytes, encoding = compress_bytes(text.encode("utf-8"))
+        return self.put_bytes(blob=blob, data_bytes=data_bytes, content_encoding=encoding)
+
     def get_text(self, blob: str) -> str:
-        data = self.container.download_blob(blob).readall()
+        # Download straight into a buffer sized from the blob properties and decode from it,
+        # skipping the intermediate bytes object readall() would build.
+        downloader = self.container.download_blob(blob, decompress=False)
+        sink = _PreallocatedSink(downloader.size)
+        try:
+            downloader.readinto(sink)
+        finally:
+            sink.close()
+        data = decompress_bytes(sink.buffer, downloader.properties.content_settings.content_encoding)
         return data.decode("utf-8")
 
     def get_bytes(self, blob: str) -> bytes:
-        return self.container.download_blob(blob).readall()
+        downloader = self.container.download_blob(blob, decompress=False)
+        data = downloader.readall()
+        return decompress_bytes(data, downloader.properties.content_settings.content_encoding)
+
+    def get_bytes_with_etag(self, blob: str) -> tuple[Optional[bytes], Optional[str]]:
+        """Blob contents and ETag, or ``(None, None)`` when the blob does not exist."""
+        try:
+            downloader = self.container.download_blob(blob, decompress=False)
+        except ResourceNotFoundError:
+            return None, None
+        data = downloader.readall()
+        props = downloader.properties
+        return decompress_bytes(data, props.content_settings.content_encoding), props.etag
+
+    def put_bytes_if(
+        self,
+        blob: str,
+        data_bytes: bytes,
+        etag: Optional[str],
+        content_encoding: Optional[str] = None,
+    ) -> bool:
+        """Upload only if the blob still has ``etag`` (or, with ``etag=None``, does not exist yet).
+
+        Returns False when another writer got there first.
+        """
+        kwargs: dict = {}
+        if content_encoding:
+            kwargs["content_settings"] = ContentSettings(content_encoding=content_encoding)
+        if etag is None:
+            kwargs["overwrite"] = False
+        else:
+            kwargs.update(overwrite=True, etag=etag, match_condition=MatchConditions.IfNotModified)
+        try:
+            self.container.upload_blob(name=blob, data=data_bytes, **kwargs)
+        except (ResourceExistsError, ResourceModifiedError):
+            return False
+        return True
+
+    def delete_blob(self, blob: str) -> None:
+        """Delete a blob; a blob that is already gone is not an error."""
+        with contextlib.suppress(ResourceNotFoundError):
+            self.container.delete_blob(blob)
 
     def list_blobs(self, prefix: str) -> list[str]:
         """List blob names under a prefix."""
@@ -132,3 +351,16 @@ class BlobStore:
             return [blob.name for blob in self.container.list_blobs(name_starts_with=prefix)]
         except Exception:
             return []
+
+
+_lock = threading.Lock()
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Process-wide BlobStore so stages share one client and connection pool."""
+    global _store
+    with _lock:
+        if _store is None:
+            _store = BlobStore()
+        return _store
@@ -1,31 +1,70 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+from . import json_utils
 from .config import get_settings
 from .llm import LLMClient, LLMMessage
 
 
+@lru_cache(maxsize=4)
+def _cached_llm(
+    api_key: Optional[str], base_url: Optional[str], api_version: Optional[str], use_responses: bool
+) -> LLMClient:
+    # Summaries never read last_usage, so one client (and its HTTP pool) can serve every job.
+    return LLMClient(api_key=api_key, base_url=base_url, api_version=api_version, use_responses=use_responses)
+
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You are a precise summarizer. Extract 5-10 bullet key facts/definitions from the text."
+    " Be terse and faithful; no new claims. Output plain bullets."
+)
+
+
 class Summarizer:
     def __init__(self, llm: LLMClient | None = None):
         self.settings = get_settings()
-        self.llm = llm or LLMClient(
-            api_key=self.settings.openai_api_key,
-            base_url=self.settings.openai_base_url,
-            api_version=self.settings.reviewer_api_version or self.settings.openai_api_version,
-            use_responses=self.settings.reviewer_use_responses,
+        self.llm = llm or _cached_llm(
+            self.settings.openai_api_key,
+            self.settings.openai_base_url,
+            self.settings.reviewer_api_version or self.settings.openai_api_version,
+            self.settings.reviewer_use_responses,
         )
 
     def summarize_section(self, markdown: str) -> str:
-        sys = (
-            "You are a precise summarizer. Extract 5-10 bullet key facts/definitions from the text."
-            " Be terse and faithful; no new claims. Output plain bullets."
-        )
         content = self.llm.chat(
             model=self.settings.reviewer_model,
             messages=[
-                LLMMessage("system", sys),
+                LLMMessage("system", _SUMMARY_SYSTEM_PROMPT),
                 LLMMessage("user", markdown),
             ],
         )
         return content if isinstance(content, str) else ""
+
+    def summarize_sections(self, sections: List[str]) -> List[str]:
+        """Summarize several sections in one call; falls back to one call per section."""
+        if len(sections) <= 1:
+            return [self.summarize_section(markdown) for markdown in sections]
+        sys = (
+            f"{_SUMMARY_SYSTEM_PROMPT} Summarize each numbered section separately and return JSON"
+            ' {"summaries": [...]} with one plain-bullet string per section, in order.'
+        )
+        user = "\n\n".join(f"=== Section {idx} ===\n{markdown}" for idx, markdown in enumerate(sections, start=1))
+        try:
+            content = self.llm.chat(
+                model=self.settings.reviewer_model,
+                messages=[LLMMessage("system", sys), LLMMessage("user", user)],
+                response_format={"type": "json_object"},
+            )
+            parsed = content if isinstance(content, dict) else json_utils.loads(content)
+            summaries = parsed.get("summaries") if isinstance(parsed, dict) else None
+            if (
+                isinstance(summaries, list)
+                and len(summaries) == len(sections)
+                and all(isinstance(summary, str) for summary in summaries)
+            ):
+                return summaries
+        except Exception:
+            pass
+        return [self.summarize_section(markdown) for markdown in sections]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import atexit
+import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-import logging
-import os
+from json.encoder import encode_basestring_ascii
 
 try:
     from opentelemetry import trace  # type: ignore
@@ -22,11 +25,18 @@ except Exception:  # pragma: no cover
     TelemetryClient = None  # type: ignore
 
 from .config import get_settings
-from .storage import BlobStore, JobStoragePaths
-
+from .storage import JobStoragePaths, get_blob_store
 
 _initialized = False
 _telemetry_client: TelemetryClient | None = None
+_telemetry_resolved = False
+# Metrics blobs are uploaded off the stage's critical path; pending uploads finish at exit.
+_METRICS_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="metrics")
+atexit.register(_METRICS_EXECUTOR.shutdown, wait=True)
+# Application Insights items are buffered and sent together rather than one POST per event.
+_FLUSH_INTERVAL_S = 5.0
+_flush_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
 
 
 def init_tracer():
@@ -47,26 +57,51 @@ def init_tracer():
 
 
 def get_telemetry_client() -> TelemetryClient | None:
-    global _telemetry_client
-    if _telemetry_client is not None:
-        return _telemetry_client
-    if TelemetryClient is None:
-        _telemetry_client = None
+    global _telemetry_client, _telemetry_resolved
+    if _telemetry_resolved:
         return _telemetry_client
-    instrumentation_key = os.getenv("APPINSIGHTS_INSTRUMENTATION_KEY")
-    if instrumentation_key:
-        _telemetry_client = TelemetryClient(instrumentation_key)
-    else:
-        _telemetry_client = None
+    if TelemetryClient is not None:
+        instrumentation_key = os.getenv("APPINSIGHTS_INSTRUMENTATION_KEY")
+        if instrumentation_key:
+            _telemetry_client = TelemetryClient(instrumentation_key)
+    # Resolved once; without a key every later event is a single flag check.
+    _telemetry_resolved = True
     return _telemetry_client
 
 
+def flush_telemetry() -> None:
+    """Send buffered Application Insights items now (also runs at interpreter exit)."""
+    global _flush_timer
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    client = _telemetry_client
+    if client:
+        try:
+            client.flush()
+        except Exception:
+            logging.exception("Failed to flush Application Insights telemetry")
+
+
+atexit.register(flush_telemetry)
+
+
+def _schedule_flush() -> None:
+    global _flush_timer
+    with _flush_lock:
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_INTERVAL_S, flush_telemetry)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
 def track_event(name: str, properties: dict[str, str] | None = None) -> None:
     client = get_telemetry_client()
     if client:
         try:
             client.track_event(name, properties or {})
-            client.flush()
+            _schedule_flush()
         except Exception:
             logging.exception("Failed to send Application Insights event %s", name)
 
@@ -76,12 +111,12 @@ def track_exception(exc: BaseException, properties: dict[str, str] | None = None
     if client:
         try:
             client.track_exception(type(exc), exc, exc.__traceback__, properties or {})
-            client.flush()
+            _schedule_flush()
         except Exception:
             logging.exception("Failed to send Application Insights exception")
 
 
-@dataclass
+@dataclass(slots=True)
 class StageTiming:
     job_id: str
     stage: str
@@ -108,10 +143,8 @@ def stage_timer(
     user_id: str | None = None,
 ) -> StageTiming:
     """Context manager to time a stage and upload metrics JSON to Blob."""
-    settings = get_settings()
     init_tracer()
     tracer = trace.get_tracer("docwriter") if trace else None
-    appinsights_client = get_telemetry_client()
     timing = StageTiming(job_id=job_id, stage=stage, cycle=cycle, start=time.perf_counter())
     span = None
     if tracer:
@@ -141,15 +174,35 @@ def stage_timer(
         track_event("stage_completed", props_completed)
         # Best-effort metrics upload
         try:
-            store = BlobStore()
-            metrics = {"job_id": job_id, "stage": stage, "cycle": cycle, "duration_s": duration_s}
             if user_id:
-                metrics["user_id"] = user_id
                 blob = JobStoragePaths(user_id=user_id, job_id=job_id).metrics(
                     f"{stage}_{('cycle'+str(cycle)) if cycle else 'once'}.json"
                 )
             else:
                 blob = f"jobs/{job_id}/metrics/{stage}_{('cycle'+str(cycle)) if cycle else 'once'}.json"
-            store.put_text(blob=blob, text=json.dumps(metrics, indent=2))
+            _METRICS_EXECUTOR.submit(_upload_metrics_json, blob, _metrics_json(job_id, stage, cycle, duration_s, user_id))
         except Exception:
             pass
+
+
+def _metrics_json(job_id: str, stage: str, cycle: int | None, duration_s: float, user_id: str | None) -> bytes:
+    """The metrics document has a fixed shape, so format it directly instead of running an encoder.
+
+    ``duration_s`` is a ``perf_counter`` difference, so it is always finite.
+    """
+    lines = [
+        f'  "job_id": {encode_basestring_ascii(str(job_id))}',
+        f'  "stage": {encode_basestring_ascii(str(stage))}',
+        f'  "cycle": {"null" if cycle is None else int(cycle)}',
+        f'  "duration_s": {duration_s:.6f}',
+    ]
+    if user_id:
+        lines.append(f'  "user_id": {encode_basestring_ascii(str(user_id))}')
+    return ("{\n" + ",\n".join(lines) + "\n}").encode("ascii")
+
+
+def _upload_metrics_json(blob: str, data: bytes) -> None:
+    try:
+        get_blob_store().put_bytes(blob=blob, data_bytes=data)
+    except Exception:
+        pass
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Dict, Optional
 
 try:
@@ -11,6 +12,7 @@ try:
 except Exception:  # pragma: no cover
     AutoLockRenewer = None  # type: ignore
 
+from . import json_utils
 from .config import get_settings
 from .messaging import publish_stage_event, service_bus
 from .telemetry import track_exception
@@ -18,32 +20,35 @@ from .telemetry import track_exception
 WorkerHandler = Callable[[Any, Dict[str, Any]], None]
 
 LOG_CONFIGURED = False
+_log_lock = threading.Lock()
 
 
 def configure_logging(worker_name: str) -> None:
     global LOG_CONFIGURED
     if LOG_CONFIGURED:
         return
-    log_level = os.getenv("DOCWRITER_LOG_LEVEL", "INFO").upper()
-    formatter = logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
-    handlers: list[logging.Handler] = []
-
-    log_dir = os.getenv("LOG_DIR")
-    if log_dir:
-        log_path = os.getenv("LOG_DIR")
-        if log_path:
-            path = os.path.abspath(log_path)
-            os.makedirs(path, exist_ok=True)
+    with _log_lock:
+        if LOG_CONFIGURED:
+            return
+        log_level = os.getenv("DOCWRITER_LOG_LEVEL", "INFO").upper()
+        formatter = logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+        handlers: list[logging.Handler] = []
+
+        log_dir = os.getenv("LOG_DIR")
+        if log_dir:
+            path = os.path.abspath(log_dir)
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
             file_handler = logging.FileHandler(os.path.join(path, f"{worker_name}.log"))
             file_handler.setFormatter(formatter)
             handlers.append(file_handler)
 
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    handlers.append(stream_handler)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
 
-    logging.basicConfig(level=log_level, handlers=handlers, force=True)
-    LOG_CONFIGURED = True
+        logging.basicConfig(level=log_level, handlers=handlers, force=True)
+        LOG_CONFIGURED = True
 
 
 def run_processor(
@@ -65,15 +70,19 @@ def run_processor(
     try:
         with client.get_queue_receiver(queue_name, max_wait_time=30) as receiver:
             with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # A single worker gains nothing from the thread hand-off; run the handler in place.
+                submit = pool.submit if max_workers > 1 else _run_inline
                 while True:
                     try:
-                        messages = receiver.receive_messages(max_message_count=10, max_wait_time=30)
+                        messages = receiver.receive_messages(max_message_count=max_workers, max_wait_time=30)
                     except Exception as exc:
                         track_exception(exc, {"queue": queue_name, "operation": "receive_messages"})
                         time.sleep(2)
                         continue
                     if not messages:
                         continue
+                    # Run the whole batch on the pool and settle each message as its handler finishes.
+                    in_flight: Dict[Future, Any] = {}
                     for msg in messages:
                         try:
                             data = _decode_message(msg)
@@ -114,7 +123,9 @@ def run_processor(
                                         "message_id": str(getattr(msg, "message_id", "")),
                                     },
                                 )
-                        fut = pool.submit(handler, msg, data)
+                        in_flight[submit(handler, msg, data)] = msg
+                    for fut in as_completed(in_flight):
+                        msg = in_flight[fut]
                         try:
                             fut.result()
                             receiver.complete_message(msg)
@@ -138,10 +149,21 @@ def run_processor(
             lock_renewer.close()
 
 
-def _decode_message(msg) -> Dict[str, Any]:
-    import json
-
+def _run_inline(handler: WorkerHandler, msg: Any, data: Dict[str, Any]) -> Future:
+    future: Future = Future()
     try:
-        return json.loads(str(msg))
-    except Exception:
-        return json.loads("".join([b.decode("utf-8") for b in msg.body]))
+        future.set_result(handler(msg, data))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _decode_message(msg) -> Dict[str, Any]:
+    # Data bodies arrive as byte chunks; parsing them directly skips building str(msg) first.
+    body = getattr(msg, "body", None)
+    if body is not None:
+        try:
+            return json_utils.loads(b"".join(body))
+        except Exception:
+            pass
+    return json_utils.loads(str(msg))
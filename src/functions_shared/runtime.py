@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Callable, Dict
 
@@ -11,8 +10,11 @@ except Exception as exc:  # pragma: no cover - azure-functions only in runtime
         "azure-functions package is required to run DocWriter Azure Functions"
     ) from exc
 
+from docwriter import json_utils
 from docwriter import workers as worker_utils
 
+logger = logging.getLogger(__name__)
+
 Processor = Callable[[Dict[str, Any]], None]
 
 
@@ -21,17 +23,15 @@ def _decode_body(message: func.ServiceBusMessage) -> Dict[str, Any]:
         body = message.get_body()
     except AttributeError:
         body = None
-    if body is not None:
-        try:
-            raw = body.decode("utf-8")
-        except AttributeError:  # pragma: no cover - body may already be str
-            raw = str(body)
-    else:
-        raw = str(message)
+    # json_utils parses UTF-8 bytes directly; the body itself is only logged at debug level.
+    raw = body if body is not None else str(message)
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        logging.exception("Unable to decode Service Bus message body: %s", raw)
+        return json_utils.loads(raw)
+    except json_utils.JSONDecodeError:
+        logger.exception("Unable to decode Service Bus message body (%d bytes)", len(raw))
+        if logger.isEnabledFor(logging.DEBUG):
+            text = raw.decode("utf-8", "replace") if isinstance(raw, (bytes, bytearray)) else str(raw)
+            logger.debug("Undecodable body: %s", text)
         raise
 
 
@@ -53,5 +53,5 @@ def service_bus_handler(
     try:
         processor(data)
     except Exception:
-        logging.exception("Worker %s failed for job payload", worker_name)
+        logger.exception("Worker %s failed for job payload", worker_name)
         raise
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import json
 import logging
+from functools import lru_cache
 
 import azure.functions as func
 
+from docwriter import json_utils
 from docwriter.status_store import get_status_table_store
 
 app = func.FunctionApp()
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _store():
+    # Resolved once per worker; later messages skip the store lookup and its lock.
+    return get_status_table_store()
 
 
 def _decode_message(message: func.ServiceBusMessage) -> dict[str, object]:
@@ -15,17 +23,15 @@ def _decode_message(message: func.ServiceBusMessage) -> dict[str, object]:
         body = message.get_body()
     except AttributeError:
         body = None
-    if body is None:
-        raw = str(message)
-    else:
-        try:
-            raw = body.decode("utf-8")
-        except AttributeError:
-            raw = str(body)
+    # json_utils parses UTF-8 bytes directly; the body itself is only logged at debug level.
+    raw = body if body is not None else str(message)
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as exc:
-        logging.exception("Failed to decode status message: %s", raw)
+        return json_utils.loads(raw)
+    except json_utils.JSONDecodeError as exc:
+        logger.exception("Failed to decode status message (%d bytes)", len(raw))
+        if logger.isEnabledFor(logging.DEBUG):
+            text = raw.decode("utf-8", "replace") if isinstance(raw, (bytes, bytearray)) else str(raw)
+            logger.debug("Undecodable body: %s", text)
         raise ValueError("Invalid status message payload") from exc
 
 
@@ -38,5 +44,4 @@ def _decode_message(message: func.ServiceBusMessage) -> dict[str, object]:
 )
 def status_topic_listener(msg: func.ServiceBusMessage) -> None:
     payload = _decode_message(msg)
-    store = get_status_table_store()
-    store.record(payload)
+    _store().record(payload)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import azure.functions as func
 
-from docwriter.queue import process_write
 from functions_shared.runtime import service_bus_handler
 
 app = func.FunctionApp()
@@ -15,4 +14,7 @@ app = func.FunctionApp()
     connection="SERVICE_BUS_CONNECTION_STRING",
 )
 def write_trigger(msg: func.ServiceBusMessage) -> None:
+    # Imported on first message so host indexing and cold start skip the agent/LLM stack.
+    from docwriter.queue import process_write
+
     service_bus_handler("worker-write", msg, process_write)
@@ -1,28 +1,31 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
+from collections import deque
 from pathlib import Path
 
 import pytest
 
+from docwriter import json_utils
 from docwriter import queue as queue_module
+from docwriter.config import get_settings
+from docwriter.diagram_renderer import process_diagram_render
 from docwriter.queue import (
-    process_plan_intake,
+    process_finalize,
     process_plan,
-    process_write,
+    process_plan_intake,
+    process_review_cohesion,
     process_review_general,
     process_review_style,
-    process_review_cohesion,
     process_review_summary,
-    process_verify,
     process_rewrite,
-    process_finalize,
+    process_verify,
+    process_write,
 )
 from docwriter.stages.diagram_prep import process_diagram_prep
-from docwriter.diagram_renderer import process_diagram_render
 from docwriter.storage import BlobStore, JobStoragePaths
-from docwriter.config import get_settings
 
 
 def _config_ready() -> bool:
@@ -39,6 +42,9 @@ def _config_ready() -> bool:
     )
 
 
+# Dumping every popped payload (full plans and drafts) is only worth it when debugging a run.
+_VERBOSE = os.environ.get("E2E_VERBOSE") == "1"
+
 pytestmark = pytest.mark.skipif(not _config_ready(), reason="Azure E2E requires cloud credentials")
 
 
@@ -47,10 +53,10 @@ def test_e2e_local_pipeline(monkeypatch):
     settings = get_settings()
     store = BlobStore()
 
-    captured: dict[str, list[dict]] = {}
+    captured: dict[str, deque[dict]] = {}
 
     def fake_send(queue_name: str, payload: dict) -> None:
-        captured.setdefault(queue_name, []).append(payload)
+        captured.setdefault(queue_name, deque()).append(payload)
 
     monkeypatch.setattr(queue_module, "_send", fake_send)
     monkeypatch.setattr(queue_module, "_status", lambda payload: None)
@@ -61,16 +67,18 @@ def test_e2e_local_pipeline(monkeypatch):
         except KeyError:
             pytest.fail(f"No messages captured for queue {queue_name}")
         assert queue, f"No message available in queue {queue_name}"
-        payload = queue.pop(0)
-        print(f"[POP] {queue_name}: {json.dumps(payload, indent=2)}")
+        payload = queue.popleft()
+        if _VERBOSE:
+            print(f"[POP] {queue_name}: {json_utils.dumps(payload, indent=True)}")
         return payload
 
     def try_pop_payload(queue_name: str) -> dict | None:
         queue = captured.get(queue_name)
         if not queue:
             return None
-        payload = queue.pop(0)
-        print(f"[TRY_POP] {queue_name}: {json.dumps(payload, indent=2)}")
+        payload = queue.popleft()
+        if _VERBOSE:
+            print(f"[TRY_POP] {queue_name}: {json_utils.dumps(payload, indent=True)}")
         return payload
 
     with tempfile.TemporaryDirectory() as td:
@@ -104,7 +112,7 @@ def test_e2e_local_pipeline(monkeypatch):
             "diagrams": "High-level architecture diagram showing Dynamics 365, middleware (Logic Apps/Service Bus), and external systems; sequence diagram for message flow",
             "context": "Global manufacturing enterprise modernizing integrations while maintaining SAP and Salesforce back-end connectivity.",
         }
-        store.put_text(blob=job_paths.intake("answers.json"), text=json.dumps(answers))
+        store.put_text(blob=job_paths.intake("answers.json"), text=json_utils.dumps(answers))
         print("[INTAKE] Answers uploaded to Blob Storage")
 
         # Planning
@@ -178,9 +186,10 @@ def test_e2e_local_pipeline(monkeypatch):
             print("[FINALIZE] Final document stored in Blob Storage")
             break
 
-        final_md = store.get_text(job_paths.final("md"))
+        # Only the size is checked, so skip decoding the document to text.
+        final_md = store.get_bytes(job_paths.final("md"))
         assert len(final_md) > 0
-        print(f"[RESULT] Final document length: {len(final_md)} characters")
+        print(f"[RESULT] Final document size: {len(final_md)} bytes")
         if out.exists():
             assert out.stat().st_size > 0
             print(f"[RESULT] Local document size: {out.stat().st_size} bytes")
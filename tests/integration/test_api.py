@@ -1,32 +1,34 @@
 from __future__ import annotations
 
 import json
-from typing import Dict
+from collections import defaultdict, deque
+from typing import Deque, Dict
 
 import pytest
-from fastapi.testclient import TestClient
-
 from azure.core.exceptions import ResourceNotFoundError
+from fastapi.testclient import TestClient
 
 from api.main import app
 
+
 class FakeStatusTableStore:
     def __init__(self) -> None:
         self._latest: Dict[str, Dict] = {}
-        self._history: Dict[str, list[Dict]] = {}
+        self._history: Dict[str, Deque[Dict]] = defaultdict(lambda: deque(maxlen=10_000))
 
     def record(self, payload: Dict) -> None:
         job_id = payload.get("job_id")
         if not job_id:
             return
         self._latest[job_id] = payload
-        self._history.setdefault(job_id, []).append(payload.copy())
+        # Payloads are only read after recording, so history keeps them as-is.
+        self._history[job_id].append(payload)
 
     def latest(self, job_id: str) -> Dict | None:
         return self._latest.get(job_id)
 
-    def timeline(self, job_id: str) -> list[Dict]:
-        return self._history.get(job_id, [])
+    def timeline(self, job_id: str, columns=None) -> list[Dict]:
+        return list(self._history.get(job_id, ()))
 
 
 @pytest.fixture(autouse=True)
@@ -36,8 +38,14 @@ def fake_status_table(monkeypatch):
     yield store
 
 
+@pytest.fixture(scope="module")
+def app_client():
+    # Routes resolve their collaborators per request, so one client serves every test.
+    return TestClient(app)
+
+
 @pytest.fixture
-def client(monkeypatch):
+def client(monkeypatch, app_client):
     saved_jobs = {}
 
     def fake_send_job(job):
@@ -72,7 +80,7 @@ def client(monkeypatch):
     monkeypatch.setattr("api.routers.jobs.BlobStore", lambda: fake_store)
     monkeypatch.setattr("api.routers.intake.InterviewerAgent", lambda: FakeInterviewer())
 
-    return TestClient(app)
+    return app_client
 
 
 def test_create_job(client):
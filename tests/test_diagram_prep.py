@@ -1,4 +1,10 @@
-from docwriter.stages.diagram_prep import _sanitize_source, _validate_plantuml_source
+from types import SimpleNamespace
+
+from docwriter.stages.diagram_prep import (
+    _extract_diagrams,
+    _sanitize_source,
+    _validate_plantuml_source,
+)
 
 
 def test_sanitize_removes_fences_and_adds_guards():
@@ -20,3 +26,65 @@ def test_validate_flags_common_bad_outputs():
 def test_validate_accepts_clean_source():
     clean = "@startuml\nactor User\nUser -> API : Call\n@enduml"
     assert _validate_plantuml_source(clean) == []
+
+
+def test_extract_diagrams_keeps_document_order_without_duplicates():
+    markdown = (
+        "@startuml\nA -> B\n@enduml\n\n"
+        "```plantuml\n@startuml\nC -> D\n@enduml\n```\n\n"
+        "@startuml\nE -> F\n@enduml"
+    )
+    diagrams = _extract_diagrams(markdown)
+    assert [body for _, body in diagrams] == [
+        "@startuml\nA -> B\n@enduml",
+        "@startuml\nC -> D\n@enduml",
+        "@startuml\nE -> F\n@enduml",
+    ]
+    assert diagrams[1][0].startswith("```plantuml")
+
+
+def test_extract_diagrams_prefers_fence_over_overlapping_inline_span():
+    # An unterminated inline @startuml before a fence must not swallow the fenced diagram.
+    markdown = "@startuml\nX\n```plantuml\nA -> B\n@enduml\n```"
+    diagrams = _extract_diagrams(markdown)
+    assert len(diagrams) == 1
+    assert diagrams[0][0].startswith("```plantuml")
+
+
+def test_extract_diagrams_matches_markers_case_insensitively():
+    assert _extract_diagrams("# Intro\n\nNo diagrams here.\n") == []
+    diagrams = _extract_diagrams("```PlantUML\n@StartUML\nA -> B\n@EndUML\n```")
+    assert len(diagrams) == 1
+
+
+def test_diagram_prep_claims_named_specs_before_anonymous_ones(monkeypatch):
+    import docwriter.stages.diagram_prep as diagram_prep
+
+    markdown = "\n\n".join(
+        [
+            "```plantuml\n@startuml\nA -> B\n@enduml\n```",
+            "```plantuml\n' diagram_id: flow\n@startuml\nC -> D\n@enduml\n```",
+            "```plantuml\n@startuml\nE -> F\n@enduml\n```",
+        ]
+    )
+    blobs = {"draft.md": markdown}
+    sent = []
+    monkeypatch.setattr(
+        diagram_prep,
+        "get_blob_store",
+        lambda: SimpleNamespace(get_text=lambda blob: blobs[blob], put_text=blobs.__setitem__),
+    )
+    monkeypatch.setattr(diagram_prep, "get_settings", lambda: SimpleNamespace(sb_queue_diagram_render="render"))
+    monkeypatch.setattr(diagram_prep, "send_queue_message", lambda queue, message: sent.append(message))
+    monkeypatch.setattr(diagram_prep, "publish_stage_event", lambda *args, **kwargs: None)
+    specs = [
+        {"diagram_id": "arch", "title": "Architecture"},
+        {"diagram_id": "flow", "title": "Flow"},
+        {"diagram_id": "deploy", "title": "Deployment"},
+    ]
+
+    diagram_prep.process_diagram_prep({"job_id": "j", "user_id": "u", "out": "draft.md", "plan": {"diagram_specs": specs}})
+
+    requests = sent[0]["diagram_requests"]
+    assert [request["diagram_id"] for request in requests] == ["arch", "flow", "deploy"]
+    assert [request["alt_text"] for request in requests] == ["Architecture", "Flow", "Deployment"]
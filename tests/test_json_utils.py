@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from docwriter import json_utils
+
+
+def test_round_trip_preserves_unicode_and_int_keys():
+    payload = {"title": "Überblick", 1: ["a", {"nested": True}], "n": None}
+
+    text = json_utils.dumps(payload)
+    data = json_utils.loads(text)
+
+    assert "Überblick" in text
+    assert data == {"title": "Überblick", "1": ["a", {"nested": True}], "n": None}
+    assert json_utils.loads(json_utils.dumps_bytes(payload, indent=True)) == data
+
+
+def test_loads_rejects_invalid_json_with_value_error():
+    with pytest.raises(json_utils.JSONDecodeError):
+        json_utils.loads("{not json")
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from docwriter.llm import LLMClient
+
+
+def test_last_usage_is_tracked_per_thread():
+    llm = LLMClient(api_key="test", base_url="http://localhost")
+    both_recorded = threading.Barrier(2)
+    seen: dict[int, int] = {}
+
+    def call(tokens: int) -> None:
+        llm._update_usage(SimpleNamespace(usage={"prompt_tokens": tokens, "completion_tokens": 1}))
+        # Wait until the other thread has recorded its own usage before reading ours back.
+        both_recorded.wait()
+        seen[tokens] = llm.last_usage["total_tokens"]
+
+    threads = [threading.Thread(target=call, args=(tokens,)) for tokens in (10, 20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == {10: 11, 20: 21}
+    assert llm.last_usage == {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import json
 
-from docwriter.messaging import _json_fallback, _sanitize_queue_payload
+from docwriter.config import Settings
+from docwriter.messaging import (
+    OutboundBus,
+    ServiceBusManager,
+    _json_fallback,
+    _sanitize_queue_payload,
+)
 
 
 def test_sanitize_queue_payload_drops_internal_and_callables() -> None:
@@ -30,3 +36,62 @@ def test_json_fallback_handles_non_serializable_values() -> None:
     dumped = json.dumps(payload, default=_json_fallback)
     assert "obj" in dumped
     assert '"fn": null' in dumped
+
+
+def test_outbound_bus_groups_messages_per_destination() -> None:
+    class _Manager:
+        def __init__(self) -> None:
+            self.calls: list = []
+
+        def send_queue_bodies(self, queue_name, bodies):
+            self.calls.append(("queue", queue_name, list(bodies)))
+
+        def publish_status_bodies(self, bodies):
+            self.calls.append(("status", list(bodies)))
+
+    manager = _Manager()
+    with OutboundBus(manager) as bus:
+        bus._add(("status", ""), '{"stage": "A"}')
+        bus._add(("queue", "q1"), '{"n": 1}')
+        bus._add(("status", ""), '{"stage": "B"}')
+        with OutboundBus(manager) as inner:
+            inner._add(("queue", "q1"), '{"n": 2}')
+        assert manager.calls == []
+
+    assert manager.calls == [
+        ("status", ['{"stage": "A"}', '{"stage": "B"}']),
+        ("queue", "q1", ['{"n": 1}', '{"n": 2}']),
+    ]
+
+
+def test_status_disabled_without_service_bus_config(monkeypatch) -> None:
+    monkeypatch.setattr("docwriter.messaging.get_settings", lambda: Settings())
+    assert ServiceBusManager().status_enabled() is False
+    monkeypatch.setattr("docwriter.messaging.get_settings", lambda: Settings(sb_namespace="example"))
+    assert ServiceBusManager().status_enabled() is True
+
+
+def test_senders_are_reused_per_destination(monkeypatch) -> None:
+    opened: list = []
+
+    class _Sender:
+        def __init__(self, name) -> None:
+            self.name = name
+            self.sent: list = []
+            opened.append(name)
+
+        def send_messages(self, message) -> None:
+            self.sent.append(message)
+
+        def close(self) -> None:
+            pass
+
+    class _Client:
+        get_queue_sender = get_topic_sender = staticmethod(_Sender)
+
+    manager = ServiceBusManager()
+    monkeypatch.setattr(manager, "get_client", lambda: _Client())
+    manager.send_queue_bodies("q1", ['{"n": 1}'])
+    manager.send_queue_bodies("q1", ['{"n": 2}'])
+    manager.send_queue_bodies("q2", ['{"n": 3}'])
+    assert opened == ["q1", "q2"]
@@ -1,7 +1,28 @@
 from __future__ import annotations
 
+import copy
+import threading
+from types import SimpleNamespace
+
+from docwriter import json_utils
 from docwriter.config import Settings
-from docwriter.stages.core import _build_batch_context, _plan_review_batches
+from docwriter.stages import core
+from docwriter.stages.core import (
+    _accumulate_section_guidance,
+    _add_review_tokens,
+    _build_batch_context,
+    _carry_review_guidance,
+    _complete_review,
+    _fold_review_delta,
+    _init_review_progress,
+    _load_review_progress,
+    _persist_review_progress,
+    _plan_review_batches,
+    _review_delta,
+    _review_delta_mark,
+    _review_progress_path,
+)
+from docwriter.storage import JobStoragePaths, decompress_bytes
 
 
 def _sample_sections():
@@ -46,3 +67,183 @@ def test_build_batch_context_includes_dependency_stub_once():
     assert "Short summary of section 1" in combined
     assert combined.count("SECTION:2") == 1
     assert combined.count("SECTION:3") == 1
+
+
+def test_review_delta_round_trips_into_snapshot():
+    snapshot = _init_review_progress(None)
+    _accumulate_section_guidance(snapshot, "style", "1", "One", ["a"], [])
+    snapshot["style"].pop("_done_set")
+    snapshot["style"]["delta_seq"] = 0
+
+    progress = copy.deepcopy(snapshot)
+    mark = _review_delta_mark(progress, "style")
+    _accumulate_section_guidance(progress, "style", "2", "Two", ["b"], ["s"])
+    _add_review_tokens(progress, "gpt-4o-mini", 7, "style")
+    delta = _review_delta(progress, mark)
+
+    assert delta["batch_idx"] == 0
+    assert delta["new_sections"] == ["2"]
+    assert delta["delta_accumulated"]["issues"] == ["b"]
+
+    _fold_review_delta(snapshot, "style", delta)
+    assert snapshot["style"]["sections_done"] == ["1", "2"]
+    assert snapshot["style"]["accumulated"]["issues"] == ["a", "b"]
+    assert snapshot["style"]["accumulated"]["suggestions"] == ["s"]
+    assert snapshot["tokens_total"] == 7
+    assert snapshot["style"]["delta_seq"] == 1
+
+
+class _EtagStore:
+    """In-memory blob store with ETag semantics; ``failing`` threads always lose the race."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._blobs: dict[str, tuple[bytes, str | None, int]] = {}
+        self.failing: set[str] = set()
+
+    def get_bytes_with_etag(self, blob):
+        with self._lock:
+            if blob not in self._blobs:
+                return None, None
+            data, encoding, version = self._blobs[blob]
+        return decompress_bytes(data, encoding), str(version)
+
+    def put_bytes(self, blob, data_bytes, content_encoding=None):
+        with self._lock:
+            current = self._blobs.get(blob)
+            self._blobs[blob] = (data_bytes, content_encoding, (current[2] + 1) if current else 0)
+
+    def get_bytes(self, blob):
+        data, encoding, _ = self._blobs[blob]
+        return decompress_bytes(data, encoding)
+
+    def get_text(self, blob):
+        return self.get_bytes(blob).decode("utf-8")
+
+    def put_text(self, blob, text):
+        self.put_bytes(blob, text.encode("utf-8"))
+
+    def list_blobs(self, prefix):
+        return sorted(name for name in self._blobs if name.startswith(prefix))
+
+    def delete_blob(self, blob):
+        self._blobs.pop(blob, None)
+
+    def put_bytes_if(self, blob, data_bytes, etag, content_encoding=None):
+        if threading.current_thread().name in self.failing:
+            return False
+        with self._lock:
+            current = self._blobs.get(blob)
+            if (None if current is None else str(current[2])) != etag:
+                return False
+            self._blobs[blob] = (data_bytes, content_encoding, (current[2] + 1) if current else 0)
+            return True
+
+
+def test_verify_queued_once_when_a_review_merge_fails(monkeypatch):
+    store = _EtagStore()
+    store.failing.add("summary")
+    sent = []
+    monkeypatch.setattr(core, "get_blob_store", lambda: store)
+    monkeypatch.setattr(core, "send_queue_message", lambda queue, payload: sent.append(queue))
+    monkeypatch.setattr(core, "publish_status", lambda payload: None)
+    settings = Settings()
+    job_paths = JobStoragePaths(user_id="u1", job_id="j1")
+    data = {"job_id": "j1", "user_id": "u1"}
+    blob = _review_progress_path(job_paths, 1)
+    start = threading.Barrier(3)
+    errors = {}
+
+    def finish(agent_key: str) -> None:
+        raw, _ = store.get_bytes_with_etag(blob)
+        progress = _init_review_progress(json_utils.loads(raw) if raw is not None else None)
+        progress[agent_key]["done"] = True
+        if _persist_review_progress(job_paths, 1, progress, agent_key=agent_key):
+            _complete_review(data, progress, job_paths, 1, settings)
+
+    def worker(agent_key: str) -> None:
+        start.wait()
+        try:
+            finish(agent_key)
+        except Exception as exc:
+            errors[agent_key] = exc
+
+    threads = [threading.Thread(target=worker, args=(key,), name=key) for key in ("style", "cohesion", "summary")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The failed merge surfaces instead of being swallowed, and nothing is queued yet.
+    assert set(errors) == {"summary"}
+    assert sent == []
+
+    # Service Bus redelivers the summary message; this time the save goes through.
+    store.failing.clear()
+    finish("summary")
+    assert sent == [settings.sb_queue_verify]
+
+    # Later redeliveries of finished agents do not queue verification again.
+    finish("style")
+    finish("summary")
+    assert sent == [settings.sb_queue_verify]
+
+
+def test_review_deltas_are_compacted_and_pruned(monkeypatch):
+    store = _EtagStore()
+    monkeypatch.setattr(core, "get_blob_store", lambda: store)
+    job_paths = JobStoragePaths(user_id="u1", job_id="j1")
+    prefix = core._review_delta_prefix(job_paths, 1, "general")
+    for idx in range(core._REVIEW_DELTA_COMPACT_AFTER + 3):
+        progress = _load_review_progress(job_paths, 1)
+        mark = _review_delta_mark(progress, "general")
+        _accumulate_section_guidance(progress, "general", str(idx), None, [f"issue {idx}"], [])
+        _persist_review_progress(job_paths, 1, progress, delta_mark=mark)
+
+    # Write 0 and write N+1 were snapshots; only the delta written after the compaction remains.
+    assert store.list_blobs(prefix) == [core._review_delta_blob(job_paths, 1, "general", core._REVIEW_DELTA_COMPACT_AFTER)]
+    progress = _load_review_progress(job_paths, 1)
+    expected = [f"issue {idx}" for idx in range(core._REVIEW_DELTA_COMPACT_AFTER + 3)]
+    assert progress["general"]["accumulated"]["issues"] == expected
+
+    progress["general"]["done"] = True
+    _persist_review_progress(job_paths, 1, progress)
+    assert store.list_blobs(prefix) == []
+    assert _load_review_progress(job_paths, 1)["general"]["accumulated"]["issues"] == expected
+
+
+def test_reviewer_cache_is_scoped_to_the_job(monkeypatch):
+    store = _EtagStore()
+    monkeypatch.setattr(core, "get_blob_store", lambda: store)
+    calls = []
+    llm = SimpleNamespace(supports_sampling=lambda model: False, last_usage={"total_tokens": 5})
+
+    def review(*, plan, markdown, sections):
+        calls.append(markdown)
+        return '{"sections": []}'
+
+    settings = Settings()
+    job_paths = JobStoragePaths(user_id="u1", job_id="j1")
+    cached = core._cached_reviewer_call("style", review, llm, settings, job_paths)
+    assert cached(plan={}, markdown="text", sections=[]) == ('{"sections": []}', 5)
+    assert cached(plan={}, markdown="text", sections=[]) == ('{"sections": []}', 0)
+    assert calls == ["text"]
+    assert all(name.startswith(f"{job_paths.root}/cache/reviewer/") for name in store.list_blobs(""))
+
+    # Another job never sees this job's reviewer output.
+    other = core._cached_reviewer_call("style", review, llm, settings, JobStoragePaths(user_id="u2", job_id="j2"))
+    other(plan={}, markdown="text", sections=[])
+    assert calls == ["text", "text"]
+
+
+def test_review_guidance_is_carried_only_when_small():
+    payload = {"review_guidance": {"stale": True}}
+    _carry_review_guidance(payload, True, ("Tighten wording", {"2", "1"}), ("", set()))
+    assert payload["review_guidance"]["style"] == {"text": "Tighten wording", "sections": ["1", "2"]}
+
+    # Too large for the message: rewrite reads style.json/cohesion.json instead.
+    _carry_review_guidance(payload, True, ("x" * (core._MAX_CARRIED_GUIDANCE_BYTES + 1), {"1"}), ("", set()))
+    assert "review_guidance" not in payload
+
+    _carry_review_guidance(payload, False, ("Tighten wording", {"1"}), ("", set()))
+    assert "review_guidance" not in payload
@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import json
-
+from docwriter import json_utils
 from docwriter.agents.reviewer import ReviewerAgent
 
+_REVIEWER_JSON = json_utils.dumps({
+    "findings": ["No contradictions found"],
+    "suggested_changes": [],
+    "revised_markdown": "# Revised\nContent"
+})
+
 
 class FakeLLM:
-    def chat(self, model, messages, stream=False):
-        return json.dumps({
-            "findings": ["No contradictions found"],
-            "suggested_changes": [],
-            "revised_markdown": "# Revised\nContent"
-        })
+    def chat(self, model, messages, stream=False, response_format=None):
+        return _REVIEWER_JSON
 
 
 def test_reviewer_returns_json():
     agent = ReviewerAgent(llm=FakeLLM())
     out = agent.review({"title": "X", "audience": "Y", "glossary": {}, "global_style": {}}, "# D")
-    data = json.loads(out)
+    data = json_utils.loads(out)
     assert "revised_markdown" in data
 
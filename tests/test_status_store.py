@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import docwriter.stages  # noqa: F401  # cycle_repository must be imported through the stages package
+from docwriter import json_utils
+from docwriter.cycle_repository import CycleMetadataRepository
+from docwriter.status_store import _HISTORY_FILTER, StatusTableStore, _coerce_value
+
+
+def _patch_table_service(monkeypatch, table, created: list[str] | None = None) -> None:
+    """Back StatusTableStore with ``table`` through a fake service client."""
+
+    class FakeServiceClient:
+        @classmethod
+        def from_connection_string(cls, conn, **kwargs):
+            return cls()
+
+        def get_table_client(self, name):
+            return table
+
+        def create_table_if_not_exists(self, name):
+            if created is not None:
+                created.append(name)
+
+    monkeypatch.setattr("docwriter.status_store.TableServiceClient", FakeServiceClient)
+    monkeypatch.setattr("docwriter.status_store.get_shared_transport", lambda: None)
+
+
+def test_coerce_value_keeps_scalars_and_serializes_structures() -> None:
+    assert _coerce_value("REVIEW") == "REVIEW"
+    assert _coerce_value(3) == 3
+    assert _coerce_value(None) is None
+    details = {"expected_cycles": 2, "notes": ["Résumé"], 1: "non-str key"}
+    encoded = _coerce_value(details)
+    assert isinstance(encoded, str)
+    assert json_utils.loads(encoded) == {"expected_cycles": 2, "notes": ["Résumé"], "1": "non-str key"}
+
+
+def test_table_is_created_once_on_first_record(monkeypatch) -> None:
+    created: list[str] = []
+    written: list[list] = []
+    _patch_table_service(monkeypatch, SimpleNamespace(submit_transaction=written.append), created)
+    store = StatusTableStore("UseDevelopmentStorage=true", "status")
+
+    assert created == []
+    store.record({"job_id": "job-1", "stage": "PLAN", "ts": 1.0})
+    store.record({"job_id": "job-1", "stage": "WRITE", "ts": 2.0})
+    assert created == ["status"]
+    assert len(written) == 2
+
+
+def test_record_waits_for_the_index_upsert_and_reports_failures(monkeypatch) -> None:
+    written: list[list] = []
+    tracked: list[dict] = []
+
+    class FailingIndex:
+        def upsert(self, user_id, job_id, **fields):
+            raise RuntimeError("index unavailable")
+
+    _patch_table_service(monkeypatch, SimpleNamespace(submit_transaction=written.append))
+    monkeypatch.setattr("docwriter.status_store.get_document_index_store", FailingIndex)
+    monkeypatch.setattr("docwriter.status_store.track_exception", lambda exc, props: tracked.append(props))
+    store = StatusTableStore("UseDevelopmentStorage=true", "status")
+
+    store.record({"job_id": "job-1", "user_id": "user-1", "stage": "PLAN_FAILED", "ts": 1.0})
+
+    # The status rows are still written and the index failure is reported before record() returns.
+    assert len(written) == 1
+    assert tracked == [{"job_id": "job-1", "action": "document_index_upsert"}]
+
+
+def test_cycle_history_projects_cycle_columns_and_skips_rows_without_cycles(monkeypatch) -> None:
+    queries: list[dict] = []
+    rows = [
+        {"RowKey": "1", "details": json_utils.dumps({"expected_cycles": 3, "cycles_completed": 0})},
+        {"RowKey": "2", "details": json_utils.dumps({"tokens": 10})},
+        {"RowKey": "3", "cycles_completed": 1},
+    ]
+    _patch_table_service(monkeypatch, SimpleNamespace(query_entities=lambda **query: queries.append(query) or iter(rows)))
+    store = StatusTableStore("UseDevelopmentStorage=true", "status")
+
+    history = store.cycle_history("job-1")
+
+    assert queries[0]["query_filter"] == _HISTORY_FILTER
+    assert "details" in queries[0]["select"]
+    assert queries[0]["parameters"] == {"job_id": "job-1"}
+    assert [row.get("cycles_completed") for row in history] == [None, 1]
+
+
+def test_hydrate_reads_cycle_history_once_newest_first() -> None:
+    calls: list[str] = []
+
+    class FakeStore:
+        def latest(self, job_id):
+            calls.append("latest")
+            return {"job_id": job_id, "stage": "WRITE_DONE"}
+
+        def cycle_history(self, job_id):
+            calls.append("cycle_history")
+            return [
+                {"details": json_utils.dumps({"expected_cycles": 3, "cycles_completed": 0})},
+                {"details": json_utils.dumps({"expected_cycles": 3, "cycles_completed": 2})},
+            ]
+
+        def timeline(self, job_id, columns=None):
+            raise AssertionError("cycle_history already covers the history scan")
+
+    target: dict = {}
+    repo = CycleMetadataRepository(store_factory=FakeStore)
+
+    assert repo.hydrate(target, "job-1")
+    assert calls == ["latest", "cycle_history"]
+    assert target["cycles_completed"] == 2 and target["expected_cycles"] == 3
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from docwriter.storage import (
+    BlobStore,
+    JobStoragePaths,
+    compress_bytes,
+    decompress_bytes,
+    get_shared_transport,
+)
+
+
+def _patch_blob_service(monkeypatch, container) -> None:
+    """Point BlobStore at ``container`` through a fake service client, with a fresh ensure-cache."""
+
+    class FakeServiceClient:
+        @classmethod
+        def from_connection_string(cls, conn, **kwargs):
+            return cls()
+
+        def get_container_client(self, name):
+            return container
+
+    settings = SimpleNamespace(blob_connection_string="UseDevelopmentStorage=true", blob_container="docs")
+    monkeypatch.setattr("docwriter.storage.BlobServiceClient", FakeServiceClient)
+    monkeypatch.setattr("docwriter.storage.get_settings", lambda: settings)
+    monkeypatch.setattr("docwriter.storage._ENSURED_CONTAINERS", set())
+
+
+def test_compressed_payload_round_trips() -> None:
+    payload = ('{"findings": ["Tighten the intro"], "suggestions": []}' * 50).encode("utf-8")
+    data, encoding = compress_bytes(payload)
+    assert encoding in {"gzip", "zstd"}
+    assert len(data) < len(payload)
+    assert decompress_bytes(data, encoding) == payload
+
+
+def test_uncompressed_payload_passes_through() -> None:
+    assert decompress_bytes(b"plain", None) == b"plain"
+
+
+def test_get_text_decodes_preallocated_download(monkeypatch) -> None:
+    payload = "Résumé section\n".encode() * 100
+    data, encoding = compress_bytes(payload)
+
+    class FakeDownloader:
+        size = len(data)
+        properties = SimpleNamespace(content_settings=SimpleNamespace(content_encoding=encoding))
+
+        def readinto(self, stream):
+            # Write out of order in uneven chunks, as parallel range downloads do.
+            half = len(data) // 2
+            stream.seek(half)
+            stream.write(data[half:])
+            stream.seek(0)
+            return stream.write(data[:half])
+
+    _patch_blob_service(
+        monkeypatch,
+        SimpleNamespace(
+            create_container=lambda: None,
+            download_blob=lambda blob, decompress=False: FakeDownloader(),
+        ),
+    )
+    store = BlobStore()
+    assert store.get_text("jobs/u/j/review.json") == payload.decode("utf-8")
+
+
+def test_job_storage_paths_join_under_sanitized_root() -> None:
+    paths = JobStoragePaths(user_id=" user-1/ ", job_id="job-1")
+    assert paths.root == "jobs/user-1/job-1"
+    assert paths.draft() == "jobs/user-1/job-1/draft.md"
+    assert paths.cycle(2, "/review.json") == "jobs/user-1/job-1/cycle_2/review.json"
+    assert paths.intake("docs/./a.pdf") == "jobs/user-1/job-1/intake/docs/a.pdf"
+    assert paths == JobStoragePaths(user_id=" user-1/ ", job_id="job-1")
+
+
+def test_container_is_created_once_per_process(monkeypatch) -> None:
+    created: list[str] = []
+    _patch_blob_service(monkeypatch, SimpleNamespace(create_container=lambda: created.append("docs")))
+    BlobStore()
+    BlobStore()
+    assert created == ["docs"]
+
+
+def test_closing_one_client_keeps_the_shared_transport_open(monkeypatch) -> None:
+    blob = pytest.importorskip("azure.storage.blob")
+    monkeypatch.setattr("docwriter.storage._shared_transport", None)
+    transport = get_shared_transport()
+    transport.open()
+    session = transport.session
+
+    client = blob.BlobServiceClient.from_connection_string("UseDevelopmentStorage=true", transport=transport)
+    with client:
+        pass
+    client.close()
+
+    assert transport.session is session
+    assert get_shared_transport() is transport
+
+
+def test_container_creation_is_retried_after_a_failure(monkeypatch) -> None:
+    attempts: list[str] = []
+
+    def create_container():
+        attempts.append("create")
+        if len(attempts) == 1:
+            raise ConnectionError("throttled")
+
+    _patch_blob_service(monkeypatch, SimpleNamespace(create_container=create_container))
+    BlobStore()
+    BlobStore()
+    BlobStore()
+    assert attempts == ["create", "create"]
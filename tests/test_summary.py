@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from docwriter.summary import Summarizer
+
+
+class FakeLLM:
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.calls = 0
+
+    def chat(self, model, messages, response_format=None):
+        self.calls += 1
+        if response_format is not None:
+            return self.batch_reply
+        return f"- {messages[-1].content}"
+
+
+def test_summarize_sections_uses_one_call_for_the_batch():
+    llm = FakeLLM({"summaries": ["- a", "- b"]})
+    assert Summarizer(llm=llm).summarize_sections(["A", "B"]) == ["- a", "- b"]
+    assert llm.calls == 1
+
+
+def test_summarize_sections_falls_back_per_section_on_bad_reply():
+    llm = FakeLLM('{"summaries": ["- only one"]}')
+    assert Summarizer(llm=llm).summarize_sections(["A", "B"]) == ["- A", "- B"]
+    assert llm.calls == 3
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from docwriter import json_utils
+from docwriter.telemetry import _metrics_json
+
+
+def test_metrics_json_is_valid_ascii_json() -> None:
+    data = _metrics_json('job "1"', "RÉVIEW", 2, 1.25, "user-1")
+    data.decode("ascii")
+    assert json_utils.loads(data) == {
+        "job_id": 'job "1"',
+        "stage": "RÉVIEW",
+        "cycle": 2,
+        "duration_s": 1.25,
+        "user_id": "user-1",
+    }
+    assert json_utils.loads(_metrics_json("job-1", "PLAN", None, 0.5, None))["cycle"] is None
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import json
-
+from docwriter import json_utils
 from docwriter.agents.verifier import VerifierAgent
 
+# Always return no contradictions for simplicity
+_VERIFIER_JSON = json_utils.dumps({"contradictions": []})
+
 
 class FakeLLM:
-    def chat(self, model, messages, stream=False):
-        # Always return no contradictions for simplicity
-        return json.dumps({"contradictions": []})
+    def chat(self, model, messages, stream=False, response_format=None):
+        return _VERIFIER_JSON
 
 
 def test_verifier_json_shape():
     v = VerifierAgent(llm=FakeLLM())
     out = v.verify({"s1": "- Fact A"}, "# Doc\n")
-    data = json.loads(out)
+    data = json_utils.loads(out)
     assert "contradictions" in data and isinstance(data["contradictions"], list)
 
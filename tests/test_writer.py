@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from docwriter.agents.writer import WriterAgent
 
+_CHUNKS = (
+    "# Section Title\n",
+    "Some content with a diagram.\n",
+    "```plantuml\n' diagram_id: s1-flow\n@startuml\nA -> B : call\n@enduml\n```\n",
+)
+
+# WriterAgent only reads these, so one copy serves every test.
+_PLAN = {"global_style": {}, "glossary": {}, "diagram_specs": []}
+_SECTION = {"id": "s1", "title": "Intro"}
+
 
 class FakeLLM:
     def chat(self, model, messages, stream=False):
         if stream:
-            def gen():
-                yield "# Section Title\n"
-                yield "Some content with a diagram.\n"
-                yield "```plantuml\n' diagram_id: s1-flow\n@startuml\nA -> B : call\n@enduml\n```\n"
-            return gen()
+            return iter(_CHUNKS)
         return "# Section Title\nContent.\n"
 
 
 def test_writer_streaming_section():
     writer = WriterAgent(llm=FakeLLM())
-    plan = {"global_style": {}, "glossary": {}, "diagram_specs": []}
-    section = {"id": "s1", "title": "Intro"}
-    text = "".join(list(writer.write_section(plan, section)))
+    text = "".join(writer.write_section(_PLAN, _SECTION))
     assert "# Section Title" in text
+
+
+def test_writer_coalesces_stream_chunks():
+    class StreamingLLM:
+        def chat_stream(self, model, messages):
+            return iter(["ab", "cd", "e", "fgh", "i"])
+
+    writer = WriterAgent(llm=StreamingLLM(), flush_chars=4)
+    writer.settings = replace(writer.settings, streaming=True)
+    chunks = list(writer.write_section(_PLAN, _SECTION))
+    assert chunks[1:-1] == ["abcd", "efgh", "i"]
+    assert "".join(chunks[1:-1]) == "abcdefghi"